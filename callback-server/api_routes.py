@@ -1,5 +1,5 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Depends, Query, Header
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from typing import Optional, List, Dict, Any
 import logging
 import pprint as pp
@@ -18,8 +18,14 @@ from models import (
     BacktestJobRequest, BacktestJob, BacktestJobUpdate, BacktestJobStatus, BacktestJobPriority
 )
 from database import get_database, DatabaseManager
+from chart_codec import with_chart_data
+from downsample import downsample_chart, get_chart_downsampler
+from compute_pool import get_compute_pool
+from etags import item_etag, etag_matches, not_modified
+from job_streams import get_job_update_hub, stream_job_events
+from result_cache import RESULT_CACHE_ENABLED, job_fingerprint
 from backtest_generator import BacktestGenerator
-from backtest_worker import get_backtest_worker
+from backtest_worker import get_backtest_worker, get_backtest_worker_stats, overlay_local_progress
 
 logger = logging.getLogger(__name__)
 
@@ -38,15 +44,19 @@ async def get_feed(
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
     type: Optional[str] = Query(None, description="Filter by type (signal/backtest)"),
     timeframe: Optional[str] = Query(None, description="Filter by timeframe"),
-    user_id: Optional[str] = Query(None, description="Filter by user ID")
+    user_id: Optional[str] = Query(None, description="Filter by user ID"),
+    cursor: Optional[str] = Query(None, description="Continuation token from a previous response's next_cursor"),
+    points: Optional[int] = Query(None, ge=3, le=5000, description="Downsample chart series to at most this many points")
 ):
-    """Get paginated feed items with optional filters"""
+    """Get feed items newest first with optional filters.
+
+    Prefer `cursor` pagination; `page` is kept for older clients.
+    """
     try:
         db = get_database()
         if not db or not db.is_connected():
             raise HTTPException(status_code=503, detail="Database not available")
 
-
         # Build filters
         filters = {}
         if type:
@@ -56,18 +66,32 @@ async def get_feed(
         if user_id:
             filters["user_id"] = user_id
 
+        # Serve the rendered page from the cache shared by all workers when possible
+        cache_key = await db.feed_page_cache.key_for({"filters": filters, "cursor": cursor, "page": page, "limit": limit, "points": points})
+        cached_body = await db.feed_page_cache.get(cache_key)
+        if cached_body is not None:
+            return Response(content=cached_body, media_type="application/json")
+
         # Get feed items
-        result = await db.get_feed_items(page, limit, filters)
+        try:
+            result = await db.get_feed_items(page, limit, filters, cursor=cursor, projection="card")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
         # Transform items to response format
         feed_items = []
+        downsampler = get_chart_downsampler()
         logger.info(f"Fetched feed items count: {len(result['items'])}")
         logger.debug(f"First item structure: {pp.pformat(result['items'][0] if result['items'] else 'No items')}")
 
+        # Resolve every author on the page with batched lookups instead of one read per item
+        loaders = db.create_loaders()
+        authors = await loaders.users.load_many(item["user_id"] for item in result["items"])
+
         for i, item in enumerate(result["items"]):
             # Determine item type and get user data
             item_type = "signal" if "signal_id" in item else "backtest"
-            user_data = await db.get_user(item["user_id"])
+            user_data = authors[i]
 
             if not user_data:
                 continue  # Skip items with missing user data
@@ -112,7 +136,7 @@ async def get_feed(
 
             # Convert chart_data dict to ChartData
             try:
-                chart_data_obj = ChartData(**item["chart_data"])
+                chart_data_obj = ChartData(**downsampler.chart_for(item, points))
             except Exception as e:
                 logger.error(f"Invalid chart data for item {item.get('signal_id') or item.get('backtest_id')}: {e}")
                 logger.error(f"Chart data: {pp.pformat(item.get('chart_data', 'MISSING'))}")
@@ -197,35 +221,60 @@ async def get_feed(
             )
             feed_items.append(feed_item)
 
-        return FeedResponse(
+        feed_response = FeedResponse(
             items=feed_items,
             total_items=result["total_items"],
             current_page=result["current_page"],
             total_pages=result["total_pages"],
             has_next_page=result["has_next_page"],
-            page_size=result["page_size"]
+            page_size=result["page_size"],
+            next_cursor=result.get("next_cursor")
         )
+        body = feed_response.model_dump_json().encode()
+        await db.feed_page_cache.set(cache_key, body)
+        return Response(content=body, media_type="application/json")
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting feed: {str(e)}")
         logger.error(f"Stack trace: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"Failed to get feed items: {str(e)}")
 
 @api_router.get("/feed/{item_id}")
-async def get_feed_item(item_id: str):
-    """Get a specific feed item by ID"""
+async def get_feed_item(
+    item_id: str,
+    response: Response,
+    points: Optional[int] = Query(None, ge=3, le=5000, description="Downsample chart series to at most this many points"),
+    if_none_match: Optional[str] = Header(None)
+):
+    """Get a specific feed item by ID; answers 304 when If-None-Match has the current ETag"""
     try:
         db = get_database()
         if not db or not db.is_connected():
             raise HTTPException(status_code=503, detail="Database not available")
 
-        # Try to get as signal first
-        signal_data = await db.get_signal(item_id)
-        if signal_data:
-            user_data = await db.get_user(signal_data["user_id"])
-            if not user_data:
-                raise HTTPException(status_code=404, detail="User not found")
+        downsampler = get_chart_downsampler()
+
+        # Load the item once and dispatch on its type
+        loaders = db.create_loaders()
+        item = await loaders.items.load(item_id)
+        item_type = item.get("item_type") if item else None
+        if item_type not in ("signal", "backtest"):
+            raise HTTPException(status_code=404, detail="Item not found")
+
+        user_data = await loaders.users.load(item["user_id"])
+        if not user_data:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        # The author is part of the body; answer conditional requests before building any model
+        etag = item_etag(item, user_data.get("updated_at"), user_data.get("followers"), points)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        response.headers["ETag"] = etag
 
+        signal_data = item if item_type == "signal" else None
+        if signal_data:
             # Convert user data to User model
             try:
                 user_model = User(**user_data)
@@ -260,7 +309,7 @@ async def get_feed_item(item_id: str):
 
             # Convert chart_data dict to ChartData
             try:
-                chart_data_obj = ChartData(**signal_data["chart_data"])
+                chart_data_obj = ChartData(**await downsampler.full_chart_for(signal_data, points, db.resolve_chart_data))
             except Exception as e:
                 logger.error(f"Invalid chart data for signal {item_id}: {e}")
                 logger.error(f"Chart data: {pp.pformat(signal_data.get('chart_data', 'MISSING'))}")
@@ -269,7 +318,8 @@ async def get_feed_item(item_id: str):
 
             # Convert signal data to Signal model
             try:
-                signal_model_data = signal_data.copy()
+                signal_model_data = {key: value for key, value in signal_data.items() if key != "chart_packed"}
+                signal_model_data["chart_data"] = chart_data_obj
                 signal_model_data["timeframe"] = Timeframe(signal_data["timeframe"])
                 signal_model_data["status"] = Status(signal_data["status"])
                 signal_model_data["created_at"] = datetime.fromisoformat(signal_data["created_at"])
@@ -295,13 +345,8 @@ async def get_feed_item(item_id: str):
                 shares=signal_data.get("shares", 0)
             )
 
-        # Try to get as backtest
-        backtest_data = await db.get_backtest(item_id)
+        backtest_data = item if item_type == "backtest" else None
         if backtest_data:
-            user_data = await db.get_user(backtest_data["user_id"])
-            if not user_data:
-                raise HTTPException(status_code=404, detail="User not found")
-
             # Convert user data to User model
             try:
                 user_model = User(**user_data)
@@ -336,7 +381,7 @@ async def get_feed_item(item_id: str):
 
             # Convert chart_data dict to ChartData
             try:
-                chart_data_obj = ChartData(**backtest_data["chart_data"])
+                chart_data_obj = ChartData(**await downsampler.full_chart_for(backtest_data, points, db.resolve_chart_data))
             except Exception as e:
                 logger.error(f"Invalid chart data for backtest {item_id}: {e}")
                 logger.error(f"Chart data: {pp.pformat(backtest_data.get('chart_data', 'MISSING'))}")
@@ -345,7 +390,8 @@ async def get_feed_item(item_id: str):
 
             # Convert backtest data to Backtest model
             try:
-                backtest_model_data = backtest_data.copy()
+                backtest_model_data = {key: value for key, value in backtest_data.items() if key != "chart_packed"}
+                backtest_model_data["chart_data"] = chart_data_obj
                 backtest_model_data["timeframe"] = Timeframe(backtest_data["timeframe"])
                 backtest_model_data["status"] = Status(backtest_data["status"])
                 backtest_model_data["created_at"] = datetime.fromisoformat(backtest_data["created_at"])
@@ -371,8 +417,6 @@ async def get_feed_item(item_id: str):
                 shares=backtest_data.get("shares", 0)
             )
 
-        raise HTTPException(status_code=404, detail="Item not found")
-
     except HTTPException:
         raise
     except Exception as e:
@@ -444,8 +488,8 @@ async def create_signal(request: CreateSignalRequest, user_id: str):
         raise HTTPException(status_code=500, detail="Failed to create signal")
 
 @api_router.get("/signals/{signal_id}")
-async def get_signal(signal_id: str):
-    """Get a specific signal by ID"""
+async def get_signal(signal_id: str, response: Response, if_none_match: Optional[str] = Header(None)):
+    """Get a specific signal by ID; answers 304 when If-None-Match has the current ETag"""
     try:
         db = get_database()
         if not db or not db.is_connected():
@@ -455,7 +499,17 @@ async def get_signal(signal_id: str):
         if not signal_data:
             raise HTTPException(status_code=404, detail="Signal not found")
 
-        return signal_data
+        etag = item_etag(signal_data)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        response.headers["ETag"] = etag
+
+        if signal_data.get("chart_ref"):
+            chart_data = await db.resolve_chart_data(signal_data)
+            signal_data = {key: value for key, value in signal_data.items() if key != "chart_packed"}
+            signal_data["chart_data"] = chart_data
+            return signal_data
+        return with_chart_data(signal_data)
 
     except HTTPException:
         raise
@@ -511,6 +565,32 @@ async def update_signal(signal_id: str, request: UpdateSignalRequest):
         raise HTTPException(status_code=500, detail="Failed to update signal")
 
 # Backtest Routes
+async def link_cached_result(db: DatabaseManager, job_data: Dict[str, Any], force_recompute: bool = False) -> bool:
+    """
+    Fingerprint a new job's inputs and, unless recomputation is forced, make it
+    a completed job linked to the result of an identical earlier job
+    """
+    job_data["input_fingerprint"] = job_fingerprint(job_data)
+    if force_recompute or not RESULT_CACHE_ENABLED:
+        return False
+
+    cached = await db.get_cached_backtest_result(job_data["input_fingerprint"])
+    if cached is None:
+        return False
+
+    now = datetime.utcnow().isoformat()
+    job_data.update({
+        "status": BacktestJobStatus.COMPLETED.value,
+        "started_at": now,
+        "completed_at": now,
+        "actual_duration": 0,
+        "progress": 100.0,
+        "result_backtest_id": cached["result_backtest_id"],
+        "cached_result": True
+    })
+    logger.info(f"Backtest job {job_data['job_id']} reuses result {cached['result_backtest_id']} of job {cached.get('source_job_id')}")
+    return True
+
 @api_router.post("/backtest-jobs")
 async def create_backtest_job(request: BacktestJobRequest):
     """Create a new backtest job"""
@@ -537,6 +617,7 @@ async def create_backtest_job(request: BacktestJobRequest):
             "strategy_definition": request.strategy_definition.model_dump(),
             "estimated_duration": request.estimated_duration
         }
+        cached = await link_cached_result(db, job_data, request.force_recompute)
 
         # Store job in database
         success = await db.create_backtest_job(job_data)
@@ -544,6 +625,14 @@ async def create_backtest_job(request: BacktestJobRequest):
             raise HTTPException(status_code=500, detail="Failed to create backtest job")
 
         logger.info(f"Created backtest job: {job_id}")
+        if cached:
+            return {
+                "job_id": job_id,
+                "status": BacktestJobStatus.COMPLETED.value,
+                "result_backtest_id": job_data["result_backtest_id"],
+                "cached_result": True,
+                "message": "Identical backtest found, linked to its result"
+            }
         return {
             "job_id": job_id,
             "status": BacktestJobStatus.PENDING.value,
@@ -568,7 +657,8 @@ async def get_backtest_job(job_id: str):
         if not job_data:
             raise HTTPException(status_code=404, detail="Backtest job not found")
 
-        return job_data
+        # Progress reported by a job running in this process may not be written yet
+        return overlay_local_progress(job_data)
 
     except HTTPException:
         raise
@@ -577,14 +667,18 @@ async def get_backtest_job(job_id: str):
         raise HTTPException(status_code=500, detail="Failed to get backtest job")
 
 @api_router.get("/backtest-jobs/user/{user_id}")
-async def get_user_backtest_jobs(user_id: str, limit: int = Query(50, ge=1, le=100)):
+async def get_user_backtest_jobs(
+    user_id: str,
+    limit: int = Query(50, ge=1, le=100),
+    projection: str = Query("full", pattern="^(card|summary|full)$", description="Attribute set to read: card, summary or full")
+):
     """Get backtest jobs for a specific user"""
     try:
         db = get_database()
         if not db or not db.is_connected():
             raise HTTPException(status_code=503, detail="Database not available")
 
-        jobs = await db.get_user_backtest_jobs(user_id, limit=limit)
+        jobs = [overlay_local_progress(job) for job in await db.get_user_backtest_jobs(user_id, limit=limit, projection=projection)]
         return {
             "jobs": jobs,
             "total": len(jobs),
@@ -597,6 +691,82 @@ async def get_user_backtest_jobs(user_id: str, limit: int = Query(50, ge=1, le=1
         logger.error(f"Error getting backtest jobs for user {user_id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to get backtest jobs")
 
+# Seconds between keep-alive comments on an idle job status stream
+JOB_STREAM_KEEPALIVE_SECONDS = float(os.getenv("JOB_STREAM_KEEPALIVE_SECONDS", "15"))
+# Without a cross-process event bus (Redis), streams re-read their jobs this often
+JOB_STREAM_REFRESH_SECONDS = float(os.getenv("JOB_STREAM_REFRESH_SECONDS", "3"))
+
+def job_event_stream(body) -> StreamingResponse:
+    return StreamingResponse(body, media_type="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"  # Don't let nginx buffer the stream
+    })
+
+@api_router.get("/backtest-jobs/{job_id}/events")
+async def stream_backtest_job(job_id: str):
+    """Server-Sent Events: a job's current state, then its status and progress changes"""
+    try:
+        db = get_database()
+        if not db or not db.is_connected():
+            raise HTTPException(status_code=503, detail="Database not available")
+
+        # Watch before reading, so no update between the read and the first event is missed
+        watch = get_job_update_hub(db.job_events).watch(job_id=job_id)
+        job_data = overlay_local_progress(await db.get_backtest_job(job_id))
+        if not job_data:
+            watch.close()
+            raise HTTPException(status_code=404, detail="Backtest job not found")
+
+        refresh = None
+        if not db.job_events.cross_process:
+            # The job may be running in another process, whose events don't reach this one
+            async def refresh():
+                job = overlay_local_progress(await db.get_backtest_job(job_id))
+                return [job] if job else []
+
+        return job_event_stream(stream_job_events(
+            watch, job_data, JOB_STREAM_KEEPALIVE_SECONDS, job_id=job_id,
+            refresh=refresh, refresh_interval=JOB_STREAM_REFRESH_SECONDS
+        ))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error streaming backtest job {job_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to stream backtest job")
+
+@api_router.get("/backtest-jobs/user/{user_id}/events")
+async def stream_user_backtest_jobs(
+    user_id: str,
+    limit: int = Query(50, ge=1, le=100),
+    projection: str = Query("summary", pattern="^(card|summary|full)$", description="Attribute set of the snapshot: card, summary or full")
+):
+    """Server-Sent Events: a user's jobs, then status and progress changes of any of them"""
+    try:
+        db = get_database()
+        if not db or not db.is_connected():
+            raise HTTPException(status_code=503, detail="Database not available")
+
+        watch = get_job_update_hub(db.job_events).watch(user_id=user_id)
+        jobs = [overlay_local_progress(job) for job in await db.get_user_backtest_jobs(user_id, limit=limit, projection=projection)]
+        snapshot = {"jobs": jobs, "total": len(jobs), "user_id": user_id}
+
+        refresh = None
+        if not db.job_events.cross_process:
+            async def refresh():
+                return [overlay_local_progress(job) for job in await db.get_user_backtest_jobs(user_id, limit=limit, projection=projection)]
+
+        return job_event_stream(stream_job_events(
+            watch, snapshot, JOB_STREAM_KEEPALIVE_SECONDS,
+            refresh=refresh, refresh_interval=JOB_STREAM_REFRESH_SECONDS
+        ))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error streaming backtest jobs for user {user_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to stream backtest jobs")
+
 @api_router.delete("/backtest-jobs/{job_id}")
 async def cancel_backtest_job(job_id: str):
     """Cancel a backtest job"""
@@ -653,6 +823,7 @@ async def generate_backtest(request: BacktestGenerationRequest):
             "initial_capital": request.initial_capital,
             "strategy_definition": request.strategy_definition.model_dump()
         }
+        cached = await link_cached_result(db, job_data, request.force_recompute)
 
         # Store job in database
         success = await db.create_backtest_job(job_data)
@@ -660,6 +831,13 @@ async def generate_backtest(request: BacktestGenerationRequest):
             raise HTTPException(status_code=500, detail="Failed to create backtest job")
 
         logger.info(f"Created backtest job: {job_id}")
+        if cached:
+            return BacktestGenerationResponse(
+                backtest_id=job_id,
+                status=BacktestJobStatus.COMPLETED.value,
+                message=f"Identical backtest found, linked to its result {job_data['result_backtest_id']}",
+                estimated_completion_time=None
+            )
         return BacktestGenerationResponse(
             backtest_id=job_id,  # Return job_id instead of backtest_id
             status="pending",
@@ -736,8 +914,13 @@ async def create_backtest(request: CreateBacktestRequest, user_id: str):
         raise HTTPException(status_code=500, detail="Failed to create backtest")
 
 @api_router.get("/backtests/{backtest_id}")
-async def get_backtest(backtest_id: str):
-    """Get a specific backtest by ID"""
+async def get_backtest(
+    backtest_id: str,
+    response: Response,
+    points: Optional[int] = Query(None, ge=3, le=5000, description="Downsample chart series to at most this many points"),
+    if_none_match: Optional[str] = Header(None)
+):
+    """Get a specific backtest by ID; answers 304 when If-None-Match has the current ETag"""
     try:
         db = get_database()
         if not db or not db.is_connected():
@@ -747,7 +930,17 @@ async def get_backtest(backtest_id: str):
         if not backtest_data:
             raise HTTPException(status_code=404, detail="Backtest not found")
 
-        return backtest_data
+        etag = item_etag(backtest_data, points)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        response.headers["ETag"] = etag
+
+        if points is not None or backtest_data.get("chart_ref"):
+            chart_data = await get_chart_downsampler().full_chart_for(backtest_data, points, db.resolve_chart_data)
+            backtest_data = {key: value for key, value in backtest_data.items() if key != "chart_packed"}
+            backtest_data["chart_data"] = chart_data
+            return backtest_data
+        return with_chart_data(backtest_data)
 
     except HTTPException:
         raise
@@ -796,30 +989,38 @@ async def update_backtest(backtest_id: str, request: UpdateBacktestRequest):
 
 # User Routes
 @api_router.get("/users/{user_id}/signals")
-async def get_user_signals(user_id: str, limit: int = Query(50, ge=1, le=100)):
+async def get_user_signals(
+    user_id: str,
+    limit: int = Query(50, ge=1, le=100),
+    projection: str = Query("full", pattern="^(card|summary|full)$", description="Attribute set to read: card, summary or full")
+):
     """Get signals by user ID"""
     try:
         db = get_database()
         if not db or not db.is_connected():
             raise HTTPException(status_code=503, detail="Database not available")
 
-        signals = await db.get_signals_by_user(user_id, limit)
-        return {"signals": signals, "count": len(signals)}
+        signals = await db.get_signals_by_user(user_id, limit, projection=projection)
+        return {"signals": [with_chart_data(signal) for signal in signals], "count": len(signals)}
 
     except Exception as e:
         logger.error(f"Error getting signals for user {user_id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to get user signals")
 
 @api_router.get("/users/{user_id}/backtests")
-async def get_user_backtests(user_id: str, limit: int = Query(50, ge=1, le=100)):
+async def get_user_backtests(
+    user_id: str,
+    limit: int = Query(50, ge=1, le=100),
+    projection: str = Query("full", pattern="^(card|summary|full)$", description="Attribute set to read: card, summary or full")
+):
     """Get backtests by user ID"""
     try:
         db = get_database()
         if not db or not db.is_connected():
             raise HTTPException(status_code=503, detail="Database not available")
 
-        backtests = await db.get_backtests_by_user(user_id, limit)
-        return {"backtests": backtests, "count": len(backtests)}
+        backtests = await db.get_backtests_by_user(user_id, limit, projection=projection)
+        return {"backtests": [with_chart_data(backtest) for backtest in backtests], "count": len(backtests)}
 
     except Exception as e:
         logger.error(f"Error getting backtests for user {user_id}: {str(e)}")
@@ -885,3 +1086,90 @@ async def share_item(item_id: str, item_type: str = Query(..., description="Type
     except Exception as e:
         logger.error(f"Error sharing item {item_id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to share item")
+
+# Item Payload Routes
+@api_router.get("/items/{item_id}/chart")
+async def get_item_chart(
+    item_id: str,
+    points: Optional[int] = Query(None, ge=3, le=5000, description="Downsample chart series to at most this many points")
+):
+    """Full chart data of a signal or backtest (feed items only carry a preview)"""
+    try:
+        db = get_database()
+        if not db or not db.is_connected():
+            raise HTTPException(status_code=503, detail="Database not available")
+
+        chart_data = await db.get_chart_data(item_id)
+        if chart_data is None:
+            raise HTTPException(status_code=404, detail="Item not found")
+
+        if points is not None:
+            chart_data = downsample_chart(chart_data, points)
+        return {"item_id": item_id, "chart_data": ChartData(**chart_data)}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting chart for {item_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to get chart data")
+
+@api_router.get("/items/{item_id}/trades")
+async def get_item_trades(
+    item_id: str,
+    offset: int = Query(0, ge=0, description="Number of trades to skip"),
+    limit: int = Query(50, ge=1, le=500, description="Trades per page")
+):
+    """Paginated trade history of a backtest"""
+    try:
+        db = get_database()
+        if not db or not db.is_connected():
+            raise HTTPException(status_code=503, detail="Database not available")
+
+        trades = await db.get_trade_history(item_id)
+        if trades is None:
+            raise HTTPException(status_code=404, detail="Item not found")
+
+        return {
+            "item_id": item_id,
+            "trades": trades[offset:offset + limit],
+            "total": len(trades),
+            "offset": offset,
+            "limit": limit,
+            "has_more": offset + limit < len(trades)
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting trades for {item_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to get trade history")
+
+# Metrics Routes
+@api_router.get("/metrics")
+async def get_metrics():
+    """In-process cache counters, for sizing"""
+    try:
+        db = get_database()
+        if not db or not db.is_connected():
+            raise HTTPException(status_code=503, detail="Database not available")
+
+        return {
+            "timestamp": datetime.utcnow().isoformat(),
+            "user_cache": db.user_cache.stats(),
+            "feed_page_cache": db.feed_page_cache.stats(),
+            "blob_store": db.blob_store.stats(),
+            "chart_downsample_cache": get_chart_downsampler().stats(),
+            "counter_buffer": db.counter_buffer.stats() if db.counter_buffer is not None else None,
+            "hot_items": db.hot_items.stats() if db.hot_items is not None else None,
+            "counter_shard_cache": db.counter_reader.stats(),
+            "job_events": db.job_events.stats(),
+            "compute_pool": get_compute_pool().stats(),
+            "backtest_worker": get_backtest_worker_stats(),
+            "job_streams": get_job_update_hub(db.job_events).stats()
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting metrics: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to get metrics")
@@ -252,6 +252,13 @@ class BacktestGenerator:
 
     async def generate_backtest(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a complete backtest based on request parameters"""
+        return self.build_backtest(request)
+
+    def build_backtest(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        CPU-bound part of generate_backtest. Synchronous and free of I/O so it can
+        run in a worker process (see compute_pool.py).
+        """
         try:
             # Extract parameters
             strategy_name = request.get("strategy_name", "Generic Strategy")
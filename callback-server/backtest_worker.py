@@ -4,13 +4,24 @@ import uuid
 import traceback
 import random
 import os
+import signal
+import socket
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 import time
 
-from database import get_database, DatabaseManager
-from backtest_generator import BacktestGenerator
+import uvicorn
+from dotenv import load_dotenv
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from database import get_database, initialize_database, DatabaseManager
+from compute_pool import compute_backtest, get_compute_pool, shutdown_compute_pool
 from models import BacktestJobStatus, BacktestJobPriority
+from job_events import JOBS_AVAILABLE, JOBS_CANCELLED
+from job_scheduler import create_job_scheduler
+from progress_reporter import ProgressReporter
+from result_cache import BACKTEST_DATA_VERSION, RESULT_CACHE_ENABLED, job_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -24,13 +35,45 @@ class SlowdownConfig:
 class BacktestWorker:
     """Worker for processing backtest jobs asynchronously"""
 
-    def __init__(self, db_manager: Optional[DatabaseManager] = None, slowdown_config: Optional[SlowdownConfig] = None):
+    def __init__(self, db_manager: Optional[DatabaseManager] = None, slowdown_config: Optional[SlowdownConfig] = None,
+                 max_concurrent_jobs: Optional[int] = None):
         self.db_manager = db_manager or get_database()
-        self.backtest_generator = BacktestGenerator()
+        # Backtests are computed in worker processes; this loop only orchestrates
+        self.compute_pool = get_compute_pool()
         self.running = False
-        self.poll_interval = 5  # seconds
-        self.max_concurrent_jobs = 3
+        # Workers wake on job notifications; the sweep catches jobs whose
+        # notification was lost or published in another process without Redis
+        self.sweep_interval = float(os.getenv("JOB_SWEEP_INTERVAL_SECONDS", "30"))
+        self._wake = asyncio.Event()
+        # Jobs are claimed under a lease that a heartbeat renews every third of
+        # it; leases of dead workers are reclaimed by whichever worker sweeps next
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.lease_seconds = float(os.getenv("JOB_LEASE_SECONDS", "60"))
+        self.max_attempts = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+        self._last_reap = 0.0
+        # Pending jobs are dispatched by priority, then fair share per user,
+        # from a snapshot of the queue read in full every JOB_QUEUE_REFRESH_SECONDS
+        # and topped up with newly created jobs in between
+        self.scheduler = create_job_scheduler()
+        self.queue_refresh_interval = float(os.getenv("JOB_QUEUE_REFRESH_SECONDS", "10"))
+        self._last_queue_refresh = 0.0
+        self.max_concurrent_jobs = max_concurrent_jobs or int(os.getenv("BACKTEST_WORKER_CONCURRENCY", "3"))
         self.active_jobs = set()
+        self._job_tasks: Dict[str, asyncio.Task] = {}
+        # Set when a running job is cancelled (here, or in another process via
+        # JOBS_CANCELLED); the job's status in the table is the durable record
+        self._cancel_tokens: Dict[str, asyncio.Event] = {}
+        # Owner of each running job, for the status updates streamed to them
+        self._job_users: Dict[str, str] = {}
+        # Progress is coalesced in memory and written at most once per interval;
+        # state transitions are written immediately
+        self.progress = ProgressReporter(self._write_job_updates, float(os.getenv("JOB_PROGRESS_FLUSH_SECONDS", "2")))
+        self.draining = False
+        self.started_at: Optional[datetime] = None
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+        self.jobs_released = 0
+        self.jobs_fenced = 0
         self.slowdown_config = slowdown_config or SlowdownConfig()
 
         # Log slowdown configuration
@@ -47,24 +90,80 @@ class BacktestWorker:
             return
 
         self.running = True
-        logger.info("Starting backtest worker...")
+        self.started_at = datetime.utcnow()
+        logger.info(f"Starting backtest worker {self.worker_id} ({self.max_concurrent_jobs} concurrent jobs)...")
+
+        subscription = self.db_manager.job_events.subscribe(JOBS_AVAILABLE, JOBS_CANCELLED) if self.db_manager else None
+        listener = asyncio.create_task(self._listen(subscription)) if subscription else None
 
         try:
             while self.running:
+                self._wake.clear()
+                if time.monotonic() - self._last_reap >= self.sweep_interval:
+                    self._last_reap = time.monotonic()
+                    await self._reclaim_expired_jobs()
                 await self._process_jobs()
-                await asyncio.sleep(self.poll_interval)
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.sweep_interval)
+                except asyncio.TimeoutError:
+                    pass
         except Exception as e:
             logger.error(f"Error in backtest worker: {str(e)}")
             logger.error(f"Stack trace: {traceback.format_exc()}")
             self.running = False
         finally:
+            if listener is not None:
+                listener.cancel()
+                subscription.close()
             logger.info("Backtest worker stopped")
 
+    async def _listen(self, subscription):
+        """Wake the dispatch loop whenever jobs are announced; stop jobs that were cancelled"""
+        async for event in subscription:
+            if event.get("channel") == JOBS_CANCELLED:
+                for job_id in event.get("job_ids", []):
+                    self._stop_job(job_id, "it was cancelled")
+                continue
+            logger.debug(f"Woken by {event.get('channel')}: {event.get('job_ids')}")
+            self._wake.set()
+
+    def _stop_job(self, job_id: str, reason: str):
+        """Trip the job's cancellation token and interrupt it at its current await"""
+        token = self._cancel_tokens.get(job_id)
+        if token is None or token.is_set():
+            return
+        logger.info(f"Stopping backtest job {job_id}: {reason}")
+        token.set()
+        task = self._job_tasks.get(job_id)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
     async def stop(self):
         """Stop the backtest worker"""
         self.running = False
+        self._wake.set()
         logger.info("Stopping backtest worker...")
 
+    async def drain(self, timeout: float):
+        """
+        Stop taking jobs and give running ones up to timeout seconds to finish.
+        Jobs still running after that are stopped and handed back to the queue
+        for another worker instead of waiting out their lease.
+        """
+        self.draining = True
+        await self.stop()
+
+        tasks = list(self._job_tasks.values())
+        if tasks:
+            logger.info(f"Draining {len(tasks)} backtest jobs (up to {timeout}s)...")
+            _, unfinished = await asyncio.wait(tasks, timeout=timeout)
+            for task in unfinished:
+                task.cancel()
+            if unfinished:
+                logger.warning(f"Handing {len(unfinished)} unfinished backtest jobs back to the queue")
+                await asyncio.gather(*unfinished, return_exceptions=True)
+        await self.progress.close()
+
     async def _process_jobs(self):
         """Process pending backtest jobs"""
         if not self.db_manager or not self.db_manager.is_connected():
@@ -78,47 +177,89 @@ class BacktestWorker:
             if available_slots <= 0:
                 return
 
-            pending_jobs = await self.db_manager.get_pending_backtest_jobs(limit=available_slots)
-            logger.info(f"Pending backtest jobs: {pending_jobs}")
+            await self._refresh_queue()
+            # drain() may have started while the queue was read; its snapshot
+            # of running jobs would miss anything dispatched now
+            if not self.running:
+                return
+            selected_jobs = self.scheduler.select(available_slots, exclude=self.active_jobs)
+            logger.info(f"Dispatching {len(selected_jobs)} of {len(selected_jobs) + len(self.scheduler.pending)} pending backtest jobs")
 
-            for job_data in pending_jobs:
+            for job_data in selected_jobs:
                 job_id = job_data['job_id']
 
-                # Skip if already processing
-                if job_id in self.active_jobs:
-                    continue
-
-                # Start processing job
-                asyncio.create_task(self._process_job(job_data))
+                # Start processing job; reserved now so a wake-up before the task runs can't start it twice
+                self.active_jobs.add(job_id)
+                self._job_tasks[job_id] = asyncio.create_task(self._process_job(job_data))
 
         except Exception as e:
             logger.error(f"Error processing jobs: {str(e)}")
             logger.error(f"Stack trace: {traceback.format_exc()}")
 
+    async def _refresh_queue(self):
+        """
+        Update the scheduler's snapshot of the pending queue. Only called with
+        free slots, so a busy worker doesn't reread the queue.
+        """
+        if time.monotonic() - self._last_queue_refresh >= self.queue_refresh_interval:
+            self._last_queue_refresh = time.monotonic()
+            jobs = await self.db_manager.get_pending_backtest_jobs(limit=self.scheduler.max_pending, projection="queue")
+            self.scheduler.replace(jobs)
+        else:
+            jobs = await self.db_manager.get_pending_backtest_jobs(
+                limit=self.scheduler.max_pending, projection="queue", created_since=self.scheduler.newest
+            )
+            # Jobs dispatched here may still read as pending until their claim lands
+            self.scheduler.add(jobs, exclude=self.active_jobs)
+
+    async def _reclaim_expired_jobs(self):
+        """Put jobs whose worker stopped renewing its lease back in the queue"""
+        try:
+            result = await self.db_manager.reclaim_expired_backtest_jobs(self.max_attempts)
+            if result["reclaimed"] or result["failed"]:
+                logger.warning(f"Expired job leases: {result}")
+        except Exception as e:
+            logger.error(f"Error reclaiming expired jobs: {str(e)}")
+
+    async def _heartbeat(self, job_id: str):
+        """
+        Renew the job's lease until cancelled; stop the job if the lease is lost.
+        Also how cancellations reach this worker when they aren't broadcast to it.
+        """
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            renewed = await self.db_manager.renew_backtest_job_lease(job_id, self.worker_id, self.lease_seconds)
+            if renewed is False:
+                logger.warning(f"Lost the lease on job {job_id}")
+                self._stop_job(job_id, "its lease was lost (cancelled or reclaimed)")
+                return
+
     async def _process_job(self, job_data: Dict[str, Any]):
         """Process a single backtest job"""
         job_id = job_data['job_id']
         self.active_jobs.add(job_id)
+        heartbeat = None
 
         try:
             logger.info(f"Starting to process backtest job: {job_id}")
 
-            # Check if job was cancelled before we started
-            if await self._is_job_cancelled(job_id):
-                logger.info(f"Job {job_id} was cancelled before processing started")
+            # Claim the job; fails if another worker got it first or it was cancelled
+            claimed = await self.db_manager.claim_backtest_job(job_id, self.worker_id, self.lease_seconds)
+            if claimed is None:
+                logger.info(f"Job {job_id} was claimed elsewhere or cancelled before processing started")
                 return
-
-            # Update job status to running
-            await self._update_job_status(job_id, BacktestJobStatus.RUNNING, {
-                'started_at': datetime.utcnow().isoformat(),
-                'progress': 10.0
-            })
+            job_data = claimed
+            self.scheduler.record_dispatch(claimed)
+            self._cancel_tokens[job_id] = asyncio.Event()
+            self._job_users[job_id] = claimed['user_id']
+            self.progress.track(job_id, status=claimed['status'], progress=float(claimed.get('progress', 0)))
+            heartbeat = asyncio.create_task(self._heartbeat(job_id))
 
             # Apply artificial slowdown at initialization
             await self.apply_job_processing_slowdown(job_id, "initialization")
 
             # Check for cancellation after slowdown
-            if await self._is_job_cancelled(job_id):
+            if self._is_job_cancelled(job_id):
                 logger.info(f"Job {job_id} was cancelled during initialization")
                 return
 
@@ -138,37 +279,33 @@ class BacktestWorker:
             }
 
             # Update progress
-            await self._update_job_status(job_id, BacktestJobStatus.RUNNING, {
-                'progress': 30.0
-            })
+            self.progress.report(job_id, progress=30.0)
 
             # Apply artificial slowdown during processing
             await self.apply_job_processing_slowdown(job_id, "data_processing")
 
             # Check for cancellation after slowdown
-            if await self._is_job_cancelled(job_id):
+            if self._is_job_cancelled(job_id):
                 logger.info(f"Job {job_id} was cancelled during data processing")
                 return
 
             # Generate backtest
             logger.info(f"Generating backtest for job: {job_id}")
-            backtest_result = await self.backtest_generator.generate_backtest(backtest_request)
+            backtest_result = await self.compute_pool.run(compute_backtest, backtest_request)
 
             # Check for cancellation after generation
-            if await self._is_job_cancelled(job_id):
+            if self._is_job_cancelled(job_id):
                 logger.info(f"Job {job_id} was cancelled after backtest generation")
                 return
 
             # Update progress
-            await self._update_job_status(job_id, BacktestJobStatus.RUNNING, {
-                'progress': 70.0
-            })
+            self.progress.report(job_id, progress=70.0)
 
             # Apply artificial slowdown during storage
             await self.apply_job_processing_slowdown(job_id, "storage")
 
             # Check for cancellation after slowdown
-            if await self._is_job_cancelled(job_id):
+            if self._is_job_cancelled(job_id):
                 logger.info(f"Job {job_id} was cancelled during storage phase")
                 return
 
@@ -179,9 +316,7 @@ class BacktestWorker:
                     raise Exception("Failed to store backtest result in database")
 
             # Update progress
-            await self._update_job_status(job_id, BacktestJobStatus.RUNNING, {
-                'progress': 90.0
-            })
+            self.progress.report(job_id, progress=90.0)
 
             # Add to feed table
             await self._add_to_feed(backtest_result, job_data['user_id'])
@@ -190,7 +325,7 @@ class BacktestWorker:
             await self.apply_job_processing_slowdown(job_id, "finalization")
 
             # Final cancellation check before marking complete
-            if await self._is_job_cancelled(job_id):
+            if self._is_job_cancelled(job_id):
                 logger.info(f"Job {job_id} was cancelled during finalization")
                 return
 
@@ -198,14 +333,26 @@ class BacktestWorker:
             completed_at = datetime.utcnow()
             actual_duration = int((completed_at - datetime.fromisoformat(job_data['created_at'])).total_seconds())
 
-            await self._update_job_status(job_id, BacktestJobStatus.COMPLETED, {
+            completed = await self._update_job_status(job_id, BacktestJobStatus.COMPLETED, {
                 'completed_at': completed_at.isoformat(),
                 'actual_duration': actual_duration,
                 'progress': 100.0,
                 'result_backtest_id': backtest_result['id']
             })
 
-            logger.info(f"Successfully completed backtest job: {job_id}")
+            # Later identical requests link to this result instead of running again
+            if completed and RESULT_CACHE_ENABLED:
+                await self.db_manager.put_cached_backtest_result(
+                    job_fingerprint(job_data), BACKTEST_DATA_VERSION, backtest_result['id'], job_id
+                )
+
+            if completed:
+                self.jobs_completed += 1
+                logger.info(f"Successfully completed backtest job: {job_id}")
+            else:
+                # The lease was lost, or the job was cancelled or reclaimed, before it finished
+                self.jobs_fenced += 1
+                logger.warning(f"Backtest job {job_id} finished but its completion was not recorded (lease lost, cancelled or reclaimed)")
 
         except Exception as e:
             logger.error(f"Error processing backtest job {job_id}: {str(e)}")
@@ -213,31 +360,58 @@ class BacktestWorker:
             logger.error(f"Stack trace: {traceback.format_exc()}")
 
             # Mark job as failed (unless it was cancelled)
-            if not await self._is_job_cancelled(job_id):
+            self.jobs_failed += 1
+            if not self._is_job_cancelled(job_id):
                 await self._update_job_status(job_id, BacktestJobStatus.FAILED, {
                     'error_message': str(e),
                     'completed_at': datetime.utcnow().isoformat()
                 })
 
+        except asyncio.CancelledError:
+            logger.info(f"Stopped backtest job {job_id}")
+            self.progress.forget(job_id)
+            if self.draining and heartbeat is not None and not self._is_job_cancelled(job_id):
+                heartbeat.cancel()
+                if await self.db_manager.release_backtest_job(job_id, self.worker_id):
+                    self.jobs_released += 1
+
         finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
             self.active_jobs.discard(job_id)
-
-    async def _update_job_status(self, job_id: str, status: BacktestJobStatus, updates: Dict[str, Any]):
-        """Update job status and other fields"""
+            self._job_tasks.pop(job_id, None)
+            self._cancel_tokens.pop(job_id, None)
+            self._job_users.pop(job_id, None)
+            self.progress.forget(job_id)
+            # A slot is free; pick up jobs that were waiting for one
+            self._wake.set()
+
+    async def _write_job_updates(self, job_id: str, updates: Dict[str, Any]) -> bool:
+        # Fenced by the lease: a worker whose job was reclaimed or cancelled can't overwrite it
+        success = await self.db_manager.update_backtest_job(job_id, updates, worker_id=self.worker_id)
+        if success:
+            await self.db_manager.publish_job_update(job_id, self._job_users.get(job_id), updates)
+        return success
+
+    async def _update_job_status(self, job_id: str, status: BacktestJobStatus, updates: Dict[str, Any]) -> bool:
+        """Write a status transition (with any progress not yet written) immediately"""
         try:
             updates['status'] = status.value
-            success = await self.db_manager.update_backtest_job(job_id, updates)
+            success = await self.progress.transition(job_id, updates)
             if not success:
                 logger.error(f"Failed to update job status for {job_id}")
+            return success
         except Exception as e:
             logger.error(f"Error updating job status for {job_id}: {str(e)}")
             logger.error(f"Stack trace: {traceback.format_exc()}")
+            return False
 
     async def _add_to_feed(self, backtest_data: Dict[str, Any], user_id: str):
         """Add completed backtest to the feed table"""
         try:
-            # Get user data
-            user_data = await self.db_manager.get_user(user_id)
+            # Get user data through the batched loader
+            loaders = self.db_manager.create_loaders()
+            user_data = await loaders.users.load(user_id)
             if not user_data:
                 logger.warning(f"User {user_id} not found, skipping feed addition")
                 return
@@ -277,13 +451,37 @@ class BacktestWorker:
         except Exception as e:
             logger.error(f"Error adding backtest to feed: {str(e)}")
 
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "running": self.running,
+            "draining": self.draining,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "max_concurrent_jobs": self.max_concurrent_jobs,
+            "active_jobs": len(self.active_jobs),
+            "jobs_completed": self.jobs_completed,
+            "jobs_failed": self.jobs_failed,
+            "jobs_released": self.jobs_released,
+            "jobs_fenced": self.jobs_fenced,
+            "scheduler": self.scheduler.stats(),
+            "progress": self.progress.stats()
+        }
+
+    def overlay_progress(self, job_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Job as read from the table, with progress reported here but not yet written"""
+        if job_data and job_data.get('status') == BacktestJobStatus.RUNNING.value:
+            latest = self.progress.latest(job_data['job_id'])
+            if latest is not None:
+                job_data.update(latest)
+        return job_data
+
     async def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get the status of a specific job"""
         if not self.db_manager or not self.db_manager.is_connected():
             return None
 
         try:
-            return await self.db_manager.get_backtest_job(job_id)
+            return self.overlay_progress(await self.db_manager.get_backtest_job(job_id))
         except Exception as e:
             logger.error(f"Error getting job status for {job_id}: {str(e)}")
             return None
@@ -294,25 +492,10 @@ class BacktestWorker:
             return False
 
         try:
-            job_data = await self.db_manager.get_backtest_job(job_id)
-            if not job_data:
-                return False
-
-            status = job_data['status']
-            if status not in ['pending', 'running']:
-                logger.warning(f"Cannot cancel job {job_id} with status {status}")
-                return False
-
-            # Update job status to cancelled
-            success = await self.db_manager.update_backtest_job(job_id, {
-                'status': BacktestJobStatus.CANCELLED.value,
-                'completed_at': datetime.utcnow().isoformat()
-            })
-
+            success = await self.db_manager.cancel_backtest_job(job_id)
             if success:
-                logger.info(f"Cancelled backtest job: {job_id}")
-                self.active_jobs.discard(job_id)
-
+                # Broadcast too, but don't wait for the relay if the job runs here
+                self._stop_job(job_id, "it was cancelled")
             return success
 
         except Exception as e:
@@ -326,16 +509,10 @@ class BacktestWorker:
             logger.warning(f"🐌 [{job_id}] Applying artificial slowdown at {step}: {delay_seconds}s")
             await asyncio.sleep(delay_seconds)
 
-    async def _is_job_cancelled(self, job_id: str) -> bool:
-        """Check if a job has been cancelled"""
-        try:
-            job_data = await self.db_manager.get_backtest_job(job_id)
-            if job_data is None:
-                return False
-            return job_data.get('status') == 'cancelled'
-        except Exception as e:
-            logger.error(f"Error checking cancellation status for job {job_id}: {str(e)}")
-            return False
+    def _is_job_cancelled(self, job_id: str) -> bool:
+        """Whether the job was stopped since it was claimed; no database read"""
+        token = self._cancel_tokens.get(job_id)
+        return token is not None and token.is_set()
 
 # Global worker instance
 backtest_worker = None
@@ -347,14 +524,136 @@ def get_backtest_worker(slowdown_config: Optional[SlowdownConfig] = None) -> Bac
         backtest_worker = BacktestWorker(slowdown_config=slowdown_config)
     return backtest_worker
 
+def overlay_local_progress(job_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Latest progress of a job if the global worker in this process is running it"""
+    return backtest_worker.overlay_progress(job_data) if backtest_worker else job_data
+
+def get_backtest_worker_stats() -> Optional[Dict[str, Any]]:
+    """Stats of the global backtest worker, if this process runs one"""
+    return backtest_worker.stats() if backtest_worker else None
+
 async def start_backtest_worker(slowdown_config: Optional[SlowdownConfig] = None):
     """Start the global backtest worker"""
     worker = get_backtest_worker(slowdown_config)
     await worker.start()
 
-async def stop_backtest_worker():
-    """Stop the global backtest worker"""
+async def stop_backtest_worker(drain_timeout: float = 0):
+    """Stop the global backtest worker, letting its running jobs finish for up to drain_timeout seconds"""
     global backtest_worker
     if backtest_worker:
-        await backtest_worker.stop()
+        await backtest_worker.drain(drain_timeout)
         backtest_worker = None
+
+# Standalone worker service: python -m backtest_worker
+#
+# Runs BacktestWorker without the web tier so compute capacity scales on its
+# own. Any number of these can run on any number of nodes: jobs are claimed
+# under leases, so a job runs on one worker at a time. SIGTERM stops taking
+# jobs and drains the running ones; /health and /metrics are served on
+# WORKER_HEALTH_PORT.
+
+class _HealthServer(uvicorn.Server):
+    """uvicorn server that leaves SIGTERM/SIGINT to the worker service"""
+
+    def install_signal_handlers(self):
+        pass
+
+def create_health_app(worker: BacktestWorker) -> FastAPI:
+    """Health and metrics endpoints of a standalone worker"""
+    app = FastAPI(title="AlgoTraders Backtest Worker", version="1.0.0")
+
+    @app.get("/health")
+    async def health_check():
+        """200 while taking jobs; 503 once draining or without a database"""
+        db_connected = worker.db_manager is not None and worker.db_manager.is_connected()
+        healthy = worker.running and db_connected
+        return JSONResponse(status_code=200 if healthy else 503, content={
+            "status": "healthy" if healthy else ("draining" if worker.draining else "unhealthy"),
+            "timestamp": datetime.utcnow().isoformat(),
+            "worker_id": worker.worker_id,
+            "database": "connected" if db_connected else "disconnected",
+            "active_jobs": len(worker.active_jobs)
+        })
+
+    @app.get("/metrics")
+    async def get_metrics():
+        return {
+            "timestamp": datetime.utcnow().isoformat(),
+            "worker": worker.stats(),
+            "compute_pool": worker.compute_pool.stats(),
+            "job_events": worker.db_manager.job_events.stats() if worker.db_manager else None
+        }
+
+    return app
+
+def _initialize_database() -> DatabaseManager:
+    """Connect to the same tables as the web tier (see callback_server.Config)"""
+    use_localstack = os.getenv("USE_LOCALSTACK", "true").lower() == "true"
+    return initialize_database(
+        os.getenv("USER_TABLE_NAME", "Algo-Trader-User-Token-Table"),
+        os.getenv("FEED_TABLE_NAME", "Algo-Trader-Feed-Table"),
+        os.getenv("BACKTEST_JOBS_TABLE_NAME", "Algo-Trader-Backtest-Jobs-Table"),
+        os.getenv("AWS_REGION", "us-east-1"),
+        use_localstack=use_localstack,
+        localstack_endpoint=os.getenv("LOCALSTACK_ENDPOINT", "http://localhost:4566") if use_localstack else None,
+        counters_table_name=os.getenv("COUNTERS_TABLE_NAME", "Algo-Trader-Feed-Counters-Table")
+    )
+
+async def run_worker_service():
+    """Run a standalone backtest worker until SIGTERM/SIGINT, then drain it"""
+    db_manager = _initialize_database()
+    if db_manager and db_manager.is_connected():
+        logger.info("Database connection established successfully")
+    else:
+        logger.warning("Database connection failed - jobs will not be processed until it recovers")
+
+    worker = BacktestWorker(db_manager=db_manager, slowdown_config=SlowdownConfig(
+        enabled=os.getenv("ENABLE_JOB_PROCESSING_SLOWDOWN", "false").lower() == "true",
+        min_seconds=int(os.getenv("JOB_PROCESSING_SLOWDOWN_MIN_SECONDS", "5")),
+        max_seconds=int(os.getenv("JOB_PROCESSING_SLOWDOWN_MAX_SECONDS", "5"))
+    ))
+    drain_timeout = float(os.getenv("WORKER_DRAIN_TIMEOUT_SECONDS", "30"))
+
+    shutdown = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, shutdown.set)
+
+    health_server = None
+    health_port = int(os.getenv("WORKER_HEALTH_PORT", "3001"))
+    if health_port > 0:
+        health_server = _HealthServer(uvicorn.Config(
+            create_health_app(worker), host=os.getenv("HOST", "0.0.0.0"), port=health_port, log_level="warning"
+        ))
+        health_task = asyncio.create_task(health_server.serve())
+        logger.info(f"Worker health and metrics on port {health_port}")
+
+    worker_task = asyncio.create_task(worker.start())
+    shutdown_task = asyncio.create_task(shutdown.wait())
+    await asyncio.wait([worker_task, shutdown_task], return_when=asyncio.FIRST_COMPLETED)
+    shutdown_task.cancel()
+
+    logger.info(f"Shutting down backtest worker {worker.worker_id}, draining for up to {drain_timeout}s...")
+    await worker.drain(drain_timeout)
+    await worker_task
+    shutdown_compute_pool()
+
+    if health_server is not None:
+        health_server.should_exit = True
+        await health_task
+
+    if db_manager:
+        if db_manager.counter_buffer is not None:
+            await db_manager.counter_buffer.close()
+        await db_manager.feed_page_cache.close()
+        await db_manager.job_events.close()
+        db_manager.close()
+    logger.info("Backtest worker service stopped")
+
+if __name__ == "__main__":
+    load_dotenv(verbose=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    asyncio.run(run_worker_service())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the DynamoDB item codec
+Compares the old read/write paths (boto3 TypeDeserializer/TypeSerializer plus
+the recursive Decimal <-> float passes) against codec.py on realistic feed
+items with 50-180 point charts.
+
+Usage:
+    python bench_codec.py --items 200 --repeat 5
+"""
+
+import argparse
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from codec import deserialize_item, serialize_item
+from database import prepare_item_for_dynamodb, prepare_item_from_dynamodb
+
+def make_feed_item(i: int) -> dict:
+    """A backtest feed item shaped like the ones populate_db.py writes"""
+    points = random.randint(50, 180)
+    start = datetime(2024, 1, 1)
+    value = random.uniform(1000, 50000)
+    data = []
+    for _ in range(points):
+        value *= 1 + random.gauss(0.001, 0.02)
+        data.append(round(value, 2))
+
+    return {
+        "item_id": f"backtest_{i}",
+        "item_type": "backtest",
+        "feed_shard": f"feed#{i % 4}",
+        "backtest_id": f"backtest_{i}",
+        "user_id": f"user_{i % 10}",
+        "name": f"Momentum Strategy {i}",
+        "description": "Trend following with volatility filter",
+        "timeframe": "4h",
+        "assets": ["BTC/USD", "ETH/USD"],
+        "period": "6 months",
+        "initial_capital": 10000.0,
+        "final_capital": round(10000 * random.uniform(0.7, 1.8), 2),
+        "status": "active",
+        "performance": {
+            "win_rate": random.uniform(0.3, 0.7),
+            "profit_factor": random.uniform(0.8, 2.5),
+            "total_trades": random.randint(20, 400),
+            "avg_return": random.uniform(-1, 3),
+            "max_drawdown": random.uniform(-30, -2),
+            "sharpe_ratio": random.uniform(-0.5, 2.5)
+        },
+        "chart_data": {
+            "labels": [(start + timedelta(days=d)).strftime("%Y-%m-%d") for d in range(points)],
+            "datasets": [{"label": "Portfolio Value", "data": data}]
+        },
+        "strategy_config": {"type": "momentum", "lookback": 20, "threshold": 0.02},
+        "created_at": datetime.utcnow().isoformat(),
+        "updated_at": datetime.utcnow().isoformat(),
+        "likes": random.randint(0, 500),
+        "comments": random.randint(0, 100),
+        "shares": random.randint(0, 50)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="DynamoDB item codec benchmark")
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(7)
+    items = [make_feed_item(i) for i in range(args.items)]
+    serializer = TypeSerializer()
+    deserializer = TypeDeserializer()
+    wire_items = [serialize_item(item) for item in items]
+
+    # Sanity check: both paths agree
+    for item, wire_item in zip(items, wire_items):
+        assert wire_item == {key: serializer.serialize(value) for key, value in prepare_item_for_dynamodb(item).items()}
+        assert deserialize_item(wire_item) == prepare_item_from_dynamodb(
+            {key: deserializer.deserialize(value) for key, value in wire_item.items()})
+
+    def old_read():
+        for wire_item in wire_items:
+            prepare_item_from_dynamodb({key: deserializer.deserialize(value) for key, value in wire_item.items()})
+
+    def new_read():
+        for wire_item in wire_items:
+            deserialize_item(wire_item)
+
+    def old_write():
+        for item in items:
+            {key: serializer.serialize(value) for key, value in prepare_item_for_dynamodb(item).items()}
+
+    def new_write():
+        for item in items:
+            serialize_item(item)
+
+    print(f"🏁 {args.items} feed items, best of {args.repeat} runs")
+    for label, old, new in (("read", old_read, new_read), ("write", old_write, new_write)):
+        old_us = min(timeit.repeat(old, number=1, repeat=args.repeat)) / args.items * 1e6
+        new_us = min(timeit.repeat(new, number=1, repeat=args.repeat)) / args.items * 1e6
+        print(f"{label:<6} boto3 + Decimal pass {old_us:8.1f}us/item   codec {new_us:8.1f}us/item   "
+              f"saved {old_us - new_us:8.1f}us/item ({old_us / new_us:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark API latency while backtest jobs are being computed
+Sends a steady stream of small API requests to an in-process FastAPI app
+while a batch of backtests is generated, once inline on the event loop (the
+old BacktestWorker behaviour) and once through the ComputePool processes.
+
+Usage:
+    python bench_compute_pool.py --jobs 300 --workers 4
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from datetime import datetime
+from typing import List, Optional
+
+import httpx
+from fastapi import FastAPI
+
+from compute_pool import ComputePool, compute_backtest
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Return the pct-th percentile of samples"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+def backtest_request(i: int) -> dict:
+    return {
+        "strategy_name": f"Bench Strategy {i}",
+        "strategy_description": "Benchmark backtest",
+        "timeframe": "1h",
+        "assets": ["BTC/USD"],
+        "period": "6 months",
+        "initial_capital": 10000,
+        "strategy_config": {"type": ["momentum", "trend_following", "mean_reversion", "breakout"][i % 4]},
+        "user_id": "bench_user"
+    }
+
+async def probe(client: httpx.AsyncClient, interval: float, stop: asyncio.Event) -> List[float]:
+    """
+    Request /api/ping on a fixed schedule until stopped; latencies in ms.
+    Measured from when each request was due, so requests that couldn't even
+    be sent while the loop was blocked count the time they waited.
+    """
+    async def request(due: float) -> float:
+        response = await client.get("/api/ping")
+        response.raise_for_status()
+        return (time.perf_counter() - due) * 1000
+
+    requests = []
+    due = time.perf_counter()
+    while True:
+        # Catch up on every request that fell due while the loop was busy
+        while due <= time.perf_counter():
+            requests.append(asyncio.create_task(request(due)))
+            due += interval
+        if stop.is_set():
+            break
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+    return list(await asyncio.gather(*requests))
+
+async def run_scenario(pool: Optional[ComputePool], args) -> tuple:
+    """API latencies while args.jobs backtests run (none when pool is None), and the batch duration"""
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        stop = asyncio.Event()
+        probe_task = asyncio.create_task(probe(client, args.interval_ms / 1000, stop))
+
+        started = time.perf_counter()
+        if pool is None:
+            await asyncio.sleep(args.idle_seconds)
+        else:
+            await asyncio.gather(*[pool.run(compute_backtest, backtest_request(i)) for i in range(args.jobs)])
+        elapsed = time.perf_counter() - started
+
+        stop.set()
+        return await probe_task, elapsed
+
+def report(label: str, samples: List[float], elapsed: float):
+    """Print latency summary"""
+    print(f"{label:<24} requests={len(samples):5d}  p50={percentile(samples, 50):8.2f}ms  "
+          f"p99={percentile(samples, 99):8.2f}ms  max={max(samples):8.2f}ms  "
+          f"mean={statistics.mean(samples):8.2f}ms  batch={elapsed:6.2f}s")
+
+async def main():
+    parser = argparse.ArgumentParser(description="API latency while computing backtests")
+    parser.add_argument("--jobs", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=4, help="Compute pool processes")
+    parser.add_argument("--interval-ms", type=float, default=5.0, help="Time between API requests")
+    parser.add_argument("--idle-seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    # Per-job INFO logging would dominate the measurement
+    logging.basicConfig(level=logging.WARNING)
+
+    print(f"🏁 {args.jobs} backtests, API request every {args.interval_ms}ms ({datetime.utcnow().isoformat()})")
+
+    samples, elapsed = await run_scenario(None, args)
+    report("idle", samples, elapsed)
+
+    samples, elapsed = await run_scenario(ComputePool(0), args)
+    report("inline (before)", samples, elapsed)
+
+    pool = ComputePool(args.workers)
+    # Start the worker processes outside the measurement
+    await asyncio.gather(*[pool.run(compute_backtest, backtest_request(i)) for i in range(args.workers)])
+    try:
+        samples, elapsed = await run_scenario(pool, args)
+        report(f"process pool x{args.workers} (after)", samples, elapsed)
+    finally:
+        pool.shutdown()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark feed request latency under concurrency
+Replays the original /api/feed access pattern (a feed table scan, then one
+get_item per author) with the boto3 calls made inline on the event loop, as
+DatabaseManager did before, and on its per-table executors. Uses moto with an
+injected per-request round-trip delay so it can run without LocalStack or AWS.
+
+moto serves requests in-process, so its CPU time shares the GIL with the
+executor threads and sets a floor under the executor run; against a real
+endpoint the gap is wider. A run with the defaults gave:
+
+    inline (before)          p50=  35012.4ms  p99=  70503.2ms
+    executor x32 (after)     p50=  14255.0ms  p99=  14433.4ms
+
+Usage:
+    python bench_feed_latency.py --concurrency 200 --latency-ms 25
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import time
+from datetime import datetime
+from typing import List
+
+from moto import mock_dynamodb
+
+from database import DatabaseManager
+
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Return the pct-th percentile of samples"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def add_latency(db: DatabaseManager, latency_ms: float):
+    """Simulate a network round trip on every DynamoDB request"""
+    def sleep_before_send(**kwargs):
+        time.sleep(latency_ms / 1000)
+
+    clients = [table.meta.client for table in (db.user_table, db.feed_table, db.backtest_jobs_table)]
+    # Wire-format calls go through the plain per-table clients
+    clients += list(db._table_clients.values()) + [db.client]
+    # Tables share one client when they have no executor; register the delay once per client
+    for client in {id(client): client for client in clients}.values():
+        client.meta.events.register("before-send.dynamodb", sleep_before_send)
+
+async def seed(db: DatabaseManager, users: int, items: int, chart_points: int):
+    """Create a handful of users and feed items"""
+    for i in range(users):
+        await db.create_user({"id": f"bench_user_{i}", "email": f"user{i}@example.com", "name": f"User {i}"})
+
+    for i in range(items):
+        await db.create_signal({
+            "id": f"bench_signal_{i}",
+            "user_id": f"bench_user_{i % users}",
+            "name": f"Signal {i}",
+            "description": "Benchmark signal",
+            "timeframe": "1h",
+            "assets": ["BTC/USD"],
+            "entry": "100",
+            "target": "110",
+            "stop_loss": "95",
+            "confidence": 70,
+            "performance": {"win_rate": 0.6, "profit_factor": 1.5, "total_trades": 10,
+                            "avg_return": 1.0, "max_drawdown": -5.0, "sharpe_ratio": 1.1},
+            "chart_data": {"labels": [str(p) for p in range(chart_points)],
+                           "datasets": [{"label": "Performance", "data": [float(p) for p in range(chart_points)]}]}
+        })
+
+async def call_inline(db: DatabaseManager, table, operation: str, **kwargs):
+    """The pre-executor access path: the boto3 Table call runs on the event loop"""
+    return getattr(table, operation)(**kwargs)
+
+async def call_executor(db: DatabaseManager, table, operation: str, **kwargs):
+    """The same call on the table's executor"""
+    return await db._execute(table, operation, **kwargs)
+
+async def feed_request(db: DatabaseManager, call, limit: int, submitted: float) -> float:
+    """
+    Mimic the original /api/feed: scan the feed table, sort it newest first and
+    read the author of every item on the first page, one call at a time
+    """
+    items = []
+    scan_params = {}
+    while True:
+        response = await call(db, db.feed_table, "scan", **scan_params)
+        items.extend(response.get("Items", []))
+        if not response.get("LastEvaluatedKey"):
+            break
+        scan_params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+    items.sort(key=lambda item: item.get("created_at", ""), reverse=True)
+
+    for item in items[:limit]:
+        await call(db, db.user_table, "get_item", Key={"user_id": item["user_id"]})
+    # Measured from submission so time spent queued behind a blocked loop counts
+    return (time.perf_counter() - submitted) * 1000
+
+async def run_scenario(executor_workers: int, call, args) -> List[float]:
+    """Run one batch of concurrent feed requests"""
+    db = DatabaseManager(
+        "bench_users", "bench_feed", "bench_jobs",
+        region="us-east-1", use_localstack=False, executor_workers=executor_workers
+    )
+    db._ensure_tables_exist()
+    await seed(db, args.users, args.items, args.chart_points)
+    add_latency(db, args.latency_ms)
+
+    try:
+        submitted = time.perf_counter()
+        return await asyncio.gather(*[feed_request(db, call, args.limit, submitted) for _ in range(args.concurrency)])
+    finally:
+        db.close()
+
+def report(label: str, samples: List[float]):
+    """Print latency summary"""
+    print(f"{label:<24} p50={percentile(samples, 50):9.1f}ms  "
+          f"p99={percentile(samples, 99):9.1f}ms  "
+          f"mean={statistics.mean(samples):9.1f}ms")
+
+async def main():
+    parser = argparse.ArgumentParser(description="Feed latency benchmark")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=25.0)
+    parser.add_argument("--users", type=int, default=5)
+    parser.add_argument("--items", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--chart-points", type=int, default=10, help="Chart points per seeded item (moto's CPU cost grows with item size)")
+    parser.add_argument("--workers", type=int, default=32, help="Executor threads per table")
+    args = parser.parse_args()
+
+    # Per-call INFO logging would dominate the measurement
+    logging.basicConfig(level=logging.WARNING)
+
+    print(f"🏁 {args.concurrency} concurrent feed requests, {args.latency_ms}ms simulated round trip "
+          f"({datetime.utcnow().isoformat()})")
+
+    with mock_dynamodb():
+        before = await run_scenario(0, call_inline, args)
+    report("inline (before)", before)
+
+    with mock_dynamodb():
+        after = await run_scenario(args.workers, call_executor, args)
+    report(f"executor x{args.workers} (after)", after)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,181 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zlib
+from typing import Any, Callable, Dict, Optional
+
+from cache import MISSING, TTLCache
+
+logger = logging.getLogger(__name__)
+
+REF_PREFIX = "sha256:"
+
+def blob_ref(data: bytes) -> str:
+    """Content address of a blob"""
+    return REF_PREFIX + hashlib.sha256(data).hexdigest()
+
+def _digest(ref: str) -> str:
+    if not ref.startswith(REF_PREFIX) or len(ref) != len(REF_PREFIX) + 64:
+        raise ValueError(f"Invalid blob reference: {ref}")
+    digest = ref[len(REF_PREFIX):]
+    int(digest, 16)
+    return digest
+
+class LocalBlobBackend:
+    """Blobs stored as files under a directory, fanned out by the first digest byte"""
+
+    name = "local"
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def put(self, digest: str, data: bytes):
+        path = self._path(digest)
+        # Same address, same content: nothing to do
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def get(self, digest: str) -> Optional[bytes]:
+        try:
+            with open(self._path(digest), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+class S3BlobBackend:
+    """Blobs stored as objects in an S3 (or S3-compatible) bucket"""
+
+    name = "s3"
+
+    def __init__(self, client, bucket: str, prefix: str = ""):
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def put(self, digest: str, data: bytes):
+        self.client.put_object(Bucket=self.bucket, Key=f"{self.prefix}{digest}", Body=data)
+
+    def get(self, digest: str) -> Optional[bytes]:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=f"{self.prefix}{digest}")
+        except self.client.exceptions.NoSuchKey:
+            return None
+        return response["Body"].read()
+
+class BlobStore:
+    """
+    Content-addressed store for large per-item payloads (full charts, trade
+    history) that feed items only reference.
+
+    Blobs are immutable, so decoded values are kept in a small in-process LRU.
+    Backend calls run in worker threads to keep the event loop free.
+    """
+
+    def __init__(self, backend=None, cache_size: int = 256):
+        self.backend = backend
+        self.cache = TTLCache(max_size=cache_size, ttl=3600.0, negative_ttl=0)
+        self.puts = 0
+        self.gets = 0
+        self.errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    async def put(self, data: bytes) -> str:
+        """Store bytes and return their reference"""
+        ref = blob_ref(data)
+        await asyncio.to_thread(self.backend.put, _digest(ref), data)
+        self.puts += 1
+        return ref
+
+    async def get(self, ref: str) -> Optional[bytes]:
+        """Bytes for a reference, or None if the blob is missing or unreadable"""
+        if not self.enabled:
+            return None
+        try:
+            data = await asyncio.to_thread(self.backend.get, _digest(ref))
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Failed to read blob {ref}: {str(e)}")
+            return None
+        self.gets += 1
+        return data
+
+    async def put_json(self, value: Any) -> str:
+        """Store a JSON-serializable value, compressed"""
+        data = zlib.compress(json.dumps(value, separators=(",", ":"), default=str).encode("utf-8"))
+        return await self.put(data)
+
+    async def get_decoded(self, ref: str, decode: Callable[[bytes], Any]) -> Any:
+        """Decoded blob, served from the LRU when possible; None if missing"""
+        value = self.cache.get(ref)
+        if value is not MISSING:
+            return value
+        data = await self.get(ref)
+        if data is None:
+            return None
+        value = decode(data)
+        self.cache.set(ref, value)
+        return value
+
+    async def get_json(self, ref: str) -> Any:
+        return await self.get_decoded(ref, lambda data: json.loads(zlib.decompress(data)))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend.name if self.enabled else "none",
+            "puts": self.puts,
+            "gets": self.gets,
+            "errors": self.errors,
+            "cache": self.cache.stats()
+        }
+
+def create_blob_store(use_localstack: bool, client_kwargs: Dict[str, Any]) -> BlobStore:
+    """
+    Build the blob store from the environment.
+
+    BLOB_STORE_BACKEND is one of auto (S3 when BLOB_STORE_BUCKET is set, the
+    local filesystem under LocalStack, disabled otherwise), s3, local or none.
+    client_kwargs are the boto3 arguments used for the DynamoDB connection.
+    """
+    backend_name = os.getenv("BLOB_STORE_BACKEND", "auto").lower()
+    bucket = os.getenv("BLOB_STORE_BUCKET")
+    cache_size = int(os.getenv("BLOB_CACHE_SIZE", "256"))
+
+    if backend_name == "auto":
+        backend_name = "s3" if bucket else ("local" if use_localstack else "none")
+    if backend_name == "none":
+        return BlobStore(cache_size=cache_size)
+
+    try:
+        if backend_name == "s3":
+            if not bucket:
+                raise RuntimeError("BLOB_STORE_BACKEND=s3 requires BLOB_STORE_BUCKET")
+            import boto3
+            backend = S3BlobBackend(boto3.client("s3", **client_kwargs), bucket, os.getenv("BLOB_STORE_PREFIX", "blobs/"))
+        else:
+            backend = LocalBlobBackend(os.getenv("BLOB_STORE_DIR", os.path.join(tempfile.gettempdir(), "algotraders-blobs")))
+    except Exception as e:
+        logger.error(f"Blob store disabled: {str(e)}")
+        return BlobStore(cache_size=cache_size)
+
+    logger.info(f"Blob store using {backend.name} backend")
+    return BlobStore(backend, cache_size=cache_size)
@@ -26,6 +26,8 @@ from models import CallbackRequest, UserResponse, ErrorResponse
 from database import initialize_database, get_database
 from api_routes import api_router
 from backtest_worker import start_backtest_worker, stop_backtest_worker, SlowdownConfig
+from compute_pool import shutdown_compute_pool
+from job_streams import close_job_update_hub
 
 # Load environment variables
 load_dotenv(verbose=True)
@@ -62,6 +64,7 @@ class Config:
     USER_TABLE_NAME = os.getenv("USER_TABLE_NAME", "Algo-Trader-User-Token-Table")
     FEED_TABLE_NAME = os.getenv("FEED_TABLE_NAME", "Algo-Trader-Feed-Table")
     BACKTEST_JOBS_TABLE_NAME = os.getenv("BACKTEST_JOBS_TABLE_NAME", "Algo-Trader-Backtest-Jobs-Table")
+    COUNTERS_TABLE_NAME = os.getenv("COUNTERS_TABLE_NAME", "Algo-Trader-Feed-Counters-Table")
 
     # LocalStack Configuration
     USE_LOCALSTACK = os.getenv("USE_LOCALSTACK", "true").lower() == "true"
@@ -76,6 +79,12 @@ class Config:
     JOB_PROCESSING_SLOWDOWN_MIN_SECONDS = int(os.getenv("JOB_PROCESSING_SLOWDOWN_MIN_SECONDS", "5"))
     JOB_PROCESSING_SLOWDOWN_MAX_SECONDS = int(os.getenv("JOB_PROCESSING_SLOWDOWN_MAX_SECONDS", "5"))
 
+    # Backtest jobs are processed in this process unless standalone workers
+    # (python -m backtest_worker) take them
+    EMBEDDED_BACKTEST_WORKER = os.getenv("EMBEDDED_BACKTEST_WORKER", "true").lower() == "true"
+    # Within gunicorn's graceful_timeout (30s)
+    WORKER_DRAIN_TIMEOUT_SECONDS = float(os.getenv("WORKER_DRAIN_TIMEOUT_SECONDS", "20"))
+
 config = Config()
 
 # Rate limiting storage (in production, use Redis)
@@ -180,7 +189,8 @@ async def lifespan(app: FastAPI):
             config.BACKTEST_JOBS_TABLE_NAME,
             config.AWS_REGION,
             use_localstack=True,
-            localstack_endpoint=config.LOCALSTACK_ENDPOINT
+            localstack_endpoint=config.LOCALSTACK_ENDPOINT,
+            counters_table_name=config.COUNTERS_TABLE_NAME
         )
     else:
         logger.info("Using AWS DynamoDB for production")
@@ -189,7 +199,8 @@ async def lifespan(app: FastAPI):
             config.FEED_TABLE_NAME,
             config.BACKTEST_JOBS_TABLE_NAME,
             config.AWS_REGION,
-            use_localstack=False
+            use_localstack=False,
+            counters_table_name=config.COUNTERS_TABLE_NAME
         )
 
     if db_manager and db_manager.is_connected():
@@ -202,22 +213,37 @@ async def lifespan(app: FastAPI):
         logger.warning("GOOGLE_CLIENT_ID not set - OAuth verification may not work properly")
 
     # Start backtest worker with slowdown configuration
-    slowdown_config = SlowdownConfig(
-        enabled=config.ENABLE_JOB_PROCESSING_SLOWDOWN,
-        min_seconds=config.JOB_PROCESSING_SLOWDOWN_MIN_SECONDS,
-        max_seconds=config.JOB_PROCESSING_SLOWDOWN_MAX_SECONDS
-    )
-    asyncio.create_task(start_backtest_worker(slowdown_config))
-    logger.info("Backtest worker started")
+    if config.EMBEDDED_BACKTEST_WORKER:
+        slowdown_config = SlowdownConfig(
+            enabled=config.ENABLE_JOB_PROCESSING_SLOWDOWN,
+            min_seconds=config.JOB_PROCESSING_SLOWDOWN_MIN_SECONDS,
+            max_seconds=config.JOB_PROCESSING_SLOWDOWN_MAX_SECONDS
+        )
+        asyncio.create_task(start_backtest_worker(slowdown_config))
+        logger.info("Backtest worker started")
+    else:
+        logger.info("Embedded backtest worker disabled - jobs are processed by standalone workers")
 
     yield
 
     # Shutdown
     logger.info("Shutting down callback server...")
 
-    # Stop backtest worker
-    await stop_backtest_worker()
-    logger.info("Backtest worker stopped")
+    # Stop backtest worker; jobs still running after the drain go back to the queue
+    if config.EMBEDDED_BACKTEST_WORKER:
+        await stop_backtest_worker(config.WORKER_DRAIN_TIMEOUT_SECONDS)
+        shutdown_compute_pool()
+        logger.info("Backtest worker stopped")
+
+    # Flush buffered counters, then release database executor threads and cache connections
+    db = get_database()
+    if db:
+        if db.counter_buffer is not None:
+            await db.counter_buffer.close()
+        await db.feed_page_cache.close()
+        await close_job_update_hub()
+        await db.job_events.close()
+        db.close()
 
 # Create FastAPI app
 app = FastAPI(
@@ -0,0 +1,224 @@
+"""
+Compact binary storage for chart_data.
+
+A packed chart is a single DynamoDB Binary attribute (chart_packed) instead of a
+map of Number lists and date strings:
+
+    b"CD" | version (1 byte) | flags (1 byte) | payload (zlib compressed if flag 1)
+    payload = header length (4 bytes, big endian) | JSON header | series bytes
+
+Regular labels (one every N seconds/days in a known format) are stored as a
+start value plus a step. Each series is delta encoded so that slowly moving
+prices compress well:
+    "i" - values with up to 6 decimals, as scaled int64 deltas (exact)
+    "d" - float64, XOR of consecutive bit patterns (exact)
+    "f" - float32, XOR of consecutive bit patterns (lossy, opt in)
+Charts that can't be packed (non-numeric points, odd shapes) stay inline.
+"""
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+MAGIC = b"CD"
+VERSION = 1
+FLAG_ZLIB = 1
+
+# Label formats recognised as a regular time axis
+LABEL_FORMATS = ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M")
+
+# Largest decimal scale tried for exact integer encoding
+MAX_DECIMALS = 6
+
+def _to_little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def _from_little_endian(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+def _pack_labels(labels: List[Any]) -> Dict[str, Any]:
+    """Describe labels as start + step when they form a regular time axis"""
+    if len(labels) >= 2 and all(isinstance(label, str) for label in labels):
+        for fmt in LABEL_FORMATS:
+            try:
+                start = datetime.strptime(labels[0], fmt)
+                step = datetime.strptime(labels[1], fmt) - start
+            except ValueError:
+                continue
+            if step.total_seconds() <= 0:
+                break
+            if all((start + step * i).strftime(fmt) == label for i, label in enumerate(labels)):
+                return {"start": labels[0], "step_seconds": step.total_seconds(), "count": len(labels), "format": fmt}
+            break
+    return {"values": labels}
+
+def _unpack_labels(spec: Dict[str, Any]) -> List[Any]:
+    if "values" in spec:
+        return spec["values"]
+    start = datetime.strptime(spec["start"], spec["format"])
+    step = timedelta(seconds=spec["step_seconds"])
+    return [(start + step * i).strftime(spec["format"]) for i in range(spec["count"])]
+
+def _decimal_scale(values: List[float]) -> Optional[int]:
+    """Smallest number of decimals that represents every value exactly"""
+    for decimals in range(MAX_DECIMALS + 1):
+        factor = 10 ** decimals
+        try:
+            if all(abs(value) * factor < 2 ** 53 and round(value * factor) / factor == value for value in values):
+                return decimals
+        except (OverflowError, ValueError):
+            return None
+    return None
+
+def _pack_series(values: List[float], precision: str) -> Tuple[Dict[str, Any], bytes]:
+    if precision == "float32":
+        bits = array("I", struct.pack(f"<{len(values)}f", *values))
+        if sys.byteorder == "big":
+            bits.byteswap()
+        deltas = array("I", [bits[0]] + [bits[i] ^ bits[i - 1] for i in range(1, len(bits))])
+        return {"encoding": "f", "count": len(values)}, _to_little_endian(deltas)
+
+    decimals = _decimal_scale(values)
+    if decimals is not None:
+        factor = 10 ** decimals
+        scaled = [round(value * factor) for value in values]
+        deltas = array("q", [scaled[0]] + [scaled[i] - scaled[i - 1] for i in range(1, len(scaled))])
+        return {"encoding": "i", "decimals": decimals, "count": len(values)}, _to_little_endian(deltas)
+
+    bits = array("Q", struct.pack(f"<{len(values)}d", *values))
+    if sys.byteorder == "big":
+        bits.byteswap()
+    deltas = array("Q", [bits[0]] + [bits[i] ^ bits[i - 1] for i in range(1, len(bits))])
+    return {"encoding": "d", "count": len(values)}, _to_little_endian(deltas)
+
+def _unpack_series(spec: Dict[str, Any], data: bytes) -> List[float]:
+    count = spec["count"]
+    if count == 0:
+        return []
+
+    if spec["encoding"] == "i":
+        deltas = _from_little_endian("q", data)
+        factor = 10 ** spec["decimals"]
+        values = []
+        total = 0
+        for delta in deltas:
+            total += delta
+            values.append(total / factor)
+        return values
+
+    typecode, fmt = ("I", "f") if spec["encoding"] == "f" else ("Q", "d")
+    deltas = _from_little_endian(typecode, data)
+    bits = array(typecode, [0] * count)
+    previous = 0
+    for i, delta in enumerate(deltas):
+        previous ^= delta
+        bits[i] = previous
+    return list(struct.unpack(f"<{count}{fmt}", _to_little_endian(bits)))
+
+def pack_chart(chart_data: Dict[str, Any], precision: str = "exact", compress: bool = True) -> Optional[bytes]:
+    """
+    Pack a Chart.js style chart into bytes, or return None if it can't be packed.
+    precision is "exact" (default) or "float32".
+    """
+    try:
+        labels = chart_data["labels"]
+        datasets = chart_data["datasets"]
+        chunks = []
+        dataset_specs = []
+        for dataset in datasets:
+            values = dataset["data"]
+            if not all(type(value) in (int, float) for value in values):
+                return None
+            if values:
+                spec, data = _pack_series([float(value) for value in values], precision)
+            else:
+                spec, data = {"encoding": "d", "count": 0}, b""
+            # Keep styling keys and their order; "data" marks where the series goes
+            spec["dataset"] = {key: (None if key == "data" else value) for key, value in dataset.items()}
+            spec["size"] = len(data)
+            dataset_specs.append(spec)
+            chunks.append(data)
+    except (KeyError, TypeError, AttributeError, struct.error):
+        return None
+
+    header = {
+        "chart": {key: None for key in chart_data},
+        "labels": _pack_labels(labels),
+        "datasets": dataset_specs
+    }
+    header_bytes = json.dumps(header, separators=(",", ":"), default=str).encode("utf-8")
+    payload = struct.pack(">I", len(header_bytes)) + header_bytes + b"".join(chunks)
+
+    flags = 0
+    if compress:
+        compressed = zlib.compress(payload, 6)
+        if len(compressed) < len(payload):
+            payload = compressed
+            flags |= FLAG_ZLIB
+    return MAGIC + bytes([VERSION, flags]) + payload
+
+def unpack_chart(blob: Any) -> Dict[str, Any]:
+    """Rebuild chart_data from pack_chart output (bytes or a boto3 Binary)"""
+    blob = bytes(getattr(blob, "value", blob))
+    if blob[:2] != MAGIC or blob[2] != VERSION:
+        raise ValueError("Not a packed chart")
+    payload = zlib.decompress(blob[4:]) if blob[3] & FLAG_ZLIB else blob[4:]
+
+    header_length = struct.unpack(">I", payload[:4])[0]
+    header = json.loads(payload[4:4 + header_length])
+    offset = 4 + header_length
+
+    datasets = []
+    for spec in header["datasets"]:
+        data = _unpack_series(spec, payload[offset:offset + spec["size"]])
+        offset += spec["size"]
+        datasets.append({key: (data if key == "data" else value) for key, value in spec["dataset"].items()})
+
+    chart = {}
+    for key in header["chart"]:
+        if key == "labels":
+            chart[key] = _unpack_labels(header["labels"])
+        elif key == "datasets":
+            chart[key] = datasets
+    return chart
+
+def chart_data_of(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """chart_data of a feed item, decoding the packed form only when asked for"""
+    if item.get("chart_packed") is not None:
+        return unpack_chart(item["chart_packed"])
+    return item.get("chart_data")
+
+def with_chart_data(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a feed item with packed charts expanded, for JSON responses"""
+    if item.get("chart_packed") is None:
+        return item
+    expanded = {key: value for key, value in item.items() if key != "chart_packed"}
+    expanded["chart_data"] = unpack_chart(item["chart_packed"])
+    return expanded
+
+def chart_point_count(chart_data: Dict[str, Any]) -> int:
+    """Number of points on the chart's x axis"""
+    return len(chart_data.get("labels") or [])
+
+def encode_chart_blob(chart_data: Dict[str, Any]) -> bytes:
+    """Blob store payload for a full chart: packed when possible, compressed JSON otherwise"""
+    packed = pack_chart(chart_data)
+    if packed is not None:
+        return packed
+    return zlib.compress(json.dumps(chart_data, separators=(",", ":"), default=str).encode("utf-8"))
+
+def decode_chart_blob(data: bytes) -> Dict[str, Any]:
+    if data[:2] == MAGIC:
+        return unpack_chart(data)
+    return json.loads(zlib.decompress(data))
@@ -0,0 +1,92 @@
+"""
+Single-pass codec between DynamoDB's wire format and plain Python values.
+
+boto3's resource layer turns every number into a Decimal with TypeDeserializer,
+and the API then walks the whole item again to turn those Decimals into floats.
+Writes pay the same price in reverse (floats -> Decimals -> wire format).
+These functions go straight from one side to the other in a single walk, and
+string-only lists and maps (chart labels, asset lists) are copied with a
+comprehension instead of recursing into every element.
+"""
+
+from decimal import Decimal
+from math import isfinite
+from typing import Any, Callable, Dict
+
+def _encode_number(value) -> str:
+    if isinstance(value, float):
+        if not isfinite(value):
+            raise TypeError(f"Infinity and NaN are not supported by DynamoDB: {value}")
+        # repr is the shortest string that round-trips, same as str(Decimal(str(value)))
+        # except for exponents, which Decimal spells 1E-7 rather than 1e-07
+        text = repr(value)
+        return str(Decimal(text)) if "e" in text else text
+    return str(value)
+
+def to_wire(value: Any) -> Dict[str, Any]:
+    """Encode one Python value as a DynamoDB AttributeValue"""
+    value_type = type(value)
+    if value_type is str:
+        return {"S": value}
+    if value_type is bool:
+        return {"BOOL": value}
+    if value_type is int or value_type is float or value_type is Decimal:
+        return {"N": _encode_number(value)}
+    if value is None:
+        return {"NULL": True}
+    if isinstance(value, dict):
+        return {"M": {key: to_wire(element) for key, element in value.items()}}
+    if isinstance(value, (list, tuple)):
+        if all(type(element) is str for element in value):
+            return {"L": [{"S": element} for element in value]}
+        return {"L": [to_wire(element) for element in value]}
+    if isinstance(value, (bytes, bytearray)):
+        return {"B": bytes(value)}
+    if isinstance(value, (set, frozenset)):
+        if all(isinstance(element, str) for element in value):
+            return {"SS": list(value)}
+        if all(isinstance(element, (bytes, bytearray)) for element in value):
+            return {"BS": [bytes(element) for element in value]}
+        return {"NS": [_encode_number(element) for element in value]}
+    # Enums and other str/int subclasses; str() of a (str, Enum) member is "Class.NAME"
+    if isinstance(value, str):
+        return {"S": str.__str__(value)}
+    if isinstance(value, (int, float)):
+        return {"N": _encode_number(value)}
+    raise TypeError(f"Unsupported type for DynamoDB: {value_type.__name__}")
+
+def from_wire(attribute: Dict[str, Any], number: Callable[[str], Any] = float) -> Any:
+    """Decode one DynamoDB AttributeValue; numbers are built with `number`"""
+    for tag, value in attribute.items():
+        if tag == "S":
+            return value
+        if tag == "N":
+            return number(value)
+        if tag == "M":
+            return {key: from_wire(element, number) for key, element in value.items()}
+        if tag == "L":
+            return [element["S"] if "S" in element else from_wire(element, number) for element in value]
+        if tag == "BOOL":
+            return value
+        if tag == "NULL":
+            return None
+        if tag == "B":
+            return value
+        if tag == "SS":
+            return set(value)
+        if tag == "NS":
+            return {number(element) for element in value}
+        if tag == "BS":
+            return set(value)
+        raise TypeError(f"Unknown DynamoDB type: {tag}")
+
+def serialize_item(item: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Encode an item (or key, or ExpressionAttributeValues) in wire format"""
+    return {key: to_wire(value) for key, value in item.items()}
+
+def deserialize_item(item: Dict[str, Dict[str, Any]], number: Callable[[str], Any] = float) -> Dict[str, Any]:
+    """
+    Decode a wire-format item. Numbers become floats by default, matching
+    prepare_item_from_dynamodb; pass number=Decimal to match boto3 instead.
+    """
+    return {key: from_wire(value, number) for key, value in item.items()}
@@ -0,0 +1,170 @@
+"""
+Process pool for CPU-bound backtest computation.
+
+Backtest generation is pure Python; run on the event loop it stalls every API
+request in the process until it finishes. ComputePool runs it in worker
+processes instead, with at most `workers` jobs in flight and a per-job
+timeout.
+
+A ProcessPoolExecutor breaks as a whole when any of its processes dies, so
+killing a hung job would fail every job sharing the pool. Each job therefore
+runs in a single-process executor of its own, reused by later jobs while it
+stays healthy. A job that times out or kills its process (segfault, OOM) only
+takes that process down; it is replaced on the next submission.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class ComputeTimeout(Exception):
+    """The job ran longer than its timeout and was killed"""
+
+class ComputeCrashed(Exception):
+    """The worker process running the job died"""
+
+# One generator per worker process, built on first use
+_generator = None
+
+def compute_backtest(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate a backtest; runs inside a pool process"""
+    global _generator
+    if _generator is None:
+        from backtest_generator import BacktestGenerator
+        _generator = BacktestGenerator()
+    return _generator.build_backtest(request)
+
+class ComputePool:
+    """
+    Bounded set of restartable single-process executors. workers=0 runs jobs
+    inline on the event loop (the old behaviour, for debugging). Use from the
+    event loop.
+    """
+
+    def __init__(self, workers: int, timeout: Optional[float] = None, start_method: str = "spawn"):
+        self.workers = workers
+        self.timeout = timeout
+        # spawn: forking a process that runs boto3 executor threads is not safe
+        self.start_method = start_method
+        # Healthy executors waiting for a job; at most `workers` exist at once
+        self._idle: List[ProcessPoolExecutor] = []
+        self._busy = set()
+        self._slots = asyncio.Semaphore(max(workers, 1))
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.crashes = 0
+        self.restarts = 0
+        self.running = 0
+        self.compute_seconds = 0.0
+
+    def _acquire_executor(self) -> ProcessPoolExecutor:
+        executor = self._idle.pop() if self._idle else ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context(self.start_method)
+        )
+        self._busy.add(executor)
+        return executor
+
+    def _release_executor(self, executor: ProcessPoolExecutor):
+        self._busy.discard(executor)
+        self._idle.append(executor)
+
+    def _recycle(self, executor: ProcessPoolExecutor):
+        """Stop the process of a hung or dead job; the next job starts a fresh one"""
+        self._busy.discard(executor)
+        self.restarts += 1
+        # ProcessPoolExecutor can't cancel a running call; stop its process instead
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, fn: Callable, *args: Any, timeout: Optional[float] = None) -> Any:
+        """Run fn(*args) in a worker process, waiting for a free slot first"""
+        timeout = timeout if timeout is not None else self.timeout
+        self.submitted += 1
+        async with self._slots:
+            self.running += 1
+            started = time.perf_counter()
+            try:
+                if self.workers <= 0:
+                    result = fn(*args)
+                else:
+                    result = await self._run_in_process(fn, args, timeout)
+            except Exception:
+                self.failed += 1
+                raise
+            finally:
+                self.running -= 1
+                self.compute_seconds += time.perf_counter() - started
+            self.completed += 1
+            return result
+
+    async def _run_in_process(self, fn: Callable, args: tuple, timeout: Optional[float]) -> Any:
+        executor = self._acquire_executor()
+        loop = asyncio.get_running_loop()
+        try:
+            result = await asyncio.wait_for(loop.run_in_executor(executor, fn, *args), timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            self._recycle(executor)
+            raise ComputeTimeout(f"Computation exceeded {timeout}s")
+        except BrokenProcessPool:
+            self.crashes += 1
+            self._recycle(executor)
+            raise ComputeCrashed("Worker process died while computing")
+        except asyncio.CancelledError:
+            # The call keeps running in its process; stop it rather than reuse a busy executor
+            self._recycle(executor)
+            raise
+        except Exception:
+            # The job itself raised; its process is fine
+            self._release_executor(executor)
+            raise
+        self._release_executor(executor)
+        return result
+
+    def shutdown(self):
+        for executor in self._idle + list(self._busy):
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._idle = []
+        self._busy = set()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "timeout_seconds": self.timeout,
+            "running": self.running,
+            "idle_processes": len(self._idle),
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "crashes": self.crashes,
+            "restarts": self.restarts,
+            "compute_seconds": round(self.compute_seconds, 3)
+        }
+
+_compute_pool: Optional[ComputePool] = None
+
+def get_compute_pool() -> ComputePool:
+    """Process-wide compute pool, sized by COMPUTE_POOL_WORKERS"""
+    global _compute_pool
+    if _compute_pool is None:
+        workers = int(os.getenv("COMPUTE_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+        timeout = float(os.getenv("COMPUTE_JOB_TIMEOUT_SECONDS", "600"))
+        _compute_pool = ComputePool(workers, timeout=timeout if timeout > 0 else None)
+    return _compute_pool
+
+def shutdown_compute_pool():
+    global _compute_pool
+    if _compute_pool is not None:
+        _compute_pool.shutdown()
+        _compute_pool = None
@@ -0,0 +1,159 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class ItemNotFound(Exception):
+    """Raised by a flush function when the item no longer exists"""
+
+class CounterWriteBuffer:
+    """
+    In-process aggregation of like/comment/share increments.
+
+    Increments are summed per (item, counter) and written every flush_interval
+    seconds as one update per item, so a burst of clicks on a hot item costs a
+    single write. Delivery is at least once: deltas whose write fails are put
+    back and retried on the next flush (a write that succeeded but timed out
+    may be applied twice). At most max_items items are buffered; adding a new
+    item to a full buffer flushes first, and failed deltas that no longer fit
+    are dropped. Use from the event loop only.
+    """
+
+    def __init__(self, flush_fn: Callable[[str, Dict[str, int]], Awaitable[None]], flush_interval: float = 0.5,
+                 max_items: int = 10000, concurrency: int = 8, on_flushed: Optional[Callable[[], Awaitable[None]]] = None):
+        self.flush_fn = flush_fn
+        # Awaited once after each flush that wrote something (e.g. cache invalidation)
+        self.on_flushed = on_flushed
+        self.flush_interval = flush_interval
+        self.max_items = max_items
+        self.concurrency = concurrency
+        self._pending: Dict[str, Dict[str, int]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._closed = False
+        self.increments = 0
+        self.flushes = 0
+        self.writes = 0
+        self.failures = 0
+        self.requeued = 0
+        self.dropped = 0
+        self.forced_flushes = 0
+        self.last_flush_ms = 0.0
+        self.last_flush_items = 0
+
+    @property
+    def pending_items(self) -> int:
+        return len(self._pending)
+
+    def _ensure_started(self):
+        # Started lazily so the buffer binds to the loop that serves requests
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def add(self, item_id: str, counter: str, delta: int = 1):
+        """Buffer an increment of one counter on an item"""
+        if self._closed:
+            raise RuntimeError("Counter buffer is closed")
+        self._ensure_started()
+
+        if item_id not in self._pending and len(self._pending) >= self.max_items:
+            self.forced_flushes += 1
+            await self.flush()
+
+        deltas = self._pending.setdefault(item_id, {})
+        deltas[counter] = deltas.get(counter, 0) + delta
+        self.increments += 1
+
+    def _requeue(self, item_id: str, deltas: Dict[str, int]):
+        if item_id not in self._pending and len(self._pending) >= self.max_items:
+            # Items added during the flush filled the buffer; don't grow past it
+            self.dropped += 1
+            logger.error(f"Counter buffer full, dropped failed counter updates for {item_id}: {deltas}")
+            return
+        pending = self._pending.setdefault(item_id, {})
+        for counter, delta in deltas.items():
+            pending[counter] = pending.get(counter, 0) + delta
+        self.requeued += 1
+
+    async def flush(self) -> int:
+        """Write every buffered item; returns the number of items written"""
+        async with self._flush_lock:
+            batch, self._pending = self._pending, {}
+            batch = {item_id: deltas for item_id, deltas in batch.items() if any(deltas.values())}
+            if not batch:
+                return 0
+
+            started = time.perf_counter()
+            semaphore = asyncio.Semaphore(self.concurrency)
+            written = 0
+
+            async def write(item_id: str, deltas: Dict[str, int]):
+                nonlocal written
+                async with semaphore:
+                    try:
+                        await self.flush_fn(item_id, deltas)
+                        written += 1
+                        self.writes += 1
+                    except ItemNotFound:
+                        self.dropped += 1
+                        logger.warning(f"Dropped counter updates for missing item {item_id}: {deltas}")
+                    except Exception as e:
+                        self.failures += 1
+                        logger.error(f"Failed to flush counters for {item_id}, will retry: {str(e)}")
+                        self._requeue(item_id, deltas)
+
+            await asyncio.gather(*[write(item_id, deltas) for item_id, deltas in batch.items()])
+
+            self.flushes += 1
+            self.last_flush_items = len(batch)
+            self.last_flush_ms = round((time.perf_counter() - started) * 1000, 2)
+
+            if written and self.on_flushed is not None:
+                await self.on_flushed()
+            return written
+
+    async def _run(self):
+        while not self._closed:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Counter buffer flush failed: {str(e)}")
+
+    async def close(self, attempts: int = 3):
+        """Stop the flush loop and write what is left"""
+        self._closed = True
+        if self._task is not None:
+            # Under the lock the loop is sleeping, never halfway through a flush
+            async with self._flush_lock:
+                self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for _ in range(attempts):
+            if not self._pending:
+                break
+            await self.flush()
+        if self._pending:
+            logger.error(f"Lost counter updates for {len(self._pending)} item(s) at shutdown: {self._pending}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "flush_interval_ms": int(self.flush_interval * 1000),
+            "pending_items": len(self._pending),
+            "max_items": self.max_items,
+            "increments": self.increments,
+            "flushes": self.flushes,
+            "writes": self.writes,
+            "failures": self.failures,
+            "requeued": self.requeued,
+            "dropped": self.dropped,
+            "forced_flushes": self.forced_flushes,
+            "last_flush_items": self.last_flush_items,
+            "last_flush_ms": self.last_flush_ms
+        }
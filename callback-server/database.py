@@ -1,18 +1,147 @@
+import asyncio
+import base64
 import boto3
+import functools
 import json
 import logging
+import os
+import random
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, AsyncIterator
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError, NoCredentialsError
 from decimal import Decimal
 import time
-import pprint as pp
+import zlib
 
 from models import DynamoDBUser, DynamoDBSignal, DynamoDBBacktest, DynamoDBBacktestJob
+from loaders import RequestLoaders
+from cache import MISSING, TTLCache
+from codec import deserialize_item, serialize_item
+from chart_codec import (
+    pack_chart, unpack_chart, chart_data_of, chart_point_count, encode_chart_blob, decode_chart_blob
+)
+from blob_store import create_blob_store
+from downsample import downsample_chart
+from counter_buffer import CounterWriteBuffer, ItemNotFound
+from sharded_counters import HotItemDetector, ShardedCounterReader, counter_shard_key, random_counter_shard
+from feed_cache import create_feed_page_cache
+from job_events import JOBS_AVAILABLE, JOBS_CANCELLED, JOB_UPDATES, create_job_event_bus
 
 logger = logging.getLogger(__name__)
 
+# DynamoDB limit on keys per BatchGetItem request
+BATCH_GET_MAX_KEYS = 100
+
+# BatchWriteItem accepts at most 25 put/delete requests per call
+BATCH_WRITE_MAX_ITEMS = 25
+
+# TransactWriteItems accepts at most 100 actions per call
+TRANSACT_WRITE_MAX_ITEMS = 100
+
+# Batches of a bulk write that are in flight at the same time
+BATCH_WRITE_CONCURRENCY = int(os.getenv("BATCH_WRITE_CONCURRENCY", "8"))
+
+# Attempts of a transaction cancelled because a concurrent transaction touched
+# the same item (every feed item create and delete updates the feed counters)
+TRANSACTION_CONFLICT_ATTEMPTS = int(os.getenv("TRANSACTION_CONFLICT_ATTEMPTS", "6"))
+
+# Default number of Segment/TotalSegments workers for parallel scans
+PARALLEL_SCAN_SEGMENTS = int(os.getenv("PARALLEL_SCAN_SEGMENTS", "8"))
+
+# GSI that keeps the feed ordered by created_at. Items are assigned to one of
+# FEED_SHARD_COUNT constant partitions so writes do not pile onto a single key.
+# The shard count may be raised later but must never be lowered.
+FEED_INDEX_NAME = "feed_shard-created_at-index"
+
+# Pending job queue reads by the schedulers of every worker. Same keys as
+# StatusIndex, but items carry only what the scheduler needs, so a deep
+# queue is cheap to reread.
+JOB_QUEUE_INDEX_NAME = "QueueIndex"
+FEED_SHARD_COUNT = int(os.getenv("FEED_SHARD_COUNT", "4"))
+
+# How new feed items store chart_data: "inline" (a DynamoDB map) or "packed"
+# (a compact binary chart_packed attribute, see chart_codec.py). CHART_PRECISION
+# "float32" halves series size at the cost of ~7 significant digits.
+CHART_STORAGE = os.getenv("CHART_STORAGE", "inline").lower()
+CHART_PRECISION = os.getenv("CHART_PRECISION", "exact").lower()
+
+# With a blob store configured, charts longer than this are moved to it and
+# feed items keep an LTTB-downsampled preview of this many points
+CHART_PREVIEW_POINTS = int(os.getenv("CHART_PREVIEW_POINTS", "50"))
+
+# Like/comment/share increments are summed in memory and written once per item
+# every COUNTER_FLUSH_INTERVAL_MS (0 writes every click immediately)
+COUNTER_FLUSH_INTERVAL_MS = int(os.getenv("COUNTER_FLUSH_INTERVAL_MS", "500"))
+COUNTER_BUFFER_MAX_ITEMS = int(os.getenv("COUNTER_BUFFER_MAX_ITEMS", "10000"))
+
+# An item counted more than COUNTER_HOT_THRESHOLD times per second (per
+# process, over COUNTER_HOT_WINDOW_SECONDS) has its counters spread over
+# COUNTER_SHARDS rows of the counters table (see sharded_counters.py).
+# 0 turns promotion off; items already sharded are still summed on read.
+COUNTER_SHARDS = int(os.getenv("COUNTER_SHARDS", "10"))
+COUNTER_HOT_THRESHOLD = float(os.getenv("COUNTER_HOT_THRESHOLD", "50"))
+COUNTER_HOT_WINDOW_SECONDS = float(os.getenv("COUNTER_HOT_WINDOW_SECONDS", "10"))
+
+# Named attribute sets for list reads, turned into a ProjectionExpression.
+# "card" has what a feed card renders, "summary" drops the chart as well and
+# "full" (None) reads whole items. Key attributes are always included.
+FEED_KEY_FIELDS = ("item_id", "feed_shard", "created_at")
+FEED_CARD_FIELDS = (
+    "item_type", "user_id", "signal_id", "backtest_id", "name", "description", "timeframe", "assets",
+    "entry", "target", "stop_loss", "confidence", "period", "initial_capital", "final_capital",
+    "status", "performance", "chart_data", "chart_packed", "updated_at", "version", "likes", "comments", "shares",
+    "counter_shards"
+)
+FEED_PROJECTIONS = {
+    "card": FEED_CARD_FIELDS,
+    "summary": tuple(field for field in FEED_CARD_FIELDS if field not in ("chart_data", "chart_packed")) + ("chart_ref", "trade_count"),
+    "full": None
+}
+
+JOB_KEY_FIELDS = ("job_id", "user_id", "status", "created_at")
+JOB_SUMMARY_FIELDS = (
+    "priority", "started_at", "completed_at", "strategy_name", "strategy_description", "timeframe", "assets",
+    "period", "initial_capital", "estimated_duration", "actual_duration", "error_message", "progress", "result_backtest_id",
+    "cached_result"
+)
+JOB_PROJECTIONS = {
+    # What the scheduler needs to order the pending queue
+    "queue": ("priority",),
+    "card": ("strategy_name", "progress", "started_at", "completed_at", "error_message", "result_backtest_id", "cached_result"),
+    "summary": JOB_SUMMARY_FIELDS,
+    "full": None
+}
+
+# Result cache entries (see result_cache.py) live in the backtest jobs table
+# under this key prefix. They have no status or user_id, so the job indexes
+# never see them.
+RESULT_CACHE_KEY_PREFIX = "result#"
+
+def resolve_projection(projections: Dict[str, Optional[tuple]], projection: Union[str, List[str], None]) -> Optional[tuple]:
+    """
+    Attribute names for a named projection or an explicit list of fields;
+    None means every attribute. Raises ValueError on an unknown name.
+    """
+    if projection is None:
+        return None
+    if isinstance(projection, str):
+        if projection not in projections:
+            raise ValueError(f"Unknown projection '{projection}', expected one of {sorted(projections)}")
+        return projections[projection]
+    return tuple(projection)
+
+def projection_params(fields: Optional[tuple], key_fields: tuple = ()) -> Dict[str, Any]:
+    """ProjectionExpression and ExpressionAttributeNames for a field set (all attributes if None)"""
+    if fields is None:
+        return {}
+    names = {}
+    for field in dict.fromkeys(key_fields + tuple(fields)):
+        names[f"#p{len(names)}"] = field
+    return {"ProjectionExpression": ", ".join(names), "ExpressionAttributeNames": names}
+
 def convert_floats_to_decimal(obj: Any) -> Any:
     """
     Recursively convert all float values to Decimal for DynamoDB compatibility
@@ -51,47 +180,208 @@ def prepare_item_from_dynamodb(item_dict: Dict[str, Any]) -> Dict[str, Any]:
     """
     return convert_decimals_to_float(item_dict)
 
+def feed_shard_for(item_id: str, shard_count: int = FEED_SHARD_COUNT) -> str:
+    """
+    Deterministically assign a feed item to one of the feed index partitions
+    """
+    return f"feed#{zlib.crc32(item_id.encode('utf-8')) % shard_count}"
+
+def feed_index_key(item: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Build the ExclusiveStartKey of an item in the feed index
+    """
+    return {
+        "item_id": item["item_id"],
+        "feed_shard": item["feed_shard"],
+        "created_at": item["created_at"]
+    }
+
+def encode_feed_cursor(positions: Dict[str, Any]) -> str:
+    """
+    Encode per-shard feed positions as an opaque continuation token.
+    A position is the index key to resume after, None if the shard has not been
+    read yet, or 0 once the shard is exhausted.
+    """
+    payload = json.dumps({"v": 1, "s": positions}, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_feed_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a continuation token produced by encode_feed_cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        positions = payload["s"]
+        if payload.get("v") != 1 or not isinstance(positions, dict):
+            raise ValueError("unsupported cursor version")
+        for position in positions.values():
+            if position not in (0, None) and not (isinstance(position, dict) and set(position) == {"item_id", "feed_shard", "created_at"}):
+                raise ValueError("malformed shard position")
+        return positions
+    except Exception as e:
+        raise ValueError(f"Invalid feed cursor: {str(e)}")
+
+# Feed filters that have a maintained item count, in counter key order
+FEED_COUNTER_DIMENSIONS = ("type", "timeframe", "user_id")
+
+def feed_counter_key(filters: Dict[str, Any] = None) -> str:
+    """
+    Counter ID holding the number of feed items matching a filter combination
+    """
+    parts = [f"{name}={filters[name]}" for name in FEED_COUNTER_DIMENSIONS if filters and filters.get(name)]
+    return "feed|" + "|".join(parts) if parts else "feed|all"
+
+def feed_counter_keys(item: Dict[str, Any]) -> List[str]:
+    """
+    Every counter a feed item contributes to: one per subset of its filter values
+    """
+    values = {"type": item.get("item_type"), "timeframe": item.get("timeframe"), "user_id": item.get("user_id")}
+    keys = []
+    for mask in range(1 << len(FEED_COUNTER_DIMENSIONS)):
+        subset = {name: values[name] for bit, name in enumerate(FEED_COUNTER_DIMENSIONS) if mask & (1 << bit)}
+        keys.append(feed_counter_key(subset))
+    # Missing values collapse onto broader counters; count those only once
+    return list(dict.fromkeys(keys))
+
 class DatabaseManager:
     """Manages DynamoDB operations for the application"""
 
-    def __init__(self, user_table_name: str, feed_table_name: str, backtest_jobs_table_name: str = None, region: str = "us-east-1", use_localstack: bool = True, localstack_endpoint: str = None):
+    def __init__(self, user_table_name: str, feed_table_name: str, backtest_jobs_table_name: str = None, region: str = "us-east-1", use_localstack: bool = True, localstack_endpoint: str = None, executor_workers: Optional[int] = None, counters_table_name: str = None):
         self.user_table_name = user_table_name
         self.feed_table_name = feed_table_name
         self.backtest_jobs_table_name = backtest_jobs_table_name or f"{user_table_name}_backtest_jobs"
+        self.counters_table_name = counters_table_name or f"{feed_table_name}_counters"
         self.region = region
         self.use_localstack = use_localstack
         self.localstack_endpoint = localstack_endpoint
+        # Threads per table used to run blocking boto3 calls off the event loop.
+        # 0 runs calls inline on the event loop (the old behaviour).
+        self.executor_workers = executor_workers if executor_workers is not None else int(os.getenv("DB_EXECUTOR_WORKERS", "16"))
         self.dynamodb = None
+        self.client = None
         self.user_table = None
         self.feed_table = None
         self.backtest_jobs_table = None
+        self.counters_table = None
+        self._table_resources = {}
+        self._table_clients = {}
+        self._executors = {}
+        self.feed_shard_count = FEED_SHARD_COUNT
+        self.chart_storage = CHART_STORAGE
+        # Cleared if the feed index is missing (tables created before it existed)
+        self._feed_index_available = True
+        # Cleared if the job queue index is missing; the StatusIndex serves instead
+        self._queue_index_available = True
+        # Profiles are read on almost every request and rarely change
+        self.user_cache = TTLCache(
+            max_size=int(os.getenv("USER_CACHE_SIZE", "10000")),
+            ttl=float(os.getenv("USER_CACHE_TTL_SECONDS", "300")),
+            negative_ttl=float(os.getenv("USER_CACHE_NEGATIVE_TTL_SECONDS", "30"))
+        )
+        # Rendered /api/feed pages shared by all workers on the node
+        self.feed_page_cache = create_feed_page_cache(self.feed_table_name)
+        # Full charts and trade history referenced by feed items
+        self.blob_store = create_blob_store(self.use_localstack, self._connection_kwargs(BATCH_WRITE_CONCURRENCY))
+        self.counter_buffer = None
+        if COUNTER_FLUSH_INTERVAL_MS > 0:
+            self.counter_buffer = CounterWriteBuffer(
+                self._write_item_counters,
+                flush_interval=COUNTER_FLUSH_INTERVAL_MS / 1000,
+                max_items=COUNTER_BUFFER_MAX_ITEMS,
+                concurrency=BATCH_WRITE_CONCURRENCY,
+                on_flushed=self.feed_page_cache.invalidate
+            )
+        # Wakes backtest workers when jobs are created (see job_events.py)
+        self.job_events = create_job_event_bus(self.backtest_jobs_table_name)
+        # Feed items known to exist, so that buffered likes/comments/shares of a
+        # missing item are refused up front as unbuffered ones are
+        self.counted_items = TTLCache(max_size=COUNTER_BUFFER_MAX_ITEMS, ttl=300, negative_ttl=5)
+        # Shard counts of items known to be sharded, learned on promotion and on reads
+        self.counter_shards = TTLCache(max_size=COUNTER_BUFFER_MAX_ITEMS, ttl=3600, negative_ttl=0)
+        self.hot_items = None
+        if COUNTER_SHARDS > 1 and COUNTER_HOT_THRESHOLD > 0:
+            self.hot_items = HotItemDetector(COUNTER_HOT_THRESHOLD, window=COUNTER_HOT_WINDOW_SECONDS)
+        self.counter_reader = ShardedCounterReader(
+            self._fetch_counter_shards,
+            cache_size=COUNTER_BUFFER_MAX_ITEMS,
+            ttl=float(os.getenv("COUNTER_SHARD_CACHE_TTL_SECONDS", "5"))
+        )
         self._initialize_connection()
 
+    def _connection_kwargs(self, max_pool_connections: int) -> Dict[str, Any]:
+        """boto3 resource/client arguments for the configured endpoint"""
+        boto_config = BotoConfig(max_pool_connections=max_pool_connections)
+        if self.use_localstack:
+            return {
+                "region_name": self.region,
+                "endpoint_url": self.localstack_endpoint or 'http://localhost:4566',
+                "aws_access_key_id": 'test',
+                "aws_secret_access_key": 'test',
+                "config": boto_config
+            }
+        return {"region_name": self.region, "config": boto_config}
+
+    def _create_resource(self, max_pool_connections: int = 10):
+        """Create a DynamoDB resource with its own HTTP connection pool"""
+        return boto3.resource('dynamodb', **self._connection_kwargs(max_pool_connections))
+
+    def _create_client(self, max_pool_connections: int = 10):
+        """
+        Create a plain DynamoDB client for wire-format calls (see codec.py).
+        A resource's own client can't be used: boto3 hooks its type
+        (de)serialization into it.
+        """
+        return boto3.client('dynamodb', **self._connection_kwargs(max_pool_connections))
+
+    def _bind_table(self, table_type: str, table_name: str):
+        """Bind a table to its dedicated resource and executor"""
+        if self.executor_workers > 0:
+            # Each table gets its own connection pool sized to its executor so a
+            # slow table cannot exhaust the connections of the others
+            if table_name not in self._table_resources:
+                self._table_resources[table_name] = self._create_resource(max_pool_connections=self.executor_workers)
+                self._table_clients[table_name] = self._create_client(max_pool_connections=self.executor_workers)
+                self._executors[table_name] = ThreadPoolExecutor(
+                    max_workers=self.executor_workers,
+                    thread_name_prefix=f"dynamodb-{table_type}"
+                )
+            table = self._table_resources[table_name].Table(table_name)
+        else:
+            table = self.dynamodb.Table(table_name)
+
+        if table_type == "user":
+            self.user_table = table
+        elif table_type == "feed":
+            self.feed_table = table
+        elif table_type == "backtest_jobs":
+            self.backtest_jobs_table = table
+        elif table_type == "counters":
+            self.counters_table = table
+        return table
+
     def _initialize_connection(self):
         """Initialize DynamoDB connection"""
         try:
             if self.use_localstack:
                 # Use LocalStack for local development
                 logger.info(f"Initializing LocalStack DynamoDB connection")
-                self.dynamodb = boto3.resource(
-                    'dynamodb',
-                    region_name=self.region,
-                    endpoint_url=self.localstack_endpoint or 'http://localhost:4566',
-                    aws_access_key_id='test',
-                    aws_secret_access_key='test'
-                )
             else:
                 # Use real AWS DynamoDB
                 logger.info(f"Initializing AWS DynamoDB connection")
-                self.dynamodb = boto3.resource('dynamodb', region_name=self.region)
+            self.dynamodb = self._create_resource()
+            self.client = self._create_client()
 
-            self.user_table = self.dynamodb.Table(self.user_table_name)
-            self.feed_table = self.dynamodb.Table(self.feed_table_name)
-            self.backtest_jobs_table = self.dynamodb.Table(self.backtest_jobs_table_name)
+            self._bind_table("user", self.user_table_name)
+            self._bind_table("feed", self.feed_table_name)
+            self._bind_table("backtest_jobs", self.backtest_jobs_table_name)
+            self._bind_table("counters", self.counters_table_name)
 
             # Create tables if they don't exist (especially useful for LocalStack)
             if self.use_localstack:
                 self._ensure_tables_exist()
+            else:
+                self._check_counters_table()
 
             logger.info(f"Successfully connected to DynamoDB tables: {self.user_table_name}, {self.feed_table_name}, {self.backtest_jobs_table_name}")
 
@@ -101,6 +391,18 @@ class DatabaseManager:
             self.user_table = None
             self.feed_table = None
             self.backtest_jobs_table = None
+            self.counters_table = None
+
+    def _check_counters_table(self):
+        """Disable feed counters if the counters table has not been provisioned"""
+        try:
+            self.counters_table.load()
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ResourceNotFoundException':
+                logger.warning(f"Counters table {self.counters_table_name} not found - feed totals will be counted from the feed index")
+                self.counters_table = None
+            else:
+                raise e
 
     def _ensure_tables_exist(self, max_retries: int = 10, delay: float = 1.0):
         """Ensure all DynamoDB tables exist (for LocalStack development)"""
@@ -110,6 +412,8 @@ class DatabaseManager:
         self._ensure_table_exists(self.feed_table_name, "feed", max_retries, delay)
         # Create backtest jobs table
         self._ensure_table_exists(self.backtest_jobs_table_name, "backtest_jobs", max_retries, delay)
+        # Create feed counters table
+        self._ensure_table_exists(self.counters_table_name, "counters", max_retries, delay)
 
     def _ensure_table_exists(self, table_name: str, table_type: str, max_retries: int = 10, delay: float = 1.0):
         """Ensure a specific DynamoDB table exists"""
@@ -243,6 +547,10 @@ class DatabaseManager:
                             {
                                 'AttributeName': 'created_at',
                                 'AttributeType': 'S'
+                            },
+                            {
+                                'AttributeName': 'feed_shard',
+                                'AttributeType': 'S'
                             }
                         ],
                         GlobalSecondaryIndexes=[
@@ -259,11 +567,17 @@ class DatabaseManager:
                                 }
                             },
                             {
-                                'IndexName': 'created_at-index',
+                                # Time-ordered feed: items are spread over a few constant
+                                # partitions and sorted by created_at within each one
+                                'IndexName': FEED_INDEX_NAME,
                                 'KeySchema': [
                                     {
-                                        'AttributeName': 'created_at',
+                                        'AttributeName': 'feed_shard',
                                         'KeyType': 'HASH'
+                                    },
+                                    {
+                                        'AttributeName': 'created_at',
+                                        'KeyType': 'RANGE'
                                     }
                                 ],
                                 'Projection': {
@@ -318,6 +632,23 @@ class DatabaseManager:
                                     'ProjectionType': 'ALL'
                                 }
                             },
+                            {
+                                'IndexName': JOB_QUEUE_INDEX_NAME,
+                                'KeySchema': [
+                                    {
+                                        'AttributeName': 'status',
+                                        'KeyType': 'HASH'
+                                    },
+                                    {
+                                        'AttributeName': 'created_at',
+                                        'KeyType': 'RANGE'
+                                    }
+                                ],
+                                'Projection': {
+                                    'ProjectionType': 'INCLUDE',
+                                    'NonKeyAttributes': ['priority', 'user_id']
+                                }
+                            },
                             {
                                 'IndexName': 'UserIndex',
                                 'KeySchema': [
@@ -337,6 +668,24 @@ class DatabaseManager:
                         ],
                         BillingMode='PAY_PER_REQUEST'
                     )
+                elif table_type == "counters":
+                    # Counters table schema - aggregate counts kept next to the feed
+                    table = self.dynamodb.create_table(
+                        TableName=table_name,
+                        KeySchema=[
+                            {
+                                'AttributeName': 'counter_id',
+                                'KeyType': 'HASH'
+                            }
+                        ],
+                        AttributeDefinitions=[
+                            {
+                                'AttributeName': 'counter_id',
+                                'AttributeType': 'S'
+                            }
+                        ],
+                        BillingMode='PAY_PER_REQUEST'
+                    )
                 else:
                     raise ValueError(f"Unknown table type: {table_type}")
 
@@ -345,12 +694,7 @@ class DatabaseManager:
                 logger.info(f"Table {table_name} ({table_type}) created successfully")
 
                 # Update the appropriate table reference
-                if table_type == "user":
-                    self.user_table = table
-                elif table_type == "feed":
-                    self.feed_table = table
-                elif table_type == "backtest_jobs":
-                    self.backtest_jobs_table = table
+                self._bind_table(table_type, table_name)
 
                 return
 
@@ -362,12 +706,7 @@ class DatabaseManager:
                     if self._wait_for_table_available(table_name, max_retries=10, delay=delay):
                         logger.info(f"Table {table_name} is now available (created by another worker)")
                         # Update our table reference to the existing table
-                        if table_type == "user":
-                            self.user_table = self.dynamodb.Table(table_name)
-                        elif table_type == "feed":
-                            self.feed_table = self.dynamodb.Table(table_name)
-                        elif table_type == "backtest_jobs":
-                            self.backtest_jobs_table = self.dynamodb.Table(table_name)
+                        self._bind_table(table_type, table_name)
                         return
                     else:
                         logger.error(f"Table {table_name} failed to become available after waiting")
@@ -386,25 +725,207 @@ class DatabaseManager:
         """Check if database connection is available"""
         return self.user_table is not None and self.feed_table is not None and self.backtest_jobs_table is not None
 
+    async def _execute(self, table, operation: str, **kwargs) -> Any:
+        """Run a blocking boto3 table operation on the table's executor"""
+        return await self._run(table.name, getattr(table, operation), **kwargs)
+
+    async def _run(self, table_name: str, fn, **kwargs) -> Any:
+        """Run a blocking boto3 call on the executor dedicated to table_name"""
+        executor = self._executors.get(table_name)
+        if executor is None:
+            return fn(**kwargs)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(fn, **kwargs))
+
+    def _resource_for(self, table_name: str):
+        """Get the resource (and connection pool) bound to a table"""
+        return self._table_resources.get(table_name, self.dynamodb)
+
+    def _table_named(self, table_name: str):
+        """Get the bound table called table_name, or a plain one for tables this manager doesn't own"""
+        for table in (self.user_table, self.feed_table, self.backtest_jobs_table, self.counters_table):
+            if table is not None and table.name == table_name:
+                return table
+        return self._resource_for(table_name).Table(table_name)
+
+    def _client_for(self, table_name: str):
+        """Get the plain wire-format client bound to a table"""
+        return self._table_clients.get(table_name, self.client)
+
+    async def _execute_wire(self, table, operation: str, **kwargs) -> Any:
+        """
+        Run a low-level client operation on the table's executor.
+        Keys and values must already be in wire format (codec.serialize_item)
+        and responses come back in wire format.
+        """
+        client = self._client_for(table.name)
+        return await self._run(table.name, getattr(client, operation), TableName=table.name, **kwargs)
+
+    async def parallel_scan(self, table, total_segments: Optional[int] = None, max_buffered_pages: Optional[int] = None, **scan_params) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Scan a table as TotalSegments concurrent segment scans, yielding items as they arrive.
+
+        table may be a bound table or a table name. scan_params (ProjectionExpression,
+        FilterExpression, ...) are passed to every segment. At most max_buffered_pages
+        pages are held in memory; segments wait while the consumer catches up.
+        Items arrive in no particular order.
+        """
+        if isinstance(table, str):
+            table = self._table_named(table)
+        total_segments = total_segments or PARALLEL_SCAN_SEGMENTS
+        queue = asyncio.Queue(maxsize=max_buffered_pages or total_segments * 2)
+        segment_done = object()
+
+        async def scan_segment(segment: int):
+            params = dict(scan_params, Segment=segment, TotalSegments=total_segments)
+            try:
+                while True:
+                    response = await self._execute(table, "scan", **params)
+                    await queue.put(response.get("Items", []))
+                    if not response.get("LastEvaluatedKey"):
+                        break
+                    params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+                await queue.put(segment_done)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await queue.put(e)
+
+        tasks = [asyncio.create_task(scan_segment(segment)) for segment in range(total_segments)]
+        try:
+            remaining = total_segments
+            while remaining:
+                page = await queue.get()
+                if page is segment_done:
+                    remaining -= 1
+                    continue
+                if isinstance(page, Exception):
+                    raise page
+                for item in page:
+                    yield item
+        finally:
+            # Stop the other segments if the consumer stopped early or one failed
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def create_loaders(self) -> RequestLoaders:
+        """Create batched user/item loaders scoped to a single request"""
+        return RequestLoaders(self)
+
+    async def _batch_get(self, table, key_name: str, keys: List[str], max_retries: int = 5, number=Decimal) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch items by key with BatchGetItem, retrying unprocessed keys.
+        Numbers are decoded with `number` (Decimal like boto3, or float for API responses).
+        """
+        results = {}
+        unique_keys = list(dict.fromkeys(key for key in keys if key))
+        client = self._client_for(table.name)
+
+        for start in range(0, len(unique_keys), BATCH_GET_MAX_KEYS):
+            request_items = {
+                table.name: {"Keys": [{key_name: {"S": key}} for key in unique_keys[start:start + BATCH_GET_MAX_KEYS]]}
+            }
+
+            for attempt in range(max_retries + 1):
+                response = await self._run(table.name, client.batch_get_item, RequestItems=request_items)
+                for item in response.get("Responses", {}).get(table.name, []):
+                    item = deserialize_item(item, number)
+                    results[item[key_name]] = item
+
+                request_items = response.get("UnprocessedKeys") or {}
+                if not request_items:
+                    break
+
+                if attempt == max_retries:
+                    unprocessed = len(request_items.get(table.name, {}).get("Keys", []))
+                    logger.error(f"Giving up on {unprocessed} unprocessed keys from {table.name}")
+                    break
+
+                # Exponential backoff with full jitter before retrying throttled keys
+                await asyncio.sleep(random.uniform(0, min(2.0, 0.05 * (2 ** attempt))))
+
+        return results
+
+    async def batch_get_users(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several users by ID, keyed by user_id"""
+        if not self.is_connected():
+            return {}
+
+        try:
+            users = {}
+            uncached = []
+            for user_id in dict.fromkeys(user_id for user_id in user_ids if user_id):
+                cached = self.user_cache.get(user_id)
+                if cached is MISSING:
+                    uncached.append(user_id)
+                elif cached is not None:
+                    users[user_id] = dict(cached)
+
+            if uncached:
+                generation = self.user_cache.generation
+                fetched = await self._batch_get(self.user_table, "user_id", uncached)
+                for user_id in uncached:
+                    self.user_cache.set(user_id, fetched.get(user_id), generation)
+                # Callers get copies so they can't change the cached profiles
+                users.update({user_id: dict(user) for user_id, user in fetched.items()})
+
+            logger.info(f"Retrieved {len(users)} of {len(set(user_ids))} users in batch ({len(uncached)} uncached)")
+            return users
+
+        except Exception as e:
+            logger.error(f"Failed to batch get users: {str(e)}")
+            return {}
+
+    async def batch_get_feed_items(self, item_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several feed items by ID, keyed by item_id"""
+        if not self.is_connected():
+            return {}
+
+        try:
+            # Decoded straight to floats for API responses
+            items = await self._batch_get(self.feed_table, "item_id", item_ids, number=float)
+            await self._resolve_counter_shards(list(items.values()))
+            logger.info(f"Retrieved {len(items)} of {len(set(item_ids))} feed items in batch")
+            return items
+
+        except Exception as e:
+            logger.error(f"Failed to batch get feed items: {str(e)}")
+            return {}
+
+    def close(self):
+        """Shut down the per-table executors"""
+        for executor in self._executors.values():
+            executor.shutdown(wait=False)
+        self._executors = {}
+
     # User Operations
+    def _build_user_item(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate user data and build the user table item"""
+        return DynamoDBUser(
+            user_id=user_data["id"],
+            email=user_data["email"],
+            name=user_data["name"],
+            picture=user_data.get("picture"),
+            verified=user_data.get("verified", False),
+            followers=user_data.get("followers", 0),
+            created_at=datetime.utcnow().isoformat(),
+            updated_at=datetime.utcnow().isoformat()
+        ).model_dump()
+
     async def create_user(self, user_data: Dict[str, Any]) -> bool:
         """Create a new user"""
         if not self.is_connected():
             return False
 
         try:
-            user_item = DynamoDBUser(
-                user_id=user_data["id"],
-                email=user_data["email"],
-                name=user_data["name"],
-                picture=user_data.get("picture"),
-                verified=user_data.get("verified", False),
-                followers=user_data.get("followers", 0),
-                created_at=datetime.utcnow().isoformat(),
-                updated_at=datetime.utcnow().isoformat()
-            )
+            user_item = self._build_user_item(user_data)
 
-            self.user_table.put_item(Item=user_item.model_dump())
+            try:
+                await self._execute(self.user_table, "put_item", Item=user_item)
+            finally:
+                self.user_cache.invalidate(user_data["id"])
             logger.info(f"Created user: {user_data['email']}")
             return True
 
@@ -418,12 +939,18 @@ class DatabaseManager:
             return None
 
         try:
-            response = self.user_table.get_item(Key={"user_id": user_id})
+            cached = self.user_cache.get(user_id)
+            if cached is not MISSING:
+                return dict(cached) if cached is not None else None
+
+            generation = self.user_cache.generation
+            response = await self._execute(self.user_table, "get_item", Key={"user_id": user_id})
             user_data = response.get("Item")
+            self.user_cache.set(user_id, user_data, generation)
 
             if user_data:
                 logger.info(f"Retrieved user: {user_id}")
-                return user_data
+                return dict(user_data)
             else:
                 logger.warning(f"User not found: {user_id}")
                 return None
@@ -448,11 +975,15 @@ class DatabaseManager:
             update_expression += "updated_at = :updated_at"
             expression_values[":updated_at"] = datetime.utcnow().isoformat()
 
-            self.user_table.update_item(
-                Key={"user_id": user_id},
-                UpdateExpression=update_expression,
-                ExpressionAttributeValues=expression_values
-            )
+            try:
+                await self._execute(self.user_table, "update_item",
+                    Key={"user_id": user_id},
+                    UpdateExpression=update_expression,
+                    ExpressionAttributeValues=expression_values
+                )
+            finally:
+                # Invalidate even if the call failed: the write may still have landed
+                self.user_cache.invalidate(user_id)
 
             logger.info(f"Updated user: {user_id}")
             return True
@@ -468,34 +999,9 @@ class DatabaseManager:
             return False
 
         try:
-            signal_item = DynamoDBSignal(
-                signal_id=signal_data["id"],
-                user_id=signal_data["user_id"],
-                name=signal_data["name"],
-                description=signal_data["description"],
-                timeframe=signal_data["timeframe"],
-                assets=signal_data["assets"],
-                entry=signal_data["entry"],
-                target=signal_data["target"],
-                stop_loss=signal_data["stop_loss"],
-                confidence=signal_data["confidence"],
-                status=signal_data.get("status", "active"),
-                performance=signal_data["performance"],
-                chart_data=signal_data["chart_data"],
-                created_at=datetime.utcnow().isoformat(),
-                updated_at=datetime.utcnow().isoformat(),
-                likes=signal_data.get("likes", 0),
-                comments=signal_data.get("comments", 0),
-                shares=signal_data.get("shares", 0)
-            )
-
-            # Convert floats to Decimal for DynamoDB compatibility
-            item_dict = prepare_item_for_dynamodb(signal_item.model_dump())
-            # Add item_id for the feed table primary key
-            item_dict["item_id"] = signal_data["id"]
-            item_dict["item_type"] = "signal"
+            item_dict = await self._prepare_feed_item(self._build_signal_item(signal_data), signal_data)
 
-            self.feed_table.put_item(Item=item_dict)
+            await self._put_feed_item(item_dict)
             logger.info(f"Created signal: {signal_data['id']}")
             return True
 
@@ -503,46 +1009,130 @@ class DatabaseManager:
             logger.error(f"Failed to create signal: {str(e)}")
             return False
 
-    async def get_signal(self, signal_id: str) -> Optional[Dict[str, Any]]:
-        """Get signal by ID"""
+    def _build_signal_item(self, signal_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate signal data and build the feed table item"""
+        signal_item = DynamoDBSignal(
+            signal_id=signal_data["id"],
+            user_id=signal_data["user_id"],
+            name=signal_data["name"],
+            description=signal_data["description"],
+            timeframe=signal_data["timeframe"],
+            assets=signal_data["assets"],
+            entry=signal_data["entry"],
+            target=signal_data["target"],
+            stop_loss=signal_data["stop_loss"],
+            confidence=signal_data["confidence"],
+            status=signal_data.get("status", "active"),
+            performance=signal_data["performance"],
+            chart_data=signal_data["chart_data"],
+            created_at=datetime.utcnow().isoformat(),
+            updated_at=datetime.utcnow().isoformat(),
+            likes=signal_data.get("likes", 0),
+            comments=signal_data.get("comments", 0),
+            shares=signal_data.get("shares", 0)
+        )
+
+        # Floats are kept as is; feed writes encode them with codec.serialize_item
+        item_dict = signal_item.model_dump()
+        # Add item_id for the feed table primary key
+        item_dict["item_id"] = signal_data["id"]
+        item_dict["item_type"] = "signal"
+        item_dict["feed_shard"] = feed_shard_for(signal_data["id"], self.feed_shard_count)
+        return item_dict
+
+    async def _prepare_feed_item(self, item_dict: Dict[str, Any], source: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Move heavy payloads to the blob store, leaving references (chart_ref,
+        trade_history_ref) and a chart preview on the item, then apply
+        CHART_STORAGE. Payloads are offloaded together or not at all: if the
+        blob store fails the full chart stays inline and, as without a blob
+        store, the trade history is not kept (nor counted in trade_count).
+        """
+        trade_history = source.get("trade_history")
+        if trade_history == []:
+            item_dict["trade_count"] = 0
+
+        if self.blob_store.enabled:
+            try:
+                refs = {}
+                chart_data = item_dict["chart_data"]
+                if chart_point_count(chart_data) > CHART_PREVIEW_POINTS:
+                    refs["chart_ref"] = await self.blob_store.put(encode_chart_blob(chart_data))
+                if trade_history:
+                    refs["trade_history_ref"] = await self.blob_store.put_json(trade_history)
+            except Exception as e:
+                # Blobs already written are unreferenced but harmless: they are content-addressed
+                logger.error(f"Failed to store payloads of {item_dict['item_id']} in the blob store: {str(e)}")
+            else:
+                if "chart_ref" in refs:
+                    item_dict["chart_data"] = downsample_chart(chart_data, CHART_PREVIEW_POINTS)
+                if "trade_history_ref" in refs:
+                    item_dict["trade_count"] = len(trade_history)
+                item_dict.update(refs)
+
+        return self._store_chart(item_dict)
+
+    def _store_chart(self, item_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Swap chart_data for its packed form when CHART_STORAGE=packed"""
+        if self.chart_storage == "packed":
+            packed = pack_chart(item_dict["chart_data"], precision=CHART_PRECISION)
+            # Charts the codec can't represent, or that are too short to gain, stay inline
+            if packed is not None and len(packed) < len(json.dumps(item_dict["chart_data"])):
+                item_dict["chart_packed"] = packed
+                del item_dict["chart_data"]
+        return item_dict
+
+    async def get_item(self, item_id: str, item_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a signal or backtest with a single read, whatever its type.
+        With item_type, items of another type count as not found.
+        """
         if not self.is_connected():
             return None
 
         try:
-            response = self.feed_table.get_item(Key={"item_id": signal_id})
-            signal_data = response.get("Item")
+            response = await self._execute_wire(self.feed_table, "get_item", Key={"item_id": {"S": item_id}})
+            # Decoded straight to floats for API responses
+            item = deserialize_item(response["Item"]) if "Item" in response else None
 
-            if signal_data and signal_data.get("item_type") == "signal":
-                logger.info(f"Retrieved signal: {signal_id}")
-                # Convert Decimal values back to float for API responses
-                return prepare_item_from_dynamodb(signal_data)
+            if item and item.get("item_type") in ("signal", "backtest") and item_type in (None, item["item_type"]):
+                await self._resolve_counter_shards([item])
+                logger.info(f"Retrieved {item['item_type']}: {item_id}")
+                return item
             else:
-                logger.warning(f"Signal not found: {signal_id}")
+                logger.warning(f"{item_type or 'Item'} not found: {item_id}")
                 return None
 
         except Exception as e:
-            logger.error(f"Failed to get signal {signal_id}: {str(e)}")
+            logger.error(f"Failed to get {item_type or 'item'} {item_id}: {str(e)}")
             return None
 
-    async def get_signals_by_user(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
-        """Get signals by user ID"""
+    async def get_signal(self, signal_id: str) -> Optional[Dict[str, Any]]:
+        """Get signal by ID"""
+        return await self.get_item(signal_id, "signal")
+
+    async def get_signals_by_user(self, user_id: str, limit: int = 50, projection: Union[str, List[str], None] = "full") -> List[Dict[str, Any]]:
+        """Get signals by user ID, reading only the attributes of `projection` (see FEED_PROJECTIONS)"""
         if not self.is_connected():
             return []
 
+        projection_fields = projection_params(resolve_projection(FEED_PROJECTIONS, projection), FEED_KEY_FIELDS)
+
         try:
             # For LocalStack, we'll use scan with filter (simpler approach)
             if self.use_localstack:
-                response = self.feed_table.scan(
+                response = await self._execute(self.feed_table, "scan",
                     FilterExpression="user_id = :user_id AND item_type = :item_type",
                     ExpressionAttributeValues={
                         ":user_id": user_id,
                         ":item_type": "signal"
                     },
-                    Limit=limit
+                    Limit=limit,
+                    **projection_fields
                 )
             else:
                 # Use GSI for production
-                response = self.feed_table.query(
+                response = await self._execute(self.feed_table, "query",
                     IndexName="user_id-index",
                     KeyConditionExpression="user_id = :user_id",
                     FilterExpression="item_type = :item_type",
@@ -550,13 +1140,14 @@ class DatabaseManager:
                         ":user_id": user_id,
                         ":item_type": "signal"
                     },
-                    Limit=limit
+                    Limit=limit,
+                    **projection_fields
                 )
 
             signals = response.get("Items", [])
             logger.info(f"Retrieved {len(signals)} signals for user: {user_id}")
             # Convert Decimal values back to float for API responses
-            return [prepare_item_from_dynamodb(signal) for signal in signals]
+            return await self._resolve_counter_shards([prepare_item_from_dynamodb(signal) for signal in signals])
 
         except Exception as e:
             logger.error(f"Failed to get signals for user {user_id}: {str(e)}")
@@ -569,34 +1160,9 @@ class DatabaseManager:
             return False
 
         try:
-            backtest_item = DynamoDBBacktest(
-                backtest_id=backtest_data["id"],
-                user_id=backtest_data["user_id"],
-                name=backtest_data["name"],
-                description=backtest_data["description"],
-                timeframe=backtest_data["timeframe"],
-                assets=backtest_data["assets"],
-                period=backtest_data["period"],
-                initial_capital=backtest_data["initial_capital"],
-                final_capital=backtest_data["final_capital"],
-                status=backtest_data.get("status", "active"),
-                performance=backtest_data["performance"],
-                chart_data=backtest_data["chart_data"],
-                strategy_config=backtest_data.get("strategy_config", {}),
-                created_at=datetime.utcnow().isoformat(),
-                updated_at=datetime.utcnow().isoformat(),
-                likes=backtest_data.get("likes", 0),
-                comments=backtest_data.get("comments", 0),
-                shares=backtest_data.get("shares", 0)
-            )
-
-            # Convert floats to Decimal for DynamoDB compatibility
-            item_dict = prepare_item_for_dynamodb(backtest_item.model_dump())
-            # Add item_id for the feed table primary key
-            item_dict["item_id"] = backtest_data["id"]
-            item_dict["item_type"] = "backtest"
+            item_dict = await self._prepare_feed_item(self._build_backtest_item(backtest_data), backtest_data)
 
-            self.feed_table.put_item(Item=item_dict)
+            await self._put_feed_item(item_dict)
             logger.info(f"Created backtest: {backtest_data['id']}")
             return True
 
@@ -604,46 +1170,63 @@ class DatabaseManager:
             logger.error(f"Failed to create backtest: {str(e)}")
             return False
 
+    def _build_backtest_item(self, backtest_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate backtest data and build the feed table item"""
+        backtest_item = DynamoDBBacktest(
+            backtest_id=backtest_data["id"],
+            user_id=backtest_data["user_id"],
+            name=backtest_data["name"],
+            description=backtest_data["description"],
+            timeframe=backtest_data["timeframe"],
+            assets=backtest_data["assets"],
+            period=backtest_data["period"],
+            initial_capital=backtest_data["initial_capital"],
+            final_capital=backtest_data["final_capital"],
+            status=backtest_data.get("status", "active"),
+            performance=backtest_data["performance"],
+            chart_data=backtest_data["chart_data"],
+            strategy_config=backtest_data.get("strategy_config", {}),
+            created_at=datetime.utcnow().isoformat(),
+            updated_at=datetime.utcnow().isoformat(),
+            likes=backtest_data.get("likes", 0),
+            comments=backtest_data.get("comments", 0),
+            shares=backtest_data.get("shares", 0)
+        )
+
+        # Floats are kept as is; feed writes encode them with codec.serialize_item
+        item_dict = backtest_item.model_dump()
+        # Add item_id for the feed table primary key
+        item_dict["item_id"] = backtest_data["id"]
+        item_dict["item_type"] = "backtest"
+        item_dict["feed_shard"] = feed_shard_for(backtest_data["id"], self.feed_shard_count)
+        return item_dict
+
     async def get_backtest(self, backtest_id: str) -> Optional[Dict[str, Any]]:
         """Get backtest by ID"""
-        if not self.is_connected():
-            return None
-
-        try:
-            response = self.feed_table.get_item(Key={"item_id": backtest_id})
-            backtest_data = response.get("Item")
-
-            if backtest_data and backtest_data.get("item_type") == "backtest":
-                logger.info(f"Retrieved backtest: {backtest_id}")
-                # Convert Decimal values back to float for API responses
-                return prepare_item_from_dynamodb(backtest_data)
-            else:
-                logger.warning(f"Backtest not found: {backtest_id}")
-                return None
-
-        except Exception as e:
-            logger.error(f"Failed to get backtest {backtest_id}: {str(e)}")
-            return None
+        return await self.get_item(backtest_id, "backtest")
 
-    async def get_backtests_by_user(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
-        """Get backtests by user ID"""
+    async def get_backtests_by_user(self, user_id: str, limit: int = 50, projection: Union[str, List[str], None] = "full") -> List[Dict[str, Any]]:
+        """Get backtests by user ID, reading only the attributes of `projection` (see FEED_PROJECTIONS)"""
         if not self.is_connected():
             return []
 
+        projection_fields = projection_params(resolve_projection(FEED_PROJECTIONS, projection), FEED_KEY_FIELDS)
+
         try:
             # For LocalStack, we'll use scan with filter (simpler approach)
             if self.use_localstack:
-                response = self.feed_table.scan(
+                response = await self._execute(self.feed_table, "scan",
                     FilterExpression="user_id = :user_id AND item_type = :item_type",
                     ExpressionAttributeValues={
                         ":user_id": user_id,
                         ":item_type": "backtest"
                     },
-                    Limit=limit
+                    Limit=limit,
+                    **projection_fields
                 )
             else:
                 # Use GSI for production
-                response = self.feed_table.query(
+                response = await self._execute(self.feed_table, "query",
                     IndexName="user_id-index",
                     KeyConditionExpression="user_id = :user_id",
                     FilterExpression="item_type = :item_type",
@@ -651,13 +1234,14 @@ class DatabaseManager:
                         ":user_id": user_id,
                         ":item_type": "backtest"
                     },
-                    Limit=limit
+                    Limit=limit,
+                    **projection_fields
                 )
 
             backtests = response.get("Items", [])
             logger.info(f"Retrieved {len(backtests)} backtests for user: {user_id}")
             # Convert Decimal values back to float for API responses
-            return [prepare_item_from_dynamodb(backtest) for backtest in backtests]
+            return await self._resolve_counter_shards([prepare_item_from_dynamodb(backtest) for backtest in backtests])
 
         except Exception as e:
             logger.error(f"Failed to get backtests for user {user_id}: {str(e)}")
@@ -685,20 +1269,23 @@ class DatabaseManager:
             # Remove trailing comma and space
             update_expression = update_expression.rstrip(", ")
 
-            # Add updated_at timestamp
-            update_expression += ", #updated_at = :updated_at"
+            # Add updated_at timestamp and bump the version (items created before it start at 1)
+            update_expression += ", #updated_at = :updated_at, #version = if_not_exists(#version, :one) + :one"
             expression_names["#updated_at"] = "updated_at"
+            expression_names["#version"] = "version"
             expression_values[":updated_at"] = datetime.utcnow().isoformat()
+            expression_values[":one"] = 1
 
             # Prepare item for DynamoDB (convert floats to Decimal)
             expression_values = prepare_item_for_dynamodb(expression_values)
 
-            self.feed_table.update_item(
+            await self._execute(self.feed_table, "update_item",
                 Key={"item_id": signal_id},
                 UpdateExpression=update_expression,
                 ExpressionAttributeNames=expression_names,
                 ExpressionAttributeValues=expression_values
             )
+            await self.feed_page_cache.invalidate()
 
             logger.info(f"Updated signal: {signal_id}")
             return True
@@ -729,20 +1316,23 @@ class DatabaseManager:
             # Remove trailing comma and space
             update_expression = update_expression.rstrip(", ")
 
-            # Add updated_at timestamp
-            update_expression += ", #updated_at = :updated_at"
+            # Add updated_at timestamp and bump the version (items created before it start at 1)
+            update_expression += ", #updated_at = :updated_at, #version = if_not_exists(#version, :one) + :one"
             expression_names["#updated_at"] = "updated_at"
+            expression_names["#version"] = "version"
             expression_values[":updated_at"] = datetime.utcnow().isoformat()
+            expression_values[":one"] = 1
 
             # Prepare item for DynamoDB (convert floats to Decimal)
             expression_values = prepare_item_for_dynamodb(expression_values)
 
-            self.feed_table.update_item(
+            await self._execute(self.feed_table, "update_item",
                 Key={"item_id": backtest_id},
                 UpdateExpression=update_expression,
                 ExpressionAttributeNames=expression_names,
                 ExpressionAttributeValues=expression_values
             )
+            await self.feed_page_cache.invalidate()
 
             logger.info(f"Updated backtest: {backtest_id}")
             return True
@@ -751,59 +1341,343 @@ class DatabaseManager:
             logger.error(f"Failed to update backtest {backtest_id}: {str(e)}")
             return False
 
+    # Feed Counter Operations
+    def _counter_actions(self, item: Dict[str, Any], delta: int) -> List[Dict[str, Any]]:
+        """TransactWriteItems actions (wire format) adjusting every counter an item contributes to"""
+        now = datetime.utcnow().isoformat()
+        return [
+            {
+                "Update": {
+                    "TableName": self.counters_table_name,
+                    "Key": {"counter_id": {"S": counter_id}},
+                    "UpdateExpression": "ADD item_count :delta SET updated_at = :updated_at",
+                    "ExpressionAttributeValues": {
+                        ":delta": {"N": str(delta)},
+                        ":updated_at": {"S": now}
+                    }
+                }
+            }
+            for counter_id in feed_counter_keys(item)
+        ]
+
+    async def _transact_write(self, actions: List[Dict[str, Any]]):
+        """
+        Run wire-format TransactWriteItems on the feed executor. Cancellations
+        caused by a conflicting concurrent transaction are retried with
+        jittered exponential backoff; any other cancellation is raised.
+        """
+        client = self._client_for(self.feed_table_name)
+        for attempt in range(TRANSACTION_CONFLICT_ATTEMPTS):
+            try:
+                return await self._run(self.feed_table_name, client.transact_write_items, TransactItems=actions)
+            except ClientError as e:
+                reasons = [reason.get("Code") for reason in e.response.get("CancellationReasons", [])]
+                conflict = e.response['Error']['Code'] == 'TransactionCanceledException' and "TransactionConflict" in reasons
+                # A failed condition is a real outcome for the caller, even alongside a conflict
+                if not conflict or "ConditionalCheckFailed" in reasons or attempt == TRANSACTION_CONFLICT_ATTEMPTS - 1:
+                    raise e
+                await asyncio.sleep(random.uniform(0, min(1.0, 0.02 * (2 ** attempt))))
+
+    async def _put_feed_item(self, item_dict: Dict[str, Any]):
+        """Write a new feed item and bump its feed counters atomically"""
+        wire_item = serialize_item(item_dict)
+        if self.counters_table is None:
+            await self._execute_wire(self.feed_table, "put_item", Item=wire_item)
+            await self.feed_page_cache.invalidate()
+            return
+
+        try:
+            await self._transact_write([
+                {
+                    "Put": {
+                        "TableName": self.feed_table_name,
+                        "Item": wire_item,
+                        "ConditionExpression": "attribute_not_exists(item_id)"
+                    }
+                },
+                *self._counter_actions(item_dict, 1)
+            ])
+        except ClientError as e:
+            reasons = [reason.get("Code") for reason in e.response.get("CancellationReasons", [])]
+            if e.response['Error']['Code'] == 'TransactionCanceledException' and reasons[:1] == ["ConditionalCheckFailed"]:
+                # Re-writing an existing item: overwrite it without counting it twice
+                await self._execute_wire(self.feed_table, "put_item", Item=wire_item)
+            else:
+                raise e
+        await self.feed_page_cache.invalidate()
+
+    async def get_feed_count(self, filters: Dict[str, Any] = None) -> Optional[int]:
+        """
+        Number of feed items matching the filters, read from a single counter item.
+        None if the combination was never counted, so the caller counts the index.
+        """
+        if not self.is_connected() or self.counters_table is None:
+            return None
+
+        try:
+            response = await self._execute(self.counters_table, "get_item",
+                Key={"counter_id": feed_counter_key(filters)},
+                ProjectionExpression="item_count"
+            )
+            if "Item" not in response:
+                return None
+            return max(0, int(response["Item"].get("item_count", 0)))
+
+        except Exception as e:
+            logger.error(f"Failed to get feed count for {filters}: {str(e)}")
+            return None
+
+    async def reconcile_feed_counters(self) -> Dict[str, int]:
+        """
+        Recount the feed table and repair counters that drifted.
+
+        Counters are snapshotted first and only overwritten if they did not
+        change while the feed was being recounted; anything skipped is picked
+        up by the next run.
+        """
+        if not self.is_connected() or self.counters_table is None:
+            return {"checked": 0, "repaired": 0, "skipped": 0}
+
+        # Snapshot current counter values
+        observed = {}
+        async for counter in self.parallel_scan(self.counters_table,
+            FilterExpression="begins_with(counter_id, :prefix)",
+            ExpressionAttributeValues={":prefix": "feed|"}
+        ):
+            observed[counter["counter_id"]] = int(counter.get("item_count", 0))
+
+        # Recount from the feed items themselves
+        actual = {}
+        async for item in self.parallel_scan(self.feed_table,
+            ProjectionExpression="item_id, item_type, timeframe, user_id",
+            FilterExpression="item_type IN (:signal, :backtest)",
+            ExpressionAttributeValues={":signal": "signal", ":backtest": "backtest"}
+        ):
+            for counter_id in feed_counter_keys(item):
+                actual[counter_id] = actual.get(counter_id, 0) + 1
+        actual.setdefault(feed_counter_key(), 0)
+
+        repaired = skipped = 0
+        for counter_id in set(observed) | set(actual):
+            expected = actual.get(counter_id, 0)
+            if observed.get(counter_id) == expected:
+                continue
+
+            condition_values = {":expected": expected, ":updated_at": datetime.utcnow().isoformat()}
+            if counter_id in observed:
+                condition = "item_count = :observed"
+                condition_values[":observed"] = observed[counter_id]
+            else:
+                condition = "attribute_not_exists(counter_id)"
+
+            try:
+                await self._execute(self.counters_table, "update_item",
+                    Key={"counter_id": counter_id},
+                    UpdateExpression="SET item_count = :expected, updated_at = :updated_at",
+                    ConditionExpression=condition,
+                    ExpressionAttributeValues=condition_values
+                )
+                logger.info(f"Repaired counter {counter_id}: {observed.get(counter_id)} -> {expected}")
+                repaired += 1
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                    raise e
+                logger.warning(f"Counter {counter_id} changed during reconcile, skipping")
+                skipped += 1
+
+        return {"checked": len(set(observed) | set(actual)), "repaired": repaired, "skipped": skipped}
+
     # Feed Operations
-    async def get_feed_items(self, page: int = 1, limit: int = 10, filters: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Get paginated feed items with optional filters"""
+    def _build_feed_filter(self, filters: Dict[str, Any] = None):
+        """Build the filter expression shared by feed queries and scans"""
+        conditions = []
+        expression_values = {}
+
+        if filters:
+            if filters.get("type"):
+                conditions.append("item_type = :item_type")
+                expression_values[":item_type"] = filters["type"]
+
+            if filters.get("timeframe"):
+                conditions.append("timeframe = :timeframe")
+                expression_values[":timeframe"] = filters["timeframe"]
+
+            if filters.get("user_id"):
+                conditions.append("user_id = :user_id")
+                expression_values[":user_id"] = filters["user_id"]
+
+        filter_expression = " AND ".join(conditions) if conditions else None
+        return filter_expression, expression_values
+
+    async def get_feed_items(self, page: int = 1, limit: int = 10, filters: Dict[str, Any] = None, cursor: Optional[str] = None,
+                             projection: Union[str, List[str], None] = "full") -> Dict[str, Any]:
+        """
+        Get feed items newest first.
+
+        Pages are read from the time-ordered feed index, touching only about
+        `limit` items per shard. Pass the returned next_cursor back as `cursor`
+        to continue; `page` without a cursor is kept for older clients and walks
+        forward from the start of the feed. Only the attributes of `projection`
+        are read (see FEED_PROJECTIONS). Raises ValueError on a bad cursor or
+        an unknown projection.
+        """
         if not self.is_connected():
             return self._empty_feed_response()
 
+        positions = decode_feed_cursor(cursor) if cursor else {}
+        fields = resolve_projection(FEED_PROJECTIONS, projection)
+
+        if not self._feed_index_available:
+            return await self._scan_feed_items(page, limit, filters, fields)
+
         try:
-            # Build scan parameters - scan all items first for proper pagination
-            scan_params = {}
+            filter_expression, expression_values = self._build_feed_filter(filters)
+
+            if not cursor and page > 1:
+                # Compatibility shim for page/offset clients: skip earlier pages
+                # reading only the index keys of the skipped items
+                for _ in range(page - 1):
+                    _, positions = await self._read_feed_page(
+                        positions, limit, filter_expression, expression_values, keys_only=True
+                    )
+                    if all(position == 0 for position in positions.values()):
+                        break
 
-            # Apply filters
-            filter_expression = None
-            expression_values = {}
+            page_items, next_positions = await self._read_feed_page(
+                positions, limit, filter_expression, expression_values, fields=fields
+            )
+            await self._resolve_counter_shards(page_items)
+            has_more = any(position != 0 for position in next_positions.values())
+            next_cursor = encode_feed_cursor(next_positions) if has_more else None
 
-            if filters:
-                if filters.get("type"):
-                    filter_expression = "item_type = :item_type"
-                    expression_values[":item_type"] = filters["type"]
+            total_items = await self.get_feed_count(filters)
+            if total_items is None:
+                total_items = await self._count_feed_items(filter_expression, expression_values)
+            total_pages = (total_items + limit - 1) // limit if total_items > 0 else 1
 
-                if filters.get("timeframe"):
-                    if filter_expression:
-                        filter_expression += " AND "
-                    else:
-                        filter_expression = ""
-                    filter_expression += "timeframe = :timeframe"
-                    expression_values[":timeframe"] = filters["timeframe"]
+            logger.info(f"Retrieved {len(page_items)} feed items from index (page {page}, total: {total_items})")
 
-                if filters.get("user_id"):
-                    if filter_expression:
-                        filter_expression += " AND "
-                    else:
-                        filter_expression = ""
-                    filter_expression += "user_id = :user_id"
-                    expression_values[":user_id"] = filters["user_id"]
+            return {
+                "items": page_items,
+                "total_items": total_items,
+                "current_page": page,
+                "total_pages": total_pages,
+                "has_next_page": next_cursor is not None,
+                "page_size": limit,
+                "next_cursor": next_cursor
+            }
 
-            if filter_expression:
-                scan_params["FilterExpression"] = filter_expression
-                scan_params["ExpressionAttributeValues"] = expression_values
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code in ('ValidationException', 'ResourceNotFoundException') and 'index' in str(e).lower():
+                logger.warning(f"Feed index {FEED_INDEX_NAME} not found on {self.feed_table_name}, falling back to table scans")
+                self._feed_index_available = False
+                return await self._scan_feed_items(page, limit, filters, fields)
+            logger.error(f"Failed to get feed items: {str(e)}")
+            return self._empty_feed_response()
+        except Exception as e:
+            logger.error(f"Failed to get feed items: {str(e)}")
+            return self._empty_feed_response()
 
-            # Scan all items from feed table
-            all_items = []
-            last_evaluated_key = None
+    async def _read_feed_shard(self, shard: str, start_key: Optional[Dict[str, Any]], limit: int, filter_expression: Optional[str], expression_values: Dict[str, Any], keys_only: bool = False, fields: Optional[tuple] = None):
+        """Read at least `limit` matching items (if available) from one feed shard, newest first"""
+        query_params = {
+            "IndexName": FEED_INDEX_NAME,
+            "KeyConditionExpression": "feed_shard = :feed_shard",
+            "ExpressionAttributeValues": serialize_item({":feed_shard": shard, **expression_values}),
+            "ScanIndexForward": False,
+            "Limit": limit
+        }
+        if filter_expression:
+            query_params["FilterExpression"] = filter_expression
+        if keys_only:
+            query_params["ProjectionExpression"] = "item_id, feed_shard, created_at"
+        else:
+            query_params.update(projection_params(fields, FEED_KEY_FIELDS))
+
+        # Read in wire format and decode each item once, straight to API floats
+        items = []
+        last_key = start_key
+        while len(items) < limit:
+            if last_key:
+                query_params["ExclusiveStartKey"] = serialize_item(last_key)
+            response = await self._execute_wire(self.feed_table, "query", **query_params)
+            items.extend(deserialize_item(item) for item in response.get("Items", []))
+            last_key = deserialize_item(response["LastEvaluatedKey"]) if response.get("LastEvaluatedKey") else None
+            if not last_key:
+                break
+
+        return items, last_key
+
+    async def _read_feed_page(self, positions: Dict[str, Any], limit: int, filter_expression: Optional[str], expression_values: Dict[str, Any], keys_only: bool = False, fields: Optional[tuple] = None):
+        """Merge the newest items across all feed shards into one page"""
+        shards = [f"feed#{n}" for n in range(self.feed_shard_count)]
+        active_shards = [shard for shard in shards if positions.get(shard) != 0]
+
+        reads = await asyncio.gather(*[
+            self._read_feed_shard(shard, positions.get(shard), limit, filter_expression, expression_values, keys_only, fields)
+            for shard in active_shards
+        ])
+
+        candidates = []
+        for shard, (items, _) in zip(active_shards, reads):
+            candidates.extend((item.get("created_at", ""), item["item_id"], shard, item) for item in items)
+        candidates.sort(key=lambda candidate: (candidate[0], candidate[1]), reverse=True)
+        page = candidates[:limit]
+
+        consumed = {}
+        for _, _, shard, item in page:
+            consumed.setdefault(shard, []).append(item)
+
+        # Shards with no position yet (None) have not been read past their newest item
+        next_positions = {shard: positions.get(shard) for shard in shards}
+        for shard, (items, last_key) in zip(active_shards, reads):
+            used = consumed.get(shard, [])
+            if len(used) == len(items):
+                # Everything read from this shard was used; resume where the read stopped
+                next_positions[shard] = last_key if last_key else 0
+            elif used:
+                next_positions[shard] = feed_index_key(used[-1])
+
+        return [item for _, _, _, item in page], next_positions
+
+    async def _count_feed_items(self, filter_expression: Optional[str], expression_values: Dict[str, Any]) -> int:
+        """Count matching feed items across all shards of the feed index"""
+        async def count_shard(shard: str) -> int:
+            query_params = {
+                "IndexName": FEED_INDEX_NAME,
+                "KeyConditionExpression": "feed_shard = :feed_shard",
+                "ExpressionAttributeValues": {":feed_shard": shard, **expression_values},
+                "Select": "COUNT"
+            }
+            if filter_expression:
+                query_params["FilterExpression"] = filter_expression
 
+            count = 0
             while True:
-                if last_evaluated_key:
-                    scan_params["ExclusiveStartKey"] = last_evaluated_key
+                response = await self._execute(self.feed_table, "query", **query_params)
+                count += response.get("Count", 0)
+                if not response.get("LastEvaluatedKey"):
+                    return count
+                query_params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
 
-                response = self.feed_table.scan(**scan_params)
-                all_items.extend(response.get("Items", []))
+        counts = await asyncio.gather(*[count_shard(f"feed#{n}") for n in range(self.feed_shard_count)])
+        return sum(counts)
 
-                last_evaluated_key = response.get("LastEvaluatedKey")
-                if not last_evaluated_key:
-                    break
+    async def _scan_feed_items(self, page: int = 1, limit: int = 10, filters: Dict[str, Any] = None, fields: Optional[tuple] = None) -> Dict[str, Any]:
+        """Legacy feed read for tables without the feed index: full scan, sort and slice"""
+        try:
+            # Build scan parameters - scan all items first for proper pagination
+            scan_params = projection_params(fields, FEED_KEY_FIELDS)
+
+            # Apply filters
+            filter_expression, expression_values = self._build_feed_filter(filters)
+            if filter_expression:
+                scan_params["FilterExpression"] = filter_expression
+                scan_params["ExpressionAttributeValues"] = expression_values
+
+            # Scan all items from feed table
+            all_items = [item async for item in self.parallel_scan(self.feed_table, **scan_params)]
 
             # Sort by created_at (newest first)
             all_items.sort(key=lambda x: x.get('created_at', ''), reverse=True)
@@ -820,7 +1694,7 @@ class DatabaseManager:
             logger.info(f"Retrieved {len(paginated_items)} feed items (page {page}/{total_pages}, total: {total_items})")
 
             # Convert Decimal values back to float for API responses
-            converted_items = [prepare_item_from_dynamodb(item) for item in paginated_items]
+            converted_items = await self._resolve_counter_shards([prepare_item_from_dynamodb(item) for item in paginated_items])
 
             return {
                 "items": converted_items,
@@ -828,13 +1702,79 @@ class DatabaseManager:
                 "current_page": page,
                 "total_pages": total_pages,
                 "has_next_page": page < total_pages,
-                "page_size": limit
+                "page_size": limit,
+                "next_cursor": None
             }
 
         except Exception as e:
             logger.error(f"Failed to get feed items: {str(e)}")
             return self._empty_feed_response()
 
+    async def backfill_feed_shards(self) -> int:
+        """Assign a feed index shard to items created before the feed index existed"""
+        if not self.is_connected():
+            return 0
+
+        updated = 0
+        async for item in self.parallel_scan(self.feed_table,
+            ProjectionExpression="item_id, feed_shard",
+            FilterExpression="attribute_not_exists(feed_shard) AND attribute_exists(created_at)"
+        ):
+            await self._execute(self.feed_table, "update_item",
+                Key={"item_id": item["item_id"]},
+                UpdateExpression="SET feed_shard = :feed_shard",
+                ExpressionAttributeValues={":feed_shard": feed_shard_for(item["item_id"], self.feed_shard_count)}
+            )
+            updated += 1
+
+        logger.info(f"Backfilled feed shard on {updated} items")
+        return updated
+
+    async def convert_feed_charts(self, packed: bool = True, precision: str = CHART_PRECISION) -> Dict[str, int]:
+        """
+        Rewrite existing feed items into packed chart storage, or back to inline
+        chart_data when packed is False. Items that were converted concurrently
+        or can't be packed are skipped.
+        """
+        if not self.is_connected():
+            return {"converted": 0, "skipped": 0}
+
+        source, target = ("chart_data", "chart_packed") if packed else ("chart_packed", "chart_data")
+        converted = 0
+        skipped = 0
+        async for item in self.parallel_scan(self.feed_table,
+            ProjectionExpression=f"item_id, {source}",
+            FilterExpression=f"attribute_exists({source})"
+        ):
+            if packed:
+                chart_data = prepare_item_from_dynamodb(item[source])
+                value = pack_chart(chart_data, precision=precision)
+                if value is not None and len(value) >= len(json.dumps(chart_data)):
+                    value = None
+            else:
+                value = prepare_item_for_dynamodb(unpack_chart(item[source]))
+            if value is None:
+                skipped += 1
+                continue
+
+            try:
+                await self._execute(self.feed_table, "update_item",
+                    Key={"item_id": item["item_id"]},
+                    UpdateExpression=f"SET {target} = :value REMOVE {source}",
+                    ConditionExpression=f"attribute_exists({source})",
+                    ExpressionAttributeValues={":value": value}
+                )
+                converted += 1
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+                skipped += 1
+
+        if converted:
+            await self.feed_page_cache.invalidate()
+        logger.info(f"Converted chart storage on {converted} items ({skipped} skipped)")
+        return {"converted": converted, "skipped": skipped}
+
     def _empty_feed_response(self) -> Dict[str, Any]:
         """Return empty feed response"""
         return {
@@ -843,17 +1783,112 @@ class DatabaseManager:
             "current_page": 1,
             "total_pages": 0,
             "has_next_page": False,
-            "page_size": 10
+            "page_size": 10,
+            "next_cursor": None
         }
 
+    # Item Payload Operations
+    async def get_chart_data(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """Full chart of a feed item, loading it from the blob store when it was offloaded"""
+        if not self.is_connected():
+            return None
+
+        try:
+            response = await self._execute_wire(self.feed_table, "get_item",
+                Key={"item_id": {"S": item_id}},
+                ProjectionExpression="item_id, chart_data, chart_packed, chart_ref"
+            )
+            if "Item" not in response:
+                return None
+            return await self.resolve_chart_data(deserialize_item(response["Item"]))
+
+        except Exception as e:
+            logger.error(f"Failed to get chart data for {item_id}: {str(e)}")
+            return None
+
+    async def resolve_chart_data(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Full chart of a feed item already read, loading it from the blob store when it was offloaded"""
+        if item.get("chart_ref"):
+            chart_data = await self.blob_store.get_decoded(item["chart_ref"], decode_chart_blob)
+            if chart_data is not None:
+                return chart_data
+            logger.warning(f"Chart blob {item['chart_ref']} of {item['item_id']} is missing - serving the preview")
+        return chart_data_of(item)
+
+    async def get_trade_history(self, item_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Trade history of a feed item ([] if it has none), or None if the item doesn't exist"""
+        if not self.is_connected():
+            return None
+
+        try:
+            response = await self._execute_wire(self.feed_table, "get_item",
+                Key={"item_id": {"S": item_id}},
+                ProjectionExpression="item_id, trade_history_ref"
+            )
+            if "Item" not in response:
+                return None
+            item = deserialize_item(response["Item"])
+
+            if not item.get("trade_history_ref"):
+                return []
+            trades = await self.blob_store.get_json(item["trade_history_ref"])
+            if trades is None:
+                logger.warning(f"Trade history blob {item['trade_history_ref']} of {item_id} is missing")
+                return []
+            return trades
+
+        except Exception as e:
+            logger.error(f"Failed to get trade history for {item_id}: {str(e)}")
+            return None
+
     # Utility Operations
     async def delete_item(self, item_id: str, item_type: str) -> bool:
         """Delete an item by ID and type"""
         if not self.is_connected():
             return False
 
+        self.counted_items.invalidate(item_id)
         try:
-            self.feed_table.delete_item(Key={"item_id": item_id})
+            if self.counters_table is None:
+                await self._execute(self.feed_table, "delete_item", Key={"item_id": item_id})
+                await self.feed_page_cache.invalidate()
+                logger.info(f"Deleted {item_type}: {item_id}")
+                return True
+
+            response = await self._execute(self.feed_table, "get_item",
+                Key={"item_id": item_id},
+                ProjectionExpression="item_id, item_type, timeframe, user_id, counter_shards"
+            )
+            existing = response.get("Item")
+            if not existing:
+                logger.info(f"{item_type} {item_id} already deleted")
+                return True
+
+            # Delete the item, its engagement counter shards and decrement its
+            # feed counters in one transaction; shards that don't fit follow
+            actions = [
+                {
+                    "Delete": {
+                        "TableName": self.feed_table_name,
+                        "Key": {"item_id": {"S": item_id}},
+                        "ConditionExpression": "attribute_exists(item_id)"
+                    }
+                },
+                *self._counter_actions(existing, -1)
+            ]
+            shard_keys = [counter_shard_key(item_id, shard) for shard in range(int(existing.get("counter_shards", 0)))]
+            room = TRANSACT_WRITE_MAX_ITEMS - len(actions)
+            actions += [
+                {"Delete": {"TableName": self.counters_table_name, "Key": {"counter_id": {"S": counter_id}}}}
+                for counter_id in shard_keys[:room]
+            ]
+            await self._transact_write(actions)
+            if shard_keys[room:]:
+                await self._delete_counter_rows(shard_keys[room:])
+            if shard_keys:
+                self.counter_shards.invalidate(item_id)
+                self.counter_reader.invalidate(item_id, len(shard_keys))
+            await self.feed_page_cache.invalidate()
             logger.info(f"Deleted {item_type}: {item_id}")
             return True
 
@@ -861,62 +1896,309 @@ class DatabaseManager:
             logger.error(f"Failed to delete {item_type} {item_id}: {str(e)}")
             return False
 
-    async def update_item_likes(self, item_id: str, item_type: str, increment: int = 1) -> bool:
-        """Update item likes count"""
-        if not self.is_connected():
-            return False
+    async def _delete_counter_rows(self, counter_ids: List[str]):
+        """Delete counters table rows with BatchWriteItem, retrying unprocessed deletes"""
+        client = self._client_for(self.counters_table_name)
+        for start in range(0, len(counter_ids), BATCH_WRITE_MAX_ITEMS):
+            request_items = {self.counters_table_name: [
+                {"DeleteRequest": {"Key": {"counter_id": {"S": counter_id}}}}
+                for counter_id in counter_ids[start:start + BATCH_WRITE_MAX_ITEMS]
+            ]}
+            for attempt in range(4):
+                response = await self._run(self.counters_table_name, client.batch_write_item, RequestItems=request_items)
+                request_items = response.get("UnprocessedItems") or {}
+                if not request_items:
+                    break
+                await asyncio.sleep(random.uniform(0, min(5.0, 0.05 * (2 ** attempt))))
+            if request_items:
+                logger.warning(f"Could not delete {len(request_items[self.counters_table_name])} counter rows")
+
+    async def _write_item_counters(self, item_id: str, deltas: Dict[str, int]):
+        """Apply like/comment/share deltas to an item, or one of its shards, in one ADD update"""
+        deltas = {counter: delta for counter, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        update = {
+            "UpdateExpression": "ADD " + ", ".join(f"#{counter} :{counter}" for counter in deltas),
+            "ExpressionAttributeNames": {f"#{counter}": counter for counter in deltas},
+            "ExpressionAttributeValues": {f":{counter}": delta for counter, delta in deltas.items()}
+        }
+
+        shard_count = self.counter_shards.get(item_id)
+        if shard_count is not MISSING and self.counters_table is not None:
+            # Shard rows are created on first write; no existence check on the item
+            await self._execute(self.counters_table, "update_item",
+                Key={"counter_id": random_counter_shard(item_id, shard_count)}, **update
+            )
+            self.counter_reader.invalidate(item_id, shard_count)
+            return
 
         try:
-            self.feed_table.update_item(
+            await self._execute(self.feed_table, "update_item",
                 Key={"item_id": item_id},
-                UpdateExpression="SET likes = likes + :increment",
-                ExpressionAttributeValues={":increment": increment}
+                ConditionExpression="attribute_exists(item_id)",
+                **update
             )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                raise ItemNotFound(item_id)
+            raise
 
-            logger.info(f"Updated {item_type} {item_id} likes by {increment}")
-            return True
-
+    async def _promote_counter_item(self, item_id: str):
+        """Switch a hot item to sharded counters, or learn the shard count another process set"""
+        try:
+            await self._execute(self.feed_table, "update_item",
+                Key={"item_id": item_id},
+                UpdateExpression="SET counter_shards = :shards",
+                ConditionExpression="attribute_exists(item_id) AND attribute_not_exists(counter_shards)",
+                ExpressionAttributeValues={":shards": COUNTER_SHARDS}
+            )
+            self.counter_shards.set(item_id, COUNTER_SHARDS)
+            logger.info(f"Promoted {item_id} to {COUNTER_SHARDS} counter shards")
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            response = await self._execute(self.feed_table, "get_item",
+                Key={"item_id": item_id}, ProjectionExpression="counter_shards"
+            )
+            shard_count = response.get("Item", {}).get("counter_shards")
+            if shard_count:
+                self.counter_shards.set(item_id, int(shard_count))
+
+    async def _fetch_counter_shards(self, counter_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        if self.counters_table is None:
+            return {}
+        return await self._batch_get(self.counters_table, "counter_id", counter_ids, number=float)
+
+    async def _resolve_counter_shards(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fold counter shards into the likes/comments/shares of items read from the feed table"""
+        for item in items:
+            if item.get("counter_shards"):
+                self.counter_shards.set(item["item_id"], int(item["counter_shards"]))
+        try:
+            return await self.counter_reader.apply(items)
         except Exception as e:
-            logger.error(f"Failed to update {item_type} {item_id} likes: {str(e)}")
-            return False
-
-    async def update_item_comments(self, item_id: str, item_type: str, increment: int = 1) -> bool:
-        """Update item comments count"""
+            # Fall back to the item's own counts rather than failing the read
+            logger.error(f"Failed to read counter shards: {str(e)}")
+            for item in items:
+                item.pop("counter_shards", None)
+            return items
+
+    async def _update_item_counter(self, item_id: str, item_type: str, counter: str, increment: int) -> bool:
+        """Count a like/comment/share, through the write buffer when it is enabled"""
         if not self.is_connected():
             return False
 
         try:
-            self.feed_table.update_item(
-                Key={"item_id": item_id},
-                UpdateExpression="SET comments = comments + :increment",
-                ExpressionAttributeValues={":increment": increment}
-            )
+            if (self.hot_items is not None and self.counters_table is not None
+                    and self.hot_items.record(item_id) and self.counter_shards.get(item_id) is MISSING):
+                try:
+                    await self._promote_counter_item(item_id)
+                except Exception as e:
+                    logger.error(f"Failed to shard counters of {item_type} {item_id}: {str(e)}")
+
+            if self.counter_buffer is not None:
+                if not await self._counted_item_exists(item_id):
+                    logger.warning(f"Not counting {counter} on missing {item_type} {item_id}")
+                    return False
+                await self.counter_buffer.add(item_id, counter, increment)
+                logger.debug(f"Buffered {counter} +{increment} on {item_type} {item_id}")
+                return True
 
-            logger.info(f"Updated {item_type} {item_id} comments by {increment}")
+            await self._write_item_counters(item_id, {counter: increment})
+            await self.feed_page_cache.invalidate()
+            logger.info(f"Updated {item_type} {item_id} {counter} by {increment}")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to update {item_type} {item_id} comments: {str(e)}")
+            logger.error(f"Failed to update {item_type} {item_id} {counter}: {str(e)}")
             return False
 
+    async def _counted_item_exists(self, item_id: str) -> bool:
+        """Whether a feed item exists, from a key-only read cached per item"""
+        exists = self.counted_items.get(item_id)
+        if exists is MISSING:
+            response = await self._execute(self.feed_table, "get_item",
+                Key={"item_id": item_id}, ProjectionExpression="item_id")
+            exists = True if "Item" in response else None
+            self.counted_items.set(item_id, exists)
+        return bool(exists)
+
+    async def update_item_likes(self, item_id: str, item_type: str, increment: int = 1) -> bool:
+        """Update item likes count"""
+        return await self._update_item_counter(item_id, item_type, "likes", increment)
+
+    async def update_item_comments(self, item_id: str, item_type: str, increment: int = 1) -> bool:
+        """Update item comments count"""
+        return await self._update_item_counter(item_id, item_type, "comments", increment)
+
     async def update_item_shares(self, item_id: str, item_type: str, increment: int = 1) -> bool:
         """Update item shares count"""
+        return await self._update_item_counter(item_id, item_type, "shares", increment)
+
+    # Bulk Operations
+    async def _batch_write(self, table, key_name: str, items: List[Dict[str, Any]], max_retries: int = 8) -> Dict[str, Any]:
+        """
+        Put items with BatchWriteItem, BATCH_WRITE_CONCURRENCY batches of 25 at a time.
+
+        UnprocessedItems are retried with jittered exponential backoff. Returns the
+        written keys and a {key: reason} map of items that could not be written.
+        """
+        # A batch may not contain the same key twice; the last version of an item wins
+        unique_items = list({item[key_name]: item for item in items}.values())
+        batches = [unique_items[start:start + BATCH_WRITE_MAX_ITEMS] for start in range(0, len(unique_items), BATCH_WRITE_MAX_ITEMS)]
+        semaphore = asyncio.Semaphore(BATCH_WRITE_CONCURRENCY)
+        client = self._client_for(table.name)
+        written = []
+        failed = {}
+
+        async def write_batch(batch: List[Dict[str, Any]]):
+            async with semaphore:
+                try:
+                    request_items = {table.name: [{"PutRequest": {"Item": serialize_item(item)}} for item in batch]}
+                except Exception as e:
+                    for item in batch:
+                        failed[item[key_name]] = str(e)
+                    return
+                # Keys not written yet: the whole batch, then each response's UnprocessedItems
+                unprocessed = {item[key_name] for item in batch}
+                error = None
+                try:
+                    for attempt in range(max_retries + 1):
+                        response = await self._run(table.name, client.batch_write_item, RequestItems=request_items)
+                        request_items = response.get("UnprocessedItems") or {}
+                        unprocessed = {request["PutRequest"]["Item"][key_name]["S"] for request in request_items.get(table.name, [])}
+                        if not request_items or attempt == max_retries:
+                            break
+                        await asyncio.sleep(random.uniform(0, min(5.0, 0.05 * (2 ** attempt))))
+                except Exception as e:
+                    # Items written by earlier attempts stay written
+                    error = str(e)
+
+                for item in batch:
+                    if item[key_name] in unprocessed:
+                        failed[item[key_name]] = error or f"Still unprocessed after {max_retries} retries"
+                    else:
+                        written.append(item[key_name])
+
+        await asyncio.gather(*[write_batch(batch) for batch in batches])
+        return {"written": written, "failed": failed}
+
+    async def _bulk_create(self, kind: str, table, key_name: str, source_key: str, records: List[Dict[str, Any]], build, prepare=None) -> Dict[str, Any]:
+        """
+        Build items from records, write them in batches and report per-item failures.
+        prepare, if given, is awaited as prepare(item, record) on every built item.
+        """
         if not self.is_connected():
-            return False
+            return {"written": [], "failed": {record.get(source_key): "Database not available" for record in records}}
 
-        try:
-            self.feed_table.update_item(
-                Key={"item_id": item_id},
-                UpdateExpression="SET shares = shares + :increment",
-                ExpressionAttributeValues={":increment": increment}
-            )
+        items = []
+        failed = {}
+        for record in records:
+            try:
+                items.append(build(record))
+            except Exception as e:
+                failed[record.get(source_key)] = f"Invalid {kind}: {str(e)}"
+
+        if prepare is not None:
+            sources = {record.get(source_key): record for record in records}
+            prepared = await asyncio.gather(*[prepare(item, sources[item[key_name]]) for item in items], return_exceptions=True)
+            items_to_write = []
+            for item, outcome in zip(items, prepared):
+                if isinstance(outcome, Exception):
+                    failed[item[key_name]] = f"Failed to prepare {kind}: {str(outcome)}"
+                else:
+                    items_to_write.append(outcome)
+            items = items_to_write
+
+        result = await self._batch_write(table, key_name, items)
+        result["failed"].update(failed)
+        logger.info(f"Bulk created {len(result['written'])} {kind}s ({len(result['failed'])} failed)")
+        return result
+
+    async def create_users_bulk(self, users: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create many users with BatchWriteItem"""
+        result = await self._bulk_create("user", self.user_table, "user_id", "id", users, self._build_user_item)
+        for user_id in result["written"]:
+            self.user_cache.invalidate(user_id)
+        return result
+
+    async def _create_feed_items_bulk(self, kind: str, records: List[Dict[str, Any]], build) -> Dict[str, Any]:
+        """
+        Create many feed items with BatchWriteItem.
+
+        Batch writes cannot be conditional or transactional, so feed counters are
+        bumped afterwards with one aggregated ADD per counter. Re-importing items
+        that already exist over-counts them; run reconcile-counters after such a backfill.
+        """
+        items_by_id = {}
+
+        def build_and_remember(record):
+            item = build(record)
+            items_by_id[item["item_id"]] = item
+            return item
+
+        result = await self._bulk_create(kind, self.feed_table, "item_id", "id", records, build_and_remember,
+            prepare=self._prepare_feed_item)
+        if result["written"]:
+            await self._apply_counter_deltas([items_by_id[item_id] for item_id in result["written"]])
+            await self.feed_page_cache.invalidate()
+        return result
+
+    async def _apply_counter_deltas(self, items: List[Dict[str, Any]]):
+        """Add the written items to their feed counters, one update per counter"""
+        if self.counters_table is None:
+            return
 
-            logger.info(f"Updated {item_type} {item_id} shares by {increment}")
-            return True
+        deltas = {}
+        for item in items:
+            for counter_id in feed_counter_keys(item):
+                deltas[counter_id] = deltas.get(counter_id, 0) + 1
+
+        semaphore = asyncio.Semaphore(BATCH_WRITE_CONCURRENCY)
+        now = datetime.utcnow().isoformat()
+
+        async def add(counter_id: str, delta: int):
+            async with semaphore:
+                try:
+                    await self._execute(self.counters_table, "update_item",
+                        Key={"counter_id": counter_id},
+                        UpdateExpression="ADD item_count :delta SET updated_at = :updated_at",
+                        ExpressionAttributeValues={":delta": delta, ":updated_at": now}
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to add {delta} to counter {counter_id}: {str(e)} - run reconcile-counters")
+
+        await asyncio.gather(*[add(counter_id, delta) for counter_id, delta in deltas.items()])
+
+    async def create_signals_bulk(self, signals: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create many signals with BatchWriteItem"""
+        return await self._create_feed_items_bulk("signal", signals, self._build_signal_item)
+
+    async def create_backtests_bulk(self, backtests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create many backtests with BatchWriteItem"""
+        return await self._create_feed_items_bulk("backtest", backtests, self._build_backtest_item)
 
+    async def create_backtest_jobs_bulk(self, jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create many backtest jobs with BatchWriteItem"""
+        result = await self._bulk_create("backtest job", self.backtest_jobs_table, "job_id", "job_id", jobs, self._build_backtest_job_item)
+        if result["written"]:
+            await self._notify_jobs_available(result["written"])
+        return result
+
+    async def _notify_jobs_available(self, job_ids: List[str]):
+        """Wake workers waiting for pending jobs; a lost notification is picked up by their sweep"""
+        try:
+            await self.job_events.publish(JOBS_AVAILABLE, {"job_ids": job_ids})
         except Exception as e:
-            logger.error(f"Failed to update {item_type} {item_id} shares: {str(e)}")
-            return False
+            logger.warning(f"Failed to announce backtest jobs {job_ids}: {str(e)}")
+
+    async def publish_job_update(self, job_id: str, user_id: Optional[str], fields: Dict[str, Any]):
+        """Announce a change of a job's state to status streams (see job_streams.py); best effort"""
+        try:
+            await self.job_events.publish(JOB_UPDATES, {"job_id": job_id, "user_id": user_id, **fields})
+        except Exception as e:
+            logger.warning(f"Failed to announce update of backtest job {job_id}: {str(e)}")
 
     # Backtest Job Operations
     async def create_backtest_job(self, job_data: Dict[str, Any]) -> bool:
@@ -925,46 +2207,55 @@ class DatabaseManager:
             return False
 
         try:
-            job_item = DynamoDBBacktestJob(
-                job_id=job_data["job_id"],
-                user_id=job_data["user_id"],
-                status=job_data["status"],
-                priority=job_data["priority"],
-                created_at=datetime.utcnow().isoformat(),
-                started_at=job_data.get("started_at"),
-                completed_at=job_data.get("completed_at"),
-                strategy_name=job_data["strategy_name"],
-                strategy_description=job_data["strategy_description"],
-                timeframe=job_data["timeframe"],
-                assets=job_data["assets"],
-                period=job_data["period"],
-                initial_capital=job_data["initial_capital"],
-                strategy_definition=job_data["strategy_definition"],
-                estimated_duration=job_data.get("estimated_duration"),
-                actual_duration=job_data.get("actual_duration"),
-                error_message=job_data.get("error_message"),
-                progress=job_data.get("progress", 0.0),
-                result_backtest_id=job_data.get("result_backtest_id")
-            )
-
-            # Convert floats to Decimal for DynamoDB compatibility
-            item_dict = prepare_item_for_dynamodb(job_item.model_dump())
+            item_dict = self._build_backtest_job_item(job_data)
 
-            self.backtest_jobs_table.put_item(Item=item_dict)
+            await self._execute(self.backtest_jobs_table, "put_item", Item=item_dict)
             logger.info(f"Created backtest job: {job_data['job_id']}")
+            if item_dict["status"] == "pending":
+                await self._notify_jobs_available([job_data["job_id"]])
+            await self.publish_job_update(job_data["job_id"], job_data["user_id"], prepare_item_from_dynamodb(item_dict))
             return True
 
         except Exception as e:
             logger.error(f"Failed to create backtest job: {str(e)}")
             return False
 
+    def _build_backtest_job_item(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate job data and build the backtest jobs table item"""
+        job_item = DynamoDBBacktestJob(
+            job_id=job_data["job_id"],
+            user_id=job_data["user_id"],
+            status=job_data["status"],
+            priority=job_data["priority"],
+            created_at=datetime.utcnow().isoformat(),
+            started_at=job_data.get("started_at"),
+            completed_at=job_data.get("completed_at"),
+            strategy_name=job_data["strategy_name"],
+            strategy_description=job_data["strategy_description"],
+            timeframe=job_data["timeframe"],
+            assets=job_data["assets"],
+            period=job_data["period"],
+            initial_capital=job_data["initial_capital"],
+            strategy_definition=job_data["strategy_definition"],
+            estimated_duration=job_data.get("estimated_duration"),
+            actual_duration=job_data.get("actual_duration"),
+            error_message=job_data.get("error_message"),
+            progress=job_data.get("progress", 0.0),
+            result_backtest_id=job_data.get("result_backtest_id"),
+            input_fingerprint=job_data.get("input_fingerprint"),
+            cached_result=job_data.get("cached_result", False)
+        )
+
+        # Convert floats to Decimal for DynamoDB compatibility
+        return prepare_item_for_dynamodb(job_item.model_dump())
+
     async def get_backtest_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get a backtest job by ID"""
         if not self.is_connected():
             return None
 
         try:
-            response = self.backtest_jobs_table.get_item(Key={'job_id': job_id})
+            response = await self._execute(self.backtest_jobs_table, "get_item", Key={'job_id': job_id})
             if 'Item' in response:
                 item = prepare_item_from_dynamodb(response['Item'])
                 return item
@@ -974,54 +2265,88 @@ class DatabaseManager:
             logger.error(f"Failed to get backtest job {job_id}: {str(e)}")
             return None
 
-    async def get_pending_backtest_jobs(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get pending backtest jobs ordered by priority and creation time"""
+    async def get_pending_backtest_jobs(self, limit: int = 10, projection: Union[str, List[str], None] = "full",
+                                        created_since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get up to `limit` pending backtest jobs, oldest first, reading only the
+        attributes of `projection` (see JOB_PROJECTIONS). created_since limits
+        it to jobs created after that time. The "queue" projection is read
+        from the slim queue index when the table has it.
+        """
         if not self.is_connected():
             return []
 
-        try:
-            # Query the StatusIndex for pending jobs
-            response = self.backtest_jobs_table.query(
-                IndexName='StatusIndex',
-                KeyConditionExpression='#status = :status',
-                ExpressionAttributeNames={
-                    '#status': 'status'
-                },
-                ExpressionAttributeValues={
-                    ':status': 'pending'
-                },
-                ScanIndexForward=True,  # Ascending order by created_at
-                Limit=limit
-            )
+        projection_fields = projection_params(resolve_projection(JOB_PROJECTIONS, projection), JOB_KEY_FIELDS)
+        index_name = JOB_QUEUE_INDEX_NAME if projection == "queue" and self._queue_index_available else 'StatusIndex'
 
+        key_condition = '#status = :status'
+        values = {':status': 'pending'}
+        if created_since:
+            key_condition += ' AND created_at > :since'
+            values[':since'] = created_since
+
+        try:
             jobs = []
-            for item in response.get('Items', []):
-                jobs.append(prepare_item_from_dynamodb(item))
+            start_key = None
+            # Query the index for pending jobs, a page at a time
+            while len(jobs) < limit:
+                response = await self._execute(self.backtest_jobs_table, "query",
+                    IndexName=index_name,
+                    KeyConditionExpression=key_condition,
+                    ExpressionAttributeNames={
+                        '#status': 'status',
+                        **projection_fields.get('ExpressionAttributeNames', {})
+                    },
+                    ExpressionAttributeValues=values,
+                    ScanIndexForward=True,  # Ascending order by created_at
+                    Limit=limit - len(jobs),
+                    **({'ProjectionExpression': projection_fields['ProjectionExpression']} if projection_fields else {}),
+                    **({'ExclusiveStartKey': start_key} if start_key else {})
+                )
+
+                for item in response.get('Items', []):
+                    jobs.append(prepare_item_from_dynamodb(item))
+
+                start_key = response.get('LastEvaluatedKey')
+                if not start_key:
+                    break
 
             return jobs
 
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if index_name == JOB_QUEUE_INDEX_NAME and error_code in ('ValidationException', 'ResourceNotFoundException') and 'index' in str(e).lower():
+                logger.warning(f"Job queue index {JOB_QUEUE_INDEX_NAME} not found on {self.backtest_jobs_table_name}, reading the StatusIndex instead")
+                self._queue_index_available = False
+                return await self.get_pending_backtest_jobs(limit, projection, created_since)
+            logger.error(f"Failed to get pending backtest jobs: {str(e)}")
+            return []
         except Exception as e:
             logger.error(f"Failed to get pending backtest jobs: {str(e)}")
             return []
 
-    async def get_user_backtest_jobs(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
-        """Get backtest jobs for a specific user"""
+    async def get_user_backtest_jobs(self, user_id: str, limit: int = 50, projection: Union[str, List[str], None] = "full") -> List[Dict[str, Any]]:
+        """Get backtest jobs for a specific user, reading only the attributes of `projection` (see JOB_PROJECTIONS)"""
         if not self.is_connected():
             return []
 
+        projection_fields = projection_params(resolve_projection(JOB_PROJECTIONS, projection), JOB_KEY_FIELDS)
+
         try:
             # Query the UserIndex for user's jobs
-            response = self.backtest_jobs_table.query(
+            response = await self._execute(self.backtest_jobs_table, "query",
                 IndexName='UserIndex',
                 KeyConditionExpression='#user_id = :user_id',
                 ExpressionAttributeNames={
-                    '#user_id': 'user_id'
+                    '#user_id': 'user_id',
+                    **projection_fields.get('ExpressionAttributeNames', {})
                 },
                 ExpressionAttributeValues={
                     ':user_id': user_id
                 },
                 ScanIndexForward=False,  # Descending order by created_at
-                Limit=limit
+                Limit=limit,
+                **({'ProjectionExpression': projection_fields['ProjectionExpression']} if projection_fields else {})
             )
 
             jobs = []
@@ -1034,8 +2359,237 @@ class DatabaseManager:
             logger.error(f"Failed to get backtest jobs for user {user_id}: {str(e)}")
             return []
 
-    async def update_backtest_job(self, job_id: str, updates: Dict[str, Any]) -> bool:
-        """Update a backtest job"""
+    async def claim_backtest_job(self, job_id: str, worker_id: str, lease_seconds: float) -> Optional[Dict[str, Any]]:
+        """
+        Atomically move a pending job to running under a lease held by worker_id.
+        Returns the claimed job, or None if it was no longer pending (another
+        worker claimed it, or it was cancelled).
+        """
+        if not self.is_connected():
+            return None
+
+        now = datetime.utcnow()
+        try:
+            response = await self._execute(self.backtest_jobs_table, "update_item",
+                Key={"job_id": job_id},
+                UpdateExpression="SET #status = :running, worker_id = :worker_id, lease_expires_at = :lease, "
+                                 "started_at = :now, progress = :progress ADD attempts :one",
+                ConditionExpression="#status = :pending",
+                ExpressionAttributeNames={"#status": "status"},
+                ExpressionAttributeValues={
+                    ":running": "running", ":pending": "pending", ":worker_id": worker_id,
+                    ":lease": int(time.time() + lease_seconds), ":now": now.isoformat(),
+                    ":progress": Decimal("10.0"), ":one": 1
+                },
+                ReturnValues="ALL_NEW"
+            )
+            logger.info(f"Worker {worker_id} claimed backtest job {job_id}")
+            job = prepare_item_from_dynamodb(response["Attributes"])
+            await self.publish_job_update(job_id, job.get("user_id"), {
+                "status": "running", "progress": job.get("progress"), "started_at": job.get("started_at")
+            })
+            return job
+
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                logger.info(f"Backtest job {job_id} is no longer pending, not claimed")
+                return None
+            logger.error(f"Failed to claim backtest job {job_id}: {str(e)}")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to claim backtest job {job_id}: {str(e)}")
+            return None
+
+    async def renew_backtest_job_lease(self, job_id: str, worker_id: str, lease_seconds: float) -> Optional[bool]:
+        """
+        Extend a running job's lease. False if worker_id no longer holds it
+        (the job was cancelled, finished or reclaimed); None if the renewal
+        itself failed and should be retried.
+        """
+        if not self.is_connected():
+            return None
+
+        try:
+            await self._execute(self.backtest_jobs_table, "update_item",
+                Key={"job_id": job_id},
+                UpdateExpression="SET lease_expires_at = :lease",
+                ConditionExpression="#status = :running AND worker_id = :worker_id",
+                ExpressionAttributeNames={"#status": "status"},
+                ExpressionAttributeValues={
+                    ":running": "running", ":worker_id": worker_id, ":lease": int(time.time() + lease_seconds)
+                }
+            )
+            return True
+
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            logger.error(f"Failed to renew lease on backtest job {job_id}: {str(e)}")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to renew lease on backtest job {job_id}: {str(e)}")
+            return None
+
+    async def release_backtest_job(self, job_id: str, worker_id: str) -> bool:
+        """
+        Hand a running job back to the queue before its lease expires (the
+        worker is shutting down). The claim doesn't count as an attempt.
+        """
+        if not self.is_connected():
+            return False
+
+        try:
+            response = await self._execute(self.backtest_jobs_table, "update_item",
+                Key={"job_id": job_id},
+                UpdateExpression="SET #status = :pending, progress = :zero REMOVE worker_id, lease_expires_at ADD attempts :minus_one",
+                ConditionExpression="#status = :running AND worker_id = :worker_id",
+                ExpressionAttributeNames={"#status": "status"},
+                ExpressionAttributeValues={
+                    ":pending": "pending", ":running": "running", ":worker_id": worker_id,
+                    ":zero": Decimal("0"), ":minus_one": -1
+                },
+                ReturnValues="ALL_NEW"
+            )
+            logger.info(f"Worker {worker_id} released backtest job {job_id}")
+            await self._notify_jobs_available([job_id])
+            await self.publish_job_update(job_id, response["Attributes"].get("user_id"), {"status": "pending", "progress": 0.0})
+            return True
+
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False  # Cancelled, finished or reclaimed meanwhile
+            logger.error(f"Failed to release backtest job {job_id}: {str(e)}")
+            return False
+        except Exception as e:
+            logger.error(f"Failed to release backtest job {job_id}: {str(e)}")
+            return False
+
+    async def cancel_backtest_job(self, job_id: str) -> bool:
+        """
+        Mark a pending or running job cancelled and broadcast it so that the
+        worker running it stops. Dropping the lease fences off any further
+        writes from that worker. False if the job doesn't exist or already ended.
+        """
+        if not self.is_connected():
+            return False
+
+        completed_at = datetime.utcnow().isoformat()
+        try:
+            response = await self._execute(self.backtest_jobs_table, "update_item",
+                Key={"job_id": job_id},
+                UpdateExpression="SET #status = :cancelled, completed_at = :now REMOVE worker_id, lease_expires_at",
+                ConditionExpression="#status IN (:pending, :running)",
+                ExpressionAttributeNames={"#status": "status"},
+                ExpressionAttributeValues={
+                    ":cancelled": "cancelled", ":pending": "pending", ":running": "running",
+                    ":now": completed_at
+                },
+                ReturnValues="ALL_NEW"
+            )
+            logger.info(f"Cancelled backtest job: {job_id}")
+
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                logger.warning(f"Cannot cancel backtest job {job_id}: not found or already finished")
+                return False
+            logger.error(f"Failed to cancel backtest job {job_id}: {str(e)}")
+            return False
+        except Exception as e:
+            logger.error(f"Failed to cancel backtest job {job_id}: {str(e)}")
+            return False
+
+        try:
+            await self.job_events.publish(JOBS_CANCELLED, {"job_ids": [job_id]})
+        except Exception as e:
+            # The worker still stops when its next lease renewal fails
+            logger.warning(f"Failed to announce cancellation of backtest job {job_id}: {str(e)}")
+        await self.publish_job_update(job_id, response["Attributes"].get("user_id"), {"status": "cancelled", "completed_at": completed_at})
+        return True
+
+    async def reclaim_expired_backtest_jobs(self, max_attempts: int, limit: int = 100) -> Dict[str, int]:
+        """
+        Return running jobs whose lease expired (their worker died or hung) to
+        pending, or fail them once they have been attempted max_attempts times.
+        Each job is reset only if its lease is still the expired one seen here.
+        Running jobs without a lease (left by workers that predate leases)
+        count as expired. At most `limit` jobs are handled per call.
+        """
+        if not self.is_connected():
+            return {"reclaimed": 0, "failed": 0}
+
+        reclaimed = []
+        failed = 0
+        try:
+            # The filter applies after each page is read, so page through
+            # every running job until enough expired ones are found
+            expired = []
+            query = {
+                "IndexName": "StatusIndex",
+                "KeyConditionExpression": "#status = :running",
+                "FilterExpression": "lease_expires_at < :now OR attribute_not_exists(lease_expires_at)",
+                "ExpressionAttributeNames": {"#status": "status"},
+                "ExpressionAttributeValues": {":running": "running", ":now": int(time.time())}
+            }
+            while len(expired) < limit:
+                response = await self._execute(self.backtest_jobs_table, "query", **query)
+                expired.extend(response.get("Items", []))
+                if "LastEvaluatedKey" not in response:
+                    break
+                query["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+            for job in expired[:limit]:
+                exhausted = int(job.get("attempts", 0)) >= max_attempts
+                if exhausted:
+                    update = "SET #status = :failed, error_message = :error, completed_at = :now REMOVE worker_id, lease_expires_at"
+                    values = {":failed": "failed", ":now": datetime.utcnow().isoformat(),
+                              ":error": f"Worker lease expired on each of {int(job.get('attempts', 0))} attempts"}
+                else:
+                    update = "SET #status = :pending, progress = :zero REMOVE worker_id, lease_expires_at"
+                    values = {":pending": "pending", ":zero": Decimal("0")}
+
+                if "lease_expires_at" in job:
+                    lease_condition = "lease_expires_at = :lease"
+                    values[":lease"] = job["lease_expires_at"]
+                else:
+                    lease_condition = "attribute_not_exists(lease_expires_at)"
+
+                try:
+                    await self._execute(self.backtest_jobs_table, "update_item",
+                        Key={"job_id": job["job_id"]},
+                        UpdateExpression=update,
+                        ConditionExpression=f"#status = :running AND {lease_condition}",
+                        ExpressionAttributeNames={"#status": "status"},
+                        ExpressionAttributeValues={**values, ":running": "running"}
+                    )
+                except ClientError as e:
+                    if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                        raise
+                    continue  # Renewed, finished or reclaimed by someone else meanwhile
+
+                if exhausted:
+                    failed += 1
+                    logger.warning(f"Backtest job {job['job_id']} failed: lease held by {job.get('worker_id')} expired")
+                    await self.publish_job_update(job["job_id"], job.get("user_id"), {
+                        "status": "failed", "error_message": values[":error"], "completed_at": values[":now"]
+                    })
+                else:
+                    reclaimed.append(job["job_id"])
+                    logger.warning(f"Reclaimed backtest job {job['job_id']} from {job.get('worker_id')} after its lease expired")
+                    await self.publish_job_update(job["job_id"], job.get("user_id"), {"status": "pending", "progress": 0.0})
+
+            if reclaimed:
+                await self._notify_jobs_available(reclaimed)
+
+        except Exception as e:
+            logger.error(f"Failed to reclaim expired backtest jobs: {str(e)}")
+
+        return {"reclaimed": len(reclaimed), "failed": failed}
+
+    async def update_backtest_job(self, job_id: str, updates: Dict[str, Any], worker_id: Optional[str] = None) -> bool:
+        """
+        Update a backtest job. With worker_id the update only applies while
+        that worker still holds the job's lease.
+        """
         if not self.is_connected():
             return False
 
@@ -1064,18 +2618,28 @@ class DatabaseManager:
 
             update_expression = "SET " + ", ".join(update_expression_parts)
 
-            self.backtest_jobs_table.update_item(
+            condition = {}
+            if worker_id is not None:
+                condition["ConditionExpression"] = "worker_id = :lease_owner"
+                expression_attribute_values[":lease_owner"] = worker_id
+
+            await self._execute(self.backtest_jobs_table, "update_item",
                 Key={'job_id': job_id},
                 UpdateExpression=update_expression,
                 ExpressionAttributeNames=expression_attribute_names,
-                ExpressionAttributeValues=expression_attribute_values
+                ExpressionAttributeValues=expression_attribute_values,
+                **condition
             )
 
-            logger.info(f"[UPDATE JOB] -- updated backtest job: {job_id} --")
-            logger.info(f"[UPDATE JOB] \tupdated_expression={pp.pformat(update_expression)} ")
-            logger.info(f"[UPDATE JOB] \texpression_attribute_values={pp.pformat(expression_attribute_values)} ")
+            logger.debug(f"Updated backtest job {job_id}: {', '.join(updates)}")
             return True
 
+        except ClientError as e:
+            if worker_id is not None and e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                logger.warning(f"Not updating backtest job {job_id}: {worker_id} no longer holds its lease")
+            else:
+                logger.error(f"Failed to update backtest job {job_id}: {str(e)}")
+            return False
         except Exception as e:
             logger.error(f"Failed to update backtest job {job_id}: {str(e)}")
             return False
@@ -1086,7 +2650,7 @@ class DatabaseManager:
             return False
 
         try:
-            self.backtest_jobs_table.delete_item(Key={'job_id': job_id})
+            await self._execute(self.backtest_jobs_table, "delete_item", Key={'job_id': job_id})
             logger.info(f"Deleted backtest job: {job_id}")
             return True
 
@@ -1094,13 +2658,62 @@ class DatabaseManager:
             logger.error(f"Failed to delete backtest job {job_id}: {str(e)}")
             return False
 
+    # Backtest Result Cache
+    async def get_cached_backtest_result(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        Result cache entry of a job input fingerprint. Entries whose backtest
+        has since been deleted are dropped and count as misses.
+        """
+        if not self.is_connected():
+            return None
+
+        try:
+            response = await self._execute(self.backtest_jobs_table, "get_item",
+                Key={'job_id': f"{RESULT_CACHE_KEY_PREFIX}{fingerprint}"})
+            if 'Item' not in response:
+                return None
+            entry = prepare_item_from_dynamodb(response['Item'])
+
+            backtest = await self._execute(self.feed_table, "get_item",
+                Key={'item_id': entry['result_backtest_id']}, ProjectionExpression="item_id")
+            if 'Item' not in backtest:
+                logger.info(f"Cached backtest {entry['result_backtest_id']} no longer exists, dropping result cache entry {fingerprint}")
+                await self._execute(self.backtest_jobs_table, "delete_item", Key={'job_id': entry['job_id']})
+                return None
+            return entry
+
+        except Exception as e:
+            logger.error(f"Failed to read result cache entry {fingerprint}: {str(e)}")
+            return None
+
+    async def put_cached_backtest_result(self, fingerprint: str, data_version: str, backtest_id: str, job_id: str) -> bool:
+        """Record the backtest a job produced under its input fingerprint; the newest result wins"""
+        if not self.is_connected():
+            return False
+
+        try:
+            await self._execute(self.backtest_jobs_table, "put_item", Item={
+                'job_id': f"{RESULT_CACHE_KEY_PREFIX}{fingerprint}",
+                'fingerprint': fingerprint,
+                'data_version': data_version,
+                'result_backtest_id': backtest_id,
+                'source_job_id': job_id,
+                'cached_at': datetime.utcnow().isoformat()
+            })
+            logger.debug(f"Cached result {backtest_id} of backtest job {job_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to cache result of backtest job {job_id}: {str(e)}")
+            return False
+
 # Global database instance
 db_manager = None
 
-def initialize_database(user_table_name: str, feed_table_name: str, backtest_jobs_table_name: str = None, region: str = "us-east-1", use_localstack: bool = False, localstack_endpoint: str = None):
+def initialize_database(user_table_name: str, feed_table_name: str, backtest_jobs_table_name: str = None, region: str = "us-east-1", use_localstack: bool = False, localstack_endpoint: str = None, executor_workers: Optional[int] = None, counters_table_name: str = None):
     """Initialize the global database manager"""
     global db_manager
-    db_manager = DatabaseManager(user_table_name, feed_table_name, backtest_jobs_table_name, region, use_localstack, localstack_endpoint)
+    db_manager = DatabaseManager(user_table_name, feed_table_name, backtest_jobs_table_name, region, use_localstack, localstack_endpoint, executor_workers, counters_table_name)
     return db_manager
 
 def get_database() -> DatabaseManager:
@@ -0,0 +1,139 @@
+"""
+Largest-Triangle-Three-Buckets downsampling for chart_data.
+
+LTTB keeps the first and last points and, for each of the remaining buckets,
+the point forming the largest triangle with the point kept from the previous
+bucket and the average of the next one. Peaks and troughs survive, so a 60
+point thumbnail still looks like the 5,000 point backtest it came from.
+"""
+
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import numpy as np
+
+from cache import MISSING, TTLCache
+from chart_codec import chart_data_of, chart_point_count
+
+def lttb_indices(y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices of the `threshold` points LTTB keeps from series y (x is the point index)"""
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.arange(n, dtype=np.float64)
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    # threshold - 2 buckets over the points between the first and the last
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    selected = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket == threshold - 3:
+            next_x, next_y = x[n - 1], y[n - 1]
+        else:
+            next_end = edges[bucket + 2]
+            next_x, next_y = x[end:next_end].mean(), y[end:next_end].mean()
+
+        # Twice the triangle area; the constant factor doesn't change the argmax
+        area = np.abs(
+            (x[selected] - next_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (next_y - y[selected])
+        )
+        selected = start + int(np.argmax(area))
+        indices[bucket + 1] = selected
+    return indices
+
+def downsample_chart(chart_data: Dict[str, Any], points: int) -> Dict[str, Any]:
+    """
+    Copy of a chart with at most `points` points. Indices are chosen by LTTB on
+    the first dataset and applied to the labels and every dataset, so series
+    stay aligned.
+    """
+    count = chart_point_count(chart_data)
+    datasets = chart_data.get("datasets") or []
+    if count <= points or not datasets:
+        return chart_data
+
+    primary = next((dataset["data"] for dataset in datasets if len(dataset.get("data", [])) == count), None)
+    if primary is None:
+        indices = np.linspace(0, count - 1, points).astype(np.int64)
+    else:
+        indices = lttb_indices(np.array(primary, dtype=np.float64), points)
+    indices = indices.tolist()
+
+    downsampled = dict(chart_data)
+    downsampled["labels"] = [chart_data["labels"][i] for i in indices]
+    downsampled["datasets"] = [
+        {**dataset, "data": [dataset["data"][i] for i in indices if i < len(dataset["data"])]}
+        for dataset in datasets
+    ]
+    return downsampled
+
+class ChartDownsampler:
+    """
+    Downsampled charts cached per (item, resolution).
+
+    Keys include updated_at and the chart blob reference, so a rewritten item
+    never serves an old chart.
+    """
+
+    def __init__(self, cache_size: int = 2000, ttl: float = 600.0):
+        self.cache = TTLCache(max_size=cache_size, ttl=ttl, negative_ttl=0)
+
+    def chart_for(self, item: Dict[str, Any], points: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """chart_data of a feed item, downsampled to `points` when given"""
+        if points is None:
+            return chart_data_of(item)
+
+        key = f"{item.get('item_id')}:{item.get('updated_at', '')}:{item.get('chart_ref', '')}:{points}"
+        chart = self.cache.get(key)
+        if chart is not MISSING:
+            return chart
+
+        chart = chart_data_of(item)
+        if chart is not None:
+            chart = downsample_chart(chart, points)
+            self.cache.set(key, chart)
+        return chart
+
+    async def full_chart_for(self, item: Dict[str, Any], points: Optional[int],
+                             load_chart: Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]) -> Optional[Dict[str, Any]]:
+        """
+        Like chart_for, but an offloaded chart (chart_ref) is read in full
+        through load_chart (and downsampled when points is given), rather
+        than its preview
+        """
+        if not item.get("chart_ref"):
+            return self.chart_for(item, points)
+        if points is None:
+            return await load_chart(item)
+
+        key = f"{item.get('item_id')}:{item.get('updated_at', '')}:{item['chart_ref']}:{points}:full"
+        chart = self.cache.get(key)
+        if chart is not MISSING:
+            return chart
+
+        chart = await load_chart(item)
+        if chart is not None:
+            chart = downsample_chart(chart, points)
+            self.cache.set(key, chart)
+        return chart
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
+
+_chart_downsampler: Optional[ChartDownsampler] = None
+
+def get_chart_downsampler() -> ChartDownsampler:
+    """Process-wide downsampler, sized by CHART_DOWNSAMPLE_CACHE_SIZE"""
+    global _chart_downsampler
+    if _chart_downsampler is None:
+        _chart_downsampler = ChartDownsampler(
+            cache_size=int(os.getenv("CHART_DOWNSAMPLE_CACHE_SIZE", "2000")),
+            ttl=float(os.getenv("CHART_DOWNSAMPLE_CACHE_TTL_SECONDS", "600"))
+        )
+    return _chart_downsampler
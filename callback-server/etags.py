@@ -0,0 +1,35 @@
+"""
+Strong ETags and If-None-Match handling for item detail endpoints.
+
+An item's tag is derived from its updated_at and version (bumped by every
+content update) plus anything else that shapes the response body but doesn't
+touch either: engagement counters, the author's profile, query parameters.
+That is enough to answer a conditional GET before any model is built.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from fastapi.responses import Response
+
+def item_etag(item: Dict[str, Any], *parts: Any) -> str:
+    """Strong ETag of a feed item's representation; parts are extra inputs to the body"""
+    state = [
+        item.get("item_id"), item.get("updated_at"), int(item.get("version") or 0),
+        item.get("likes", 0), item.get("comments", 0), item.get("shares", 0), *parts
+    ]
+    digest = hashlib.sha256(json.dumps(state, default=str).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match comparison (weak, as RFC 9110 requires for this header)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates)
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
@@ -0,0 +1,242 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # redis is optional; the shared-memory backend needs nothing
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "feed-page"
+
+class ShmFeedPageBackend:
+    """
+    Feed pages stored as files in a tmpfs directory (/dev/shm) shared by every
+    worker on the node. Entries are replaced atomically and expire by mtime.
+    """
+
+    name = "shm"
+
+    def __init__(self, directory: str, ttl: float, sweep_every: int = 200):
+        self.directory = directory
+        self.ttl = ttl
+        self.sweep_every = sweep_every
+        self._writes = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self._generation_path = os.path.join(self.directory, "generation")
+
+    def _write_atomic(self, path: str, data: bytes):
+        """Write to a temp file and rename it over the target"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    async def generation(self) -> str:
+        try:
+            with open(self._generation_path, "r") as f:
+                return f.read()
+        except FileNotFoundError:
+            await self.bump_generation()
+            return await self.generation()
+
+    async def bump_generation(self):
+        # A random token rather than a counter: no read-modify-write race between workers
+        self._write_atomic(self._generation_path, uuid.uuid4().hex.encode())
+
+    async def get(self, key: str) -> Optional[bytes]:
+        path = os.path.join(self.directory, key)
+        try:
+            if time.time() - os.stat(path).st_mtime > self.ttl:
+                return None
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    async def set(self, key: str, value: bytes):
+        self._write_atomic(os.path.join(self.directory, key), value)
+        self._writes += 1
+        if self._writes % self.sweep_every == 0:
+            self._sweep()
+
+    def _sweep(self):
+        """Remove expired pages, including those left behind by older generations"""
+        cutoff = time.time() - self.ttl
+        for entry in os.scandir(self.directory):
+            if not entry.name.startswith(KEY_PREFIX):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+
+    async def close(self):
+        pass
+
+class RedisFeedPageBackend:
+    """Feed pages stored in a (node-local) Redis-compatible server"""
+
+    name = "redis"
+
+    def __init__(self, url: str, ttl: float, namespace: str):
+        self.ttl = ttl
+        self.namespace = namespace
+        self.client = redis_asyncio.from_url(url)
+        self._generation_key = f"{KEY_PREFIX}:{namespace}:generation"
+
+    async def generation(self) -> str:
+        value = await self.client.get(self._generation_key)
+        return value.decode() if value else "0"
+
+    async def bump_generation(self):
+        await self.client.incr(self._generation_key)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(f"{self.namespace}:{key}")
+
+    async def set(self, key: str, value: bytes):
+        await self.client.set(f"{self.namespace}:{key}", value, px=int(self.ttl * 1000))
+
+    async def close(self):
+        await self.client.close()
+
+class FeedPageCache:
+    """
+    Serialized /api/feed responses shared across worker processes.
+
+    Keys include a generation token that every feed write replaces, so one
+    write invalidates every cached page at once. Entries also expire after a
+    short TTL in case an invalidation is missed (for example a write made by
+    another service). Cache failures are logged and treated as misses.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    async def key_for(self, params: Dict[str, Any]) -> Optional[str]:
+        """
+        Cache key for the request parameters under the current generation.
+
+        Take the key before reading the feed and store the page under that same
+        key: a page built from a read that raced a write then lands under the
+        old generation and is never served.
+        """
+        if not self.enabled:
+            return None
+        try:
+            generation = await self.backend.generation()
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Feed page cache generation read failed: {str(e)}")
+            return None
+        digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+        return f"{KEY_PREFIX}-{generation}-{digest}"
+
+    async def get(self, key: Optional[str]) -> Optional[bytes]:
+        """Cached page body, if any"""
+        if key is None:
+            return None
+        try:
+            body = await self.backend.get(key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Feed page cache read failed: {str(e)}")
+            return None
+
+        if body is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return body
+
+    async def set(self, key: Optional[str], body: bytes):
+        """Store a serialized page"""
+        if key is None:
+            return
+        try:
+            await self.backend.set(key, body)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Feed page cache write failed: {str(e)}")
+
+    async def invalidate(self):
+        """Drop every cached page after a feed write"""
+        if not self.enabled:
+            return
+        try:
+            await self.backend.bump_generation()
+            self.invalidations += 1
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Feed page cache invalidation failed: {str(e)}")
+
+    async def close(self):
+        if self.enabled:
+            await self.backend.close()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend.name if self.enabled else "none",
+            "ttl_seconds": self.backend.ttl if self.enabled else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "errors": self.errors
+        }
+
+def create_feed_page_cache(namespace: str) -> FeedPageCache:
+    """
+    Build the feed page cache from the environment.
+
+    namespace (the feed table name) keeps servers that share a node but not a
+    table apart.
+
+    FEED_CACHE_BACKEND is one of auto (Redis when REDIS_URL is set and the
+    redis package is installed, shared memory otherwise), redis, shm or none.
+    """
+    backend_name = os.getenv("FEED_CACHE_BACKEND", "auto").lower()
+    ttl = float(os.getenv("FEED_CACHE_TTL_SECONDS", "15"))
+    redis_url = os.getenv("REDIS_URL")
+
+    if backend_name == "none" or ttl <= 0:
+        return FeedPageCache()
+
+    try:
+        if backend_name == "redis" or (backend_name == "auto" and redis_url and redis_asyncio is not None):
+            if redis_asyncio is None:
+                raise RuntimeError("FEED_CACHE_BACKEND=redis requires the redis package")
+            backend = RedisFeedPageBackend(redis_url or "redis://localhost:6379", ttl, namespace)
+        else:
+            default_dir = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+            directory = os.getenv("FEED_CACHE_DIR", os.path.join(default_dir, "algotraders-feed-cache"))
+            backend = ShmFeedPageBackend(os.path.join(directory, namespace), ttl)
+    except Exception as e:
+        logger.error(f"Feed page cache disabled: {str(e)}")
+        return FeedPageCache()
+
+    logger.info(f"Feed page cache using {backend.name} backend (ttl {ttl}s)")
+    return FeedPageCache(backend)
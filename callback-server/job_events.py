@@ -0,0 +1,222 @@
+"""
+Publish/subscribe channel for backtest job events.
+
+Events are small JSON-able dicts published on named channels (for example
+"jobs.available" when a job is created, "jobs.cancelled" when one is
+cancelled, "jobs.updates" for every change of a job's status or progress). Subscribers in the same process get
+them straight from an asyncio queue. With Redis configured, events are
+relayed through Redis pub/sub so that workers in other processes and on other
+nodes see them too; without it, other processes only learn about new jobs
+from their periodic sweep.
+
+Delivery is best effort: a subscriber that falls behind loses its oldest
+events, and nothing is replayed after a reconnect. Anything that must not be
+lost is also written to the jobs table.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, Optional, Set
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # redis is optional; in-process delivery needs nothing
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+# Channel a notification is published on whenever a job becomes pending
+JOBS_AVAILABLE = "jobs.available"
+# Channel cancellations are broadcast on, so the worker running the job stops it
+JOBS_CANCELLED = "jobs.cancelled"
+# Channel every job state change (status, progress, result) is published on
+# for the status streams; events carry job_id, user_id and the changed fields
+JOB_UPDATES = "jobs.updates"
+
+class Subscription:
+    """Events of some channels, buffered in a bounded queue"""
+
+    def __init__(self, bus: "JobEventBus", channels: Iterable[str], max_queue: int = 1000):
+        self.bus = bus
+        self.channels = set(channels)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.closed = False
+
+    def deliver(self, event: Dict[str, Any]):
+        if self.queue.full():
+            # Drop the oldest event rather than block the publisher
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Next event, or None if none arrived within timeout"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        return await self.queue.get()
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.bus._unsubscribe(self)
+
+class JobEventBus:
+    """In-process event bus; use from the event loop only"""
+
+    name = "local"
+    # Whether events published in other processes reach subscribers here
+    cross_process = False
+
+    def __init__(self):
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self.published = 0
+        self.delivered = 0
+
+    def subscribe(self, *channels: str, max_queue: int = 1000) -> Subscription:
+        subscription = Subscription(self, channels, max_queue)
+        for channel in subscription.channels:
+            self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription):
+        for channel in subscription.channels:
+            subscribers = self._subscriptions.get(channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[channel]
+
+    def _deliver(self, channel: str, event: Dict[str, Any]):
+        for subscription in list(self._subscriptions.get(channel, ())):
+            subscription.deliver(event)
+            self.delivered += 1
+
+    async def publish(self, channel: str, event: Dict[str, Any]):
+        self.published += 1
+        self._deliver(channel, {"channel": channel, **event})
+
+    async def close(self):
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            "channels": len(self._subscriptions),
+            "subscriptions": sum(len(subscribers) for subscribers in self._subscriptions.values()),
+            "published": self.published,
+            "delivered": self.delivered
+        }
+
+class RedisJobEventBus(JobEventBus):
+    """
+    Event bus relayed through Redis pub/sub.
+
+    Events published here reach local subscribers through the same relay as
+    everyone else's, so ordering is the same in every process. If Redis is
+    unreachable they are delivered locally only.
+    """
+
+    name = "redis"
+    cross_process = True
+
+    def __init__(self, url: str, namespace: str, reconnect_delay: float = 1.0):
+        super().__init__()
+        self.client = redis_asyncio.from_url(url)
+        self.namespace = namespace
+        self.reconnect_delay = reconnect_delay
+        self._listener: Optional[asyncio.Task] = None
+        self._connected = asyncio.Event()
+        self.errors = 0
+
+    def subscribe(self, *channels: str, max_queue: int = 1000) -> Subscription:
+        # Started lazily so the listener binds to the loop that serves requests
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        return super().subscribe(*channels, max_queue=max_queue)
+
+    async def _listen(self):
+        prefix = f"{self.namespace}:"
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.psubscribe(f"{prefix}*")
+                self._connected.set()
+                async for message in pubsub.listen():
+                    if message.get("type") != "pmessage":
+                        continue
+                    channel = message["channel"].decode()[len(prefix):]
+                    self._deliver(channel, json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Job event relay disconnected, retrying: {str(e)}")
+            finally:
+                self._connected.clear()
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def publish(self, channel: str, event: Dict[str, Any]):
+        self.published += 1
+        event = {"channel": channel, **event}
+        try:
+            await self.client.publish(f"{self.namespace}:{channel}", json.dumps(event, default=str))
+            if self._subscriptions and not self._connected.is_set():
+                # Our own relay is down: local subscribers would miss it
+                self._deliver(channel, event)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Job event publish failed, delivering locally only: {str(e)}")
+            self._deliver(channel, event)
+
+    async def close(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        await self.client.close()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["connected"] = self._connected.is_set()
+        stats["errors"] = self.errors
+        return stats
+
+def create_job_event_bus(namespace: str) -> JobEventBus:
+    """
+    Build the job event bus from the environment.
+
+    JOB_EVENTS_BACKEND is one of auto (Redis when REDIS_URL is set and the
+    redis package is installed, in-process otherwise), redis or local.
+    namespace (the jobs table name) keeps deployments sharing a Redis apart.
+    """
+    backend = os.getenv("JOB_EVENTS_BACKEND", "auto").lower()
+    redis_url = os.getenv("REDIS_URL")
+
+    if backend in ("auto", "redis") and redis_url:
+        if redis_asyncio is not None:
+            logger.info(f"Job events relayed through Redis at {redis_url}")
+            return RedisJobEventBus(redis_url, namespace)
+        if backend == "redis":
+            logger.warning("JOB_EVENTS_BACKEND=redis but the redis package is not installed")
+    elif backend == "redis":
+        logger.warning("JOB_EVENTS_BACKEND=redis but REDIS_URL is not set")
+
+    logger.info("Job events delivered in-process only")
+    return JobEventBus()
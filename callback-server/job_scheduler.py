@@ -0,0 +1,204 @@
+"""
+Dispatch order for pending backtest jobs.
+
+Jobs are taken by priority class (urgent, high, normal, low), then by weighted
+fair share between users, then oldest first. A user's share is the number of
+jobs dispatched to them recently (decaying with JOB_FAIR_SHARE_HALF_LIFE_SECONDS)
+divided by their weight, so one user queueing hundreds of jobs gets one slot
+in turn with everyone else instead of the whole queue.
+
+A waiting job is promoted one priority class for every
+JOB_PRIORITY_AGING_SECONDS it has waited, so low priority jobs are never
+starved by a steady stream of higher priority ones.
+
+The scheduler keeps a snapshot of the pending queue (see JobScheduler.replace
+and JobScheduler.add) and records how long each dispatched job waited, per
+priority class, for /api/metrics.
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Highest first
+PRIORITY_CLASSES = ("urgent", "high", "normal", "low")
+PRIORITY_RANK = {priority: rank for rank, priority in enumerate(PRIORITY_CLASSES)}
+
+def parse_user_weights(spec: str) -> Dict[str, float]:
+    """JOB_USER_WEIGHTS format: user_a=2,user_b=0.5"""
+    weights = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        user_id, _, weight = entry.partition("=")
+        try:
+            weights[user_id.strip()] = float(weight)
+        except ValueError:
+            logger.warning(f"Ignoring invalid JOB_USER_WEIGHTS entry '{entry}'")
+    return weights
+
+def _age_seconds(job: Dict[str, Any], now: datetime) -> float:
+    try:
+        return max(0.0, (now - datetime.fromisoformat(job["created_at"])).total_seconds())
+    except (KeyError, TypeError, ValueError):
+        return 0.0
+
+class QueueWaitStats:
+    """Time from creation to dispatch of one priority class's jobs"""
+
+    def __init__(self, sample_size: int = 1000):
+        self.samples = deque(maxlen=sample_size)
+        self.dispatched = 0
+        self.promoted = 0
+        self.max_wait = 0.0
+
+    def record(self, wait_seconds: float, promoted: bool):
+        self.samples.append(wait_seconds)
+        self.dispatched += 1
+        self.promoted += int(promoted)
+        self.max_wait = max(self.max_wait, wait_seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return round(ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))], 3)
+
+class JobScheduler:
+    """Orders the pending queue for one worker; use from the event loop only"""
+
+    def __init__(self, aging_seconds: float = 300, half_life_seconds: float = 300,
+                 user_weights: Optional[Dict[str, float]] = None, max_pending: int = 5000):
+        self.aging_seconds = aging_seconds
+        self.half_life_seconds = max(half_life_seconds, 1.0)
+        self.user_weights = user_weights or {}
+        self.max_pending = max_pending
+        self.pending: Dict[str, Dict[str, Any]] = {}
+        # created_at of the newest job seen, for incremental refreshes
+        self.newest: Optional[str] = None
+        # user_id -> (decayed dispatch count, monotonic time it was computed at)
+        self._usage: Dict[str, tuple] = {}
+        self.waits = {priority: QueueWaitStats() for priority in PRIORITY_CLASSES}
+
+    # Pending queue snapshot
+
+    def replace(self, jobs: List[Dict[str, Any]]):
+        """Replace the snapshot with a full read of the pending queue"""
+        self.pending = {}
+        self.newest = None
+        self.add(jobs)
+        if len(jobs) >= self.max_pending:
+            logger.warning(f"Pending backtest queue has at least {self.max_pending} jobs; newer jobs are not scheduled yet")
+
+    def add(self, jobs: Iterable[Dict[str, Any]], exclude: Iterable[str] = ()):
+        """Add newly seen pending jobs, except those in exclude (already dispatched)"""
+        excluded = set(exclude)
+        for job in jobs:
+            if job["job_id"] not in excluded:
+                self.pending[job["job_id"]] = job
+            created_at = job.get("created_at")
+            if created_at and (self.newest is None or created_at > self.newest):
+                self.newest = created_at
+
+    # Ordering
+
+    def weight(self, user_id: str) -> float:
+        return max(self.user_weights.get(user_id, 1.0), 1e-6)
+
+    def usage(self, user_id: str, now: Optional[float] = None) -> float:
+        """Jobs recently dispatched to user_id, decayed by age"""
+        now = time.monotonic() if now is None else now
+        value, at = self._usage.get(user_id, (0.0, now))
+        return value * 0.5 ** ((now - at) / self.half_life_seconds)
+
+    def _charge(self, user_id: str, now: float):
+        self._usage[user_id] = (self.usage(user_id, now) + 1.0, now)
+
+    def effective_rank(self, job: Dict[str, Any], now: datetime) -> int:
+        """Priority rank (0 = urgent) after promotion for time spent waiting"""
+        rank = PRIORITY_RANK.get(job.get("priority"), PRIORITY_RANK["normal"])
+        if self.aging_seconds > 0:
+            rank -= int(_age_seconds(job, now) // self.aging_seconds)
+        return max(rank, 0)
+
+    def select(self, slots: int, exclude: Iterable[str] = ()) -> List[Dict[str, Any]]:
+        """
+        Take up to `slots` jobs off the snapshot in dispatch order, charging
+        each to its user's share
+        """
+        if slots <= 0:
+            return []
+        excluded = set(exclude)
+        wall_now = datetime.utcnow()
+        now = time.monotonic()
+
+        # Each user's jobs, best first
+        by_user: Dict[str, List[tuple]] = {}
+        for job_id, job in self.pending.items():
+            if job_id not in excluded:
+                key = (self.effective_rank(job, wall_now), job.get("created_at") or "")
+                by_user.setdefault(job.get("user_id"), []).append((key, job))
+        for jobs in by_user.values():
+            jobs.sort(key=lambda entry: entry[0], reverse=True)  # Best last, for pop()
+
+        selected = []
+        while by_user and len(selected) < slots:
+            # Best head job: priority, then the user furthest below their share, then age
+            user_id = min(by_user, key=lambda user: (
+                by_user[user][-1][0][0], self.usage(user, now) / self.weight(user), by_user[user][-1][0][1]
+            ))
+            _, job = by_user[user_id].pop()
+            if not by_user[user_id]:
+                del by_user[user_id]
+            self._charge(user_id, now)
+            self.pending.pop(job["job_id"], None)
+            selected.append(job)
+        return selected
+
+    # Metrics
+
+    def record_dispatch(self, job: Dict[str, Any]):
+        """Record the queue wait of a job that was just claimed"""
+        priority = job.get("priority") if job.get("priority") in self.waits else "normal"
+        try:
+            wait = (datetime.fromisoformat(job["started_at"]) - datetime.fromisoformat(job["created_at"])).total_seconds()
+        except (KeyError, TypeError, ValueError):
+            return
+        # A claimed job has left the queue, so its age is its wait
+        promoted = self.aging_seconds > 0 and wait >= self.aging_seconds and PRIORITY_RANK[priority] > 0
+        self.waits[priority].record(max(wait, 0.0), promoted)
+
+    def stats(self) -> Dict[str, Any]:
+        now = datetime.utcnow()
+        priorities = {}
+        for priority in PRIORITY_CLASSES:
+            queued = [job for job in self.pending.values() if job.get("priority", "normal") == priority]
+            waits = self.waits[priority]
+            priorities[priority] = {
+                "pending": len(queued),
+                "oldest_pending_seconds": round(max((_age_seconds(job, now) for job in queued), default=0.0), 3),
+                "dispatched": waits.dispatched,
+                "promoted": waits.promoted,
+                "wait_p50_seconds": waits.percentile(50),
+                "wait_p95_seconds": waits.percentile(95),
+                "wait_max_seconds": round(waits.max_wait, 3)
+            }
+        return {
+            "pending": len(self.pending),
+            "pending_users": len({job.get("user_id") for job in self.pending.values()}),
+            "aging_seconds": self.aging_seconds,
+            "half_life_seconds": self.half_life_seconds,
+            "priorities": priorities
+        }
+
+def create_job_scheduler() -> JobScheduler:
+    """Build the scheduler from the environment"""
+    return JobScheduler(
+        aging_seconds=float(os.getenv("JOB_PRIORITY_AGING_SECONDS", "300")),
+        half_life_seconds=float(os.getenv("JOB_FAIR_SHARE_HALF_LIFE_SECONDS", "300")),
+        user_weights=parse_user_weights(os.getenv("JOB_USER_WEIGHTS", "")),
+        max_pending=int(os.getenv("JOB_QUEUE_MAX_PENDING", "5000"))
+    )
@@ -0,0 +1,150 @@
+"""
+Live backtest job status for Server-Sent Events streams.
+
+Every web process keeps one subscription to the "jobs.updates" channel of
+the job event bus and fans each update out to the streams watching that job
+or its owner, so a thousand open streams cost one subscription and no
+database reads beyond the snapshot each stream starts with. Updates from
+workers in other processes arrive only when the bus is relayed through Redis
+(see job_events.py). Without Redis, a job may be run by the worker of
+another process, so streams also re-read their jobs every
+JOB_STREAM_REFRESH_SECONDS and send what changed.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from job_events import JOB_UPDATES, JobEventBus, Subscription
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_JOB_STATUSES = ("completed", "failed", "cancelled")
+
+def sse_event(event: str, data: Any) -> str:
+    """One Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+class JobUpdateHub(JobEventBus):
+    """
+    Fan-out of job updates keyed by "job:<job_id>" and "user:<user_id>",
+    fed from a single subscription to the job event bus
+    """
+
+    name = "job-updates"
+
+    def __init__(self, bus: JobEventBus):
+        super().__init__()
+        self.bus = bus
+        self._pump: Optional[asyncio.Task] = None
+        self._source: Optional[Subscription] = None
+
+    def watch(self, job_id: Optional[str] = None, user_id: Optional[str] = None, max_queue: int = 100) -> Subscription:
+        """Updates of one job or of all of a user's jobs"""
+        # Started lazily so the pump binds to the loop that serves requests
+        if self._pump is None or self._pump.done():
+            self._source = self.bus.subscribe(JOB_UPDATES)
+            self._pump = asyncio.create_task(self._run(self._source))
+        return self.subscribe(f"job:{job_id}" if job_id else f"user:{user_id}", max_queue=max_queue)
+
+    async def _run(self, source: Subscription):
+        async for event in source:
+            update = {key: value for key, value in event.items() if key != "channel"}
+            self.published += 1
+            self._deliver(f"job:{update.get('job_id')}", update)
+            if update.get("user_id"):
+                self._deliver(f"user:{update['user_id']}", update)
+
+    async def close(self):
+        if self._pump is not None:
+            self._pump.cancel()
+            try:
+                await self._pump
+            except asyncio.CancelledError:
+                pass
+            self._pump = None
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["streams"] = stats.pop("subscriptions")
+        return stats
+
+def _job_changes(known: Dict[str, Dict[str, Any]], jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Updates turning the known state of jobs into their state as just read"""
+    changes = []
+    for job in jobs:
+        previous = known.setdefault(job["job_id"], {})
+        changed = {key: value for key, value in job.items() if previous.get(key) != value}
+        if changed:
+            previous.update(changed)
+            changes.append({"job_id": job["job_id"], "user_id": job.get("user_id"), **changed})
+    return changes
+
+async def stream_job_events(watch: Subscription, snapshot: Any, keepalive: float,
+                            job_id: Optional[str] = None,
+                            refresh: Optional[Callable[[], Awaitable[List[Dict[str, Any]]]]] = None,
+                            refresh_interval: float = 3.0) -> AsyncIterator[str]:
+    """
+    SSE body: a "snapshot" event, then an "update" per change. A single job's
+    stream ends with a "done" event once the job reaches a final status, so
+    the client closes instead of reconnecting.
+
+    With refresh (a read of the watched jobs), the jobs are also re-read every
+    refresh_interval seconds without an event and changes found are sent as
+    updates; for buses that don't carry other processes' events.
+    """
+    jobs = [snapshot] if job_id else (snapshot.get("jobs", []) if isinstance(snapshot, dict) else [])
+    known = {job["job_id"]: dict(job) for job in jobs if isinstance(job, dict) and "job_id" in job}
+    try:
+        yield sse_event("snapshot", snapshot)
+        if job_id and isinstance(snapshot, dict) and snapshot.get("status") in TERMINAL_JOB_STATUSES:
+            yield sse_event("done", {"job_id": job_id, "status": snapshot["status"]})
+            return
+
+        last_sent = time.monotonic()
+        while True:
+            update = await watch.get(timeout=min(keepalive, refresh_interval) if refresh else keepalive)
+            if update is not None:
+                updates = [update]
+                known.setdefault(update.get("job_id"), {}).update(update)
+            elif refresh is not None:
+                try:
+                    updates = _job_changes(known, await refresh())
+                except Exception as e:
+                    logger.warning(f"Failed to refresh job stream: {str(e)}")
+                    updates = []
+            else:
+                updates = []
+
+            for update in updates:
+                yield sse_event("update", update)
+                last_sent = time.monotonic()
+                if job_id and update.get("status") in TERMINAL_JOB_STATUSES:
+                    yield sse_event("done", {"job_id": job_id, "status": update["status"]})
+                    return
+            if not updates and time.monotonic() - last_sent >= keepalive:
+                # Comment line: keeps proxies from timing out an idle stream
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+    finally:
+        watch.close()
+
+_job_update_hub: Optional[JobUpdateHub] = None
+
+def get_job_update_hub(bus: JobEventBus) -> JobUpdateHub:
+    """Process-wide hub over the database's job event bus"""
+    global _job_update_hub
+    if _job_update_hub is None or _job_update_hub.bus is not bus:
+        _job_update_hub = JobUpdateHub(bus)
+    return _job_update_hub
+
+async def close_job_update_hub():
+    global _job_update_hub
+    if _job_update_hub is not None:
+        await _job_update_hub.close()
+        _job_update_hub = None
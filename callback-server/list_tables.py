@@ -6,6 +6,7 @@ Updated for two-table architecture: User table and Feed table
 """
 
 import asyncio
+import contextlib
 import json
 import os
 import sys
@@ -74,11 +75,13 @@ async def get_table_contents(db: DatabaseManager, table_name: str, limit: int =
         if not db.dynamodb:
             raise Exception("DynamoDB client is not available")
 
-        table = db.dynamodb.Table(table_name)
-
-        # Scan the table
-        response = table.scan(Limit=limit)
-        items = response.get('Items', [])
+        # Scan the table with parallel segments, stopping once we have enough items
+        items = []
+        async with contextlib.aclosing(db.parallel_scan(table_name)) as scan:
+            async for item in scan:
+                items.append(item)
+                if len(items) >= limit:
+                    break
 
         print(f"📊 Table '{table_name}' contains {len(items)} item(s):")
 
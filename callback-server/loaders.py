@@ -0,0 +1,78 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BatchFunction = Callable[[List[str]], Awaitable[Dict[str, Any]]]
+
+class BatchKeyLoader:
+    """
+    DataLoader-style key loader.
+
+    Keys requested during the same event loop tick are collected, de-duplicated
+    and resolved with a single batch call. Results are memoized for the lifetime
+    of the loader, so create one loader per request.
+    """
+
+    def __init__(self, batch_fn: BatchFunction, max_batch_size: int = 100):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self._futures: Dict[str, asyncio.Future] = {}
+        self._queue: List[str] = []
+        self._dispatch_scheduled = False
+
+    def load(self, key: str) -> Awaitable[Optional[Any]]:
+        """Request a single key; resolves to None if the key does not exist"""
+        if key in self._futures:
+            return self._futures[key]
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[key] = future
+        self._queue.append(key)
+
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            loop.call_soon(lambda: asyncio.ensure_future(self._dispatch()))
+
+        return future
+
+    async def load_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """Request several keys at once, preserving order"""
+        return list(await asyncio.gather(*[self.load(key) for key in keys]))
+
+    def prime(self, key: str, value: Any):
+        """Seed the loader with an already known value"""
+        if key in self._futures:
+            return
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._futures[key] = future
+
+    async def _dispatch(self):
+        """Resolve every queued key in batches of max_batch_size"""
+        keys, self._queue = self._queue, []
+        self._dispatch_scheduled = False
+
+        for start in range(0, len(keys), self.max_batch_size):
+            chunk = keys[start:start + self.max_batch_size]
+            try:
+                results = await self.batch_fn(chunk)
+            except Exception as e:
+                logger.error(f"Batch load failed for {len(chunk)} keys: {str(e)}")
+                for key in chunk:
+                    if not self._futures[key].done():
+                        self._futures[key].set_exception(e)
+                continue
+
+            for key in chunk:
+                if not self._futures[key].done():
+                    self._futures[key].set_result(results.get(key))
+
+class RequestLoaders:
+    """Batched loaders shared by everything that runs within one request"""
+
+    def __init__(self, db_manager):
+        self.users = BatchKeyLoader(db_manager.batch_get_users)
+        self.items = BatchKeyLoader(db_manager.batch_get_feed_items)
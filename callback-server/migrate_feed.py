@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Maintenance and migration tasks for the feed table
+Supports both LocalStack (local development) and AWS DynamoDB (production)
+
+Usage:
+    python migrate_feed.py backfill-shards
+    python migrate_feed.py reconcile-counters
+    python migrate_feed.py export --output feed.jsonl
+    python migrate_feed.py pack-charts [--precision float32]
+    python migrate_feed.py unpack-charts
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from chart_codec import with_chart_data
+from database import DatabaseManager, prepare_item_from_dynamodb
+
+def get_config_from_env():
+    """Get configuration from environment variables"""
+    return {
+        "user_table_name": os.getenv("USER_TABLE_NAME", "Algo-Trader-User-Token-Table"),
+        "feed_table_name": os.getenv("FEED_TABLE_NAME", "Algo-Trader-Feed-Table"),
+        "backtest_jobs_table_name": os.getenv("BACKTEST_JOBS_TABLE_NAME", "Algo-Trader-Backtest-Jobs-Table"),
+        "counters_table_name": os.getenv("COUNTERS_TABLE_NAME", "Algo-Trader-Feed-Counters-Table"),
+        "region": os.getenv("AWS_REGION", "us-east-1"),
+        "use_localstack": os.getenv("USE_LOCALSTACK", "true").lower() == "true",
+        "localstack_endpoint": os.getenv("LOCALSTACK_ENDPOINT", "http://localhost:4566")
+    }
+
+async def backfill_shards(db: DatabaseManager, args):
+    """Put items created before the time-ordered feed index into the index"""
+    updated = await db.backfill_feed_shards()
+    print(f"✅ Assigned a feed shard to {updated} item(s)")
+
+async def reconcile_counters(db: DatabaseManager, args):
+    """Recount feed items and repair drifted total_items counters"""
+    result = await db.reconcile_feed_counters()
+    print(f"✅ Checked {result['checked']} counter(s), repaired {result['repaired']}, "
+          f"skipped {result['skipped']} that changed during the run")
+
+async def export_feed(db: DatabaseManager, args):
+    """Write every feed item to a JSON lines file using a parallel scan"""
+    exported = 0
+    with open(args.output, "w") as f:
+        async for item in db.parallel_scan(db.feed_table, total_segments=args.segments):
+            f.write(json.dumps(with_chart_data(prepare_item_from_dynamodb(item)), default=str) + "\n")
+            exported += 1
+    print(f"✅ Exported {exported} item(s) to {args.output}")
+
+async def pack_charts(db: DatabaseManager, args):
+    """Move existing chart_data maps into the compact chart_packed attribute"""
+    result = await db.convert_feed_charts(packed=True, precision=args.precision)
+    print(f"✅ Packed {result['converted']} chart(s), skipped {result['skipped']}")
+
+async def unpack_charts(db: DatabaseManager, args):
+    """Turn chart_packed attributes back into inline chart_data maps"""
+    result = await db.convert_feed_charts(packed=False)
+    print(f"✅ Unpacked {result['converted']} chart(s), skipped {result['skipped']}")
+
+COMMANDS = {
+    "backfill-shards": backfill_shards,
+    "reconcile-counters": reconcile_counters,
+    "export": export_feed,
+    "pack-charts": pack_charts,
+    "unpack-charts": unpack_charts,
+}
+
+async def main():
+    parser = argparse.ArgumentParser(description="Feed table maintenance tasks")
+    parser.add_argument("command", choices=sorted(COMMANDS), help="Task to run")
+    parser.add_argument("--output", default="feed-export.jsonl", help="Output file for export")
+    parser.add_argument("--segments", type=int, default=None, help="Parallel scan segments for export")
+    parser.add_argument("--precision", choices=["exact", "float32"], default="exact", help="Series precision for pack-charts")
+    args = parser.parse_args()
+
+    config = get_config_from_env()
+    print(f"🔧 Running '{args.command}' on {config['feed_table_name']} "
+          f"({'LocalStack' if config['use_localstack'] else 'AWS'})")
+
+    db = DatabaseManager(
+        config["user_table_name"],
+        config["feed_table_name"],
+        config["backtest_jobs_table_name"],
+        config["region"],
+        config["use_localstack"],
+        config["localstack_endpoint"],
+        counters_table_name=config["counters_table_name"]
+    )
+
+    if not db.is_connected():
+        print("❌ Failed to connect to database")
+        sys.exit(1)
+
+    try:
+        await COMMANDS[args.command](db, args)
+    except Exception as e:
+        print(f"❌ Task '{args.command}' failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -224,6 +224,7 @@ class FeedResponse(BaseModel):
     total_pages: int
     has_next_page: bool
     page_size: int
+    next_cursor: Optional[str] = None  # opaque token for the next page
 
 class PaginationParams(BaseModel):
     page: int = Field(1, ge=1)
@@ -259,6 +260,7 @@ class DynamoDBSignal(BaseModel):
     chart_data: Dict[str, Any]
     created_at: str  # ISO format
     updated_at: str  # ISO format
+    version: int = 1  # Bumped by every content update, part of the detail ETag
     likes: int = 0
     comments: int = 0
     shares: int = 0
@@ -279,6 +281,7 @@ class DynamoDBBacktest(BaseModel):
     strategy_config: Dict[str, Any]
     created_at: str  # ISO format
     updated_at: str  # ISO format
+    version: int = 1  # Bumped by every content update, part of the detail ETag
     likes: int = 0
     comments: int = 0
     shares: int = 0
@@ -293,6 +296,7 @@ class BacktestGenerationRequest(BaseModel):
     initial_capital: float
     strategy_definition: StrategyDefinition
     user_id: str
+    force_recompute: bool = False  # Run even if an identical backtest is cached
 
 class BacktestGenerationResponse(BaseModel):
     backtest_id: str
@@ -325,6 +329,7 @@ class BacktestJobRequest(BaseModel):
     strategy_definition: StrategyDefinition
     priority: BacktestJobPriority = BacktestJobPriority.NORMAL
     estimated_duration: Optional[int] = None  # in seconds
+    force_recompute: bool = False  # Run even if an identical backtest is cached
 
 class BacktestJob(BaseModel):
     job_id: str
@@ -346,6 +351,8 @@ class BacktestJob(BaseModel):
     error_message: Optional[str] = None
     progress: float = Field(0.0, ge=0.0, le=100.0)
     result_backtest_id: Optional[str] = None
+    input_fingerprint: Optional[str] = None
+    cached_result: bool = False
 
 class BacktestJobUpdate(BaseModel):
     status: Optional[BacktestJobStatus] = None
@@ -377,3 +384,5 @@ class DynamoDBBacktestJob(BaseModel):
     error_message: Optional[str] = None
     progress: float = 0.0
     result_backtest_id: Optional[str] = None
+    input_fingerprint: Optional[str] = None  # See result_cache.py
+    cached_result: bool = False  # Completed by linking to an earlier job's result
@@ -690,32 +690,24 @@ async def populate_users(db: DatabaseManager) -> List[str]:
         "sample_users": SAMPLE_USERS
     })
 
-    for i, user_data in enumerate(SAMPLE_USERS):
-        try:
-            # Create user
-            success = await db.create_user(user_data)
-            if not success:
-                raise Exception(f"Database operation returned False for user {user_data['name']}")
-
-            user_ids.append(user_data["id"])
-            print(f"✅ Created user: {user_data['name']}")
-
-            debug_print(f"Created user successfully", {
-                "user_id": user_data["id"],
-                "user_data": user_data
-            })
-
-        except Exception as e:
-            error_context = {
-                "user_index": i,
-                "user_data": user_data,
-                "user_id": user_data.get("id", "unknown")
-            }
+    # Create all users with batched writes
+    result = await db.create_users_bulk(SAMPLE_USERS)
 
+    for i, user_data in enumerate(SAMPLE_USERS):
+        error = result["failed"].get(user_data.get("id"))
+        if error:
             error_print(f"Failed to create user {user_data.get('name', 'unknown')}",
-                       error=e, context=error_context)
+                       context={"user_index": i, "user_data": user_data, "error": error})
+            failures.append(f"User {i+1} ({user_data.get('name', 'unknown')}): {error}")
+            continue
 
-            failures.append(f"User {i+1} ({user_data.get('name', 'unknown')}): {str(e)}")
+        user_ids.append(user_data["id"])
+        print(f"✅ Created user: {user_data['name']}")
+
+        debug_print(f"Created user successfully", {
+            "user_id": user_data["id"],
+            "user_data": user_data
+        })
 
     # If any users failed to create, raise an exception
     if failures:
@@ -729,6 +721,8 @@ async def populate_users(db: DatabaseManager) -> List[str]:
 async def populate_signals(db: DatabaseManager, user_ids: List[str]):
     """Populate signals"""
     failures = []
+    signal_items = []
+    signal_names = {}
 
     debug_print("Starting signal population", {
         "total_signals": len(SAMPLE_SIGNALS),
@@ -837,13 +831,10 @@ async def populate_signals(db: DatabaseManager, user_ids: List[str]):
                 "shares": random.randint(1, 50)
             }
 
-            success = await db.create_signal(signal_item)
-            if not success:
-                raise Exception(f"Database operation returned False for signal {signal_data['name']}")
-
-            print(f"✅ Created signal: {signal_data['name']}")
+            signal_items.append(signal_item)
+            signal_names[signal_id] = signal_data["name"]
 
-            debug_print(f"Created signal successfully", {
+            debug_print(f"Prepared signal", {
                 "signal_id": signal_id,
                 "user_id": user_id,
                 "signal_data": signal_item
@@ -862,6 +853,14 @@ async def populate_signals(db: DatabaseManager, user_ids: List[str]):
 
             failures.append(f"Signal {i+1} ({signal_data.get('name', 'unknown')}): {str(e)}")
 
+    # Write all generated signals with batched writes
+    result = await db.create_signals_bulk(signal_items)
+    for signal_id in result["written"]:
+        print(f"✅ Created signal: {signal_names[signal_id]}")
+    for signal_id, error in result["failed"].items():
+        error_print(f"Failed to create signal {signal_names.get(signal_id, signal_id)}", context={"signal_id": signal_id, "error": error})
+        failures.append(f"Signal {signal_id} ({signal_names.get(signal_id, 'unknown')}): {error}")
+
     # If any signals failed to create, raise an exception
     if failures:
         raise Exception(f"Failed to create {len(failures)} signals:\n" + "\n".join(failures))
@@ -870,6 +869,8 @@ async def populate_backtests(db: DatabaseManager, user_ids: List[str]):
     """Populate backtests"""
     backtest_generator = BacktestGenerator()
     failures = []
+    generated_backtests = []
+    backtest_names = {}
 
     debug_print("Starting backtest population", {
         "total_backtests": len(SAMPLE_BACKTESTS),
@@ -906,12 +907,8 @@ async def populate_backtests(db: DatabaseManager, user_ids: List[str]):
                 "generated_backtest": generated_backtest
             })
 
-            # Store in database
-            success = await db.create_backtest(generated_backtest)
-            if not success:
-                raise Exception(f"Database operation returned False for backtest {backtest_data['name']}")
-
-            print(f"✅ Created backtest: {backtest_data['name']}")
+            generated_backtests.append(generated_backtest)
+            backtest_names[generated_backtest["id"]] = backtest_data["name"]
 
         except Exception as e:
             error_msg = f"Failed to create backtest {backtest_data['name']}: {e}"
@@ -922,6 +919,15 @@ async def populate_backtests(db: DatabaseManager, user_ids: List[str]):
             })
             failures.append(error_msg)
 
+    # Store all generated backtests with batched writes
+    result = await db.create_backtests_bulk(generated_backtests)
+    for backtest_id in result["written"]:
+        print(f"✅ Created backtest: {backtest_names[backtest_id]}")
+    for backtest_id, error in result["failed"].items():
+        error_msg = f"Failed to create backtest {backtest_names.get(backtest_id, backtest_id)}: {error}"
+        print(f"❌ {error_msg}")
+        failures.append(error_msg)
+
     # If any backtests failed to create, raise an exception
     if failures:
         raise Exception(f"Failed to create {len(failures)} backtests:\n" + "\n".join(failures))
@@ -929,6 +935,7 @@ async def populate_backtests(db: DatabaseManager, user_ids: List[str]):
 async def populate_backtest_jobs(db: DatabaseManager, user_ids: List[str]):
     """Populate backtest jobs"""
     failures = []
+    job_items = []
 
     debug_print("Starting backtest jobs population", {
         "total_jobs": len(SAMPLE_BACKTEST_JOBS),
@@ -995,17 +1002,7 @@ async def populate_backtest_jobs(db: DatabaseManager, user_ids: List[str]):
                 "required_fields_check": "passed"
             })
 
-            success = await db.create_backtest_job(job_item)
-            if not success:
-                raise Exception(f"Database operation returned False - check database logs for details")
-
-            print(f"✅ Created backtest job: {job_data['strategy_name']} ({job_data['status']})")
-
-            debug_print(f"Created backtest job successfully", {
-                "job_id": job_id,
-                "user_id": user_id,
-                "status": job_data["status"]
-            })
+            job_items.append(job_item)
 
         except Exception as e:
             error_context = {
@@ -1020,6 +1017,16 @@ async def populate_backtest_jobs(db: DatabaseManager, user_ids: List[str]):
 
             failures.append(f"Job {i+1} ({job_data.get('strategy_name', 'unknown')}): {str(e)}")
 
+    # Write all prepared jobs with batched writes
+    result = await db.create_backtest_jobs_bulk(job_items)
+    jobs_by_id = {job_item["job_id"]: job_item for job_item in job_items}
+    for job_id in result["written"]:
+        job_item = jobs_by_id[job_id]
+        print(f"✅ Created backtest job: {job_item['strategy_name']} ({job_item['status']})")
+    for job_id, error in result["failed"].items():
+        error_print(f"Failed to create backtest job {job_id}", context={"job_id": job_id, "error": error})
+        failures.append(f"Job {job_id}: {error}")
+
     # If any jobs failed to create, raise an exception
     if failures:
         error_print(f"Failed to create {len(failures)} out of {len(SAMPLE_BACKTEST_JOBS)} backtest jobs",
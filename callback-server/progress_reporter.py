@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class ProgressReporter:
+    """
+    Coalesced writer of backtest job progress.
+
+    report() records a job's progress in memory, where readers in this process
+    see it immediately (latest()), and the newest fields of each job are
+    written every flush_interval seconds as one update, however many reports
+    came in between. State transitions (completed, failed) are written at once
+    by transition(), together with anything still pending for the job.
+
+    Progress is advisory: a failed progress write is not retried, the next
+    report supersedes it. Use from the event loop only.
+    """
+
+    def __init__(self, write_fn: Callable[[str, Dict[str, Any]], Awaitable[bool]], flush_interval: float = 2.0):
+        self.write_fn = write_fn
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._latest: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        # Keeps a flush from landing after (and undoing) a transition of the same job
+        self._write_lock = asyncio.Lock()
+        self._closed = False
+        self.reports = 0
+        self.transitions = 0
+        self.flushes = 0
+        self.writes = 0
+        self.failures = 0
+
+    def _ensure_started(self):
+        # Started lazily so the flush loop binds to the loop running the jobs
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def track(self, job_id: str, **fields: Any):
+        """Start serving a job's state locally without writing it (it is already stored)"""
+        self._latest[job_id] = {**fields, "updated_at": datetime.utcnow().isoformat()}
+
+    def report(self, job_id: str, **fields: Any):
+        """Record progress fields of a running job; written on the next flush"""
+        if self._closed:
+            raise RuntimeError("Progress reporter is closed")
+        self._ensure_started()
+        self._pending.setdefault(job_id, {}).update(fields)
+        self._latest.setdefault(job_id, {}).update(fields, updated_at=datetime.utcnow().isoformat())
+        self.reports += 1
+
+    async def transition(self, job_id: str, updates: Dict[str, Any]) -> bool:
+        """Write a state change now, with the job's pending progress; stops tracking the job"""
+        async with self._write_lock:
+            merged = {**self._pending.pop(job_id, {}), **updates}
+            self._latest.pop(job_id, None)
+            self.transitions += 1
+            return await self._write(job_id, merged)
+
+    def forget(self, job_id: str):
+        """Drop a stopped job's unwritten progress"""
+        self._pending.pop(job_id, None)
+        self._latest.pop(job_id, None)
+
+    def latest(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Latest reported state of a job running in this process, if any"""
+        state = self._latest.get(job_id)
+        return dict(state) if state is not None else None
+
+    async def _write(self, job_id: str, updates: Dict[str, Any]) -> bool:
+        try:
+            success = await self.write_fn(job_id, updates)
+        except Exception as e:
+            logger.error(f"Failed to write progress of backtest job {job_id}: {str(e)}")
+            success = False
+        self.writes += 1
+        if not success:
+            self.failures += 1
+        return success
+
+    async def flush(self) -> int:
+        """Write the pending progress of every job; returns the number of jobs written"""
+        async with self._write_lock:
+            batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+            results = await asyncio.gather(*[self._write(job_id, updates) for job_id, updates in batch.items()])
+            self.flushes += 1
+            return sum(results)
+
+    async def _run(self):
+        while not self._closed:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Progress flush failed: {str(e)}")
+
+    async def close(self):
+        """Stop the flush loop and write what is left"""
+        self._closed = True
+        if self._task is not None:
+            async with self._write_lock:
+                self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "flush_interval_ms": int(self.flush_interval * 1000),
+            "tracked_jobs": len(self._latest),
+            "pending_jobs": len(self._pending),
+            "reports": self.reports,
+            "transitions": self.transitions,
+            "flushes": self.flushes,
+            "writes": self.writes,
+            "failures": self.failures
+        }
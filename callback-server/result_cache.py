@@ -0,0 +1,64 @@
+"""
+Content-addressed cache of backtest results.
+
+A backtest is fully determined by its strategy definition, assets, timeframe,
+period and initial capital, and by the market data it runs on. The
+fingerprint of a job is a hash of those inputs in canonical form (key order,
+asset order and case, number formatting and null fields don't matter) plus
+BACKTEST_DATA_VERSION, so resubmitting the same strategy links the new job
+to the backtest an earlier job produced instead of running it again. Names
+and descriptions, of the job and of its strategy definition, are labels and
+not inputs: the linked backtest keeps the name it was first run under.
+
+Bump BACKTEST_DATA_VERSION whenever market data or the backtest engine
+changes; every earlier result then stops matching. Requests can opt out with
+force_recompute.
+"""
+
+import hashlib
+import json
+import os
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict
+
+BACKTEST_DATA_VERSION = os.getenv("BACKTEST_DATA_VERSION", "1")
+RESULT_CACHE_ENABLED = os.getenv("BACKTEST_RESULT_CACHE", "true").lower() == "true"
+
+# Strategy definition fields that don't affect the result
+STRATEGY_LABEL_FIELDS = ("name", "description")
+
+def _canonical(value: Any) -> Any:
+    """JSON-ready form of a value in which equivalent inputs compare equal"""
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items() if item is not None}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float, Decimal)):
+        # 14, 14.0 and Decimal("14") (as read back from DynamoDB) are the same input
+        number = Decimal(str(value)).normalize()
+        return int(number) if number == number.to_integral_value() else float(number)
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+def normalize_job_inputs(job: Dict[str, Any]) -> Dict[str, Any]:
+    """The inputs of a backtest job that determine its result, in canonical form"""
+    strategy = {key: value for key, value in job["strategy_definition"].items() if key not in STRATEGY_LABEL_FIELDS}
+    return {
+        "strategy_definition": _canonical(strategy),
+        "assets": sorted({asset.strip().upper() for asset in job["assets"]}),
+        "timeframe": _canonical(job["timeframe"]),
+        "period": " ".join(str(job["period"]).lower().split()),
+        "initial_capital": str(Decimal(str(job["initial_capital"])).quantize(Decimal("0.01")))
+    }
+
+def job_fingerprint(job: Dict[str, Any], data_version: str = BACKTEST_DATA_VERSION) -> str:
+    """Hex SHA-256 of a job's normalized inputs and the data version"""
+    payload = {"inputs": normalize_job_inputs(job), "data_version": data_version}
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
@@ -0,0 +1,138 @@
+"""
+Sharded like/comment/share counters for hot feed items.
+
+Every write to an item lands on the item's partition, so a single viral item
+is capped by per-partition write throughput however well increments are
+batched. Once an item is promoted (its feed item gets a counter_shards
+attribute), increments go to one of counter_shards rows in the counters table
+instead, picked at random:
+
+    counter_id = "engagement|<item_id>|<shard>"    likes, comments, shares
+
+The public count is the item's own attribute plus the sum of its shards.
+Writers that haven't seen the promotion yet keep adding to the item itself,
+which is still counted, so promotion needs no coordination. Items are never
+demoted; deleting an item deletes its shard rows.
+"""
+
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from cache import MISSING, TTLCache
+
+ENGAGEMENT_COUNTERS = ("likes", "comments", "shares")
+
+def counter_shard_key(item_id: str, shard: int) -> str:
+    """Counter ID of one shard of an item's engagement counters"""
+    return f"engagement|{item_id}|{shard}"
+
+def random_counter_shard(item_id: str, shard_count: int) -> str:
+    return counter_shard_key(item_id, random.randrange(shard_count))
+
+class HotItemDetector:
+    """
+    Per-process increment rate of each item, over a sliding window.
+
+    Counts are kept for the current and the previous window; the rate is the
+    previous window weighted by how much of it still overlaps plus the current
+    one. Memory is bounded by the items touched in two windows.
+    """
+
+    def __init__(self, threshold: float, window: float = 10.0):
+        self.threshold = threshold
+        self.window = window
+        self._window_start = time.monotonic()
+        self._current: Dict[str, int] = {}
+        self._previous: Dict[str, int] = {}
+        self.hot_increments = 0
+
+    def _roll(self, now: float):
+        elapsed = now - self._window_start
+        if elapsed < self.window:
+            return
+        # More than one window idle means the previous window was empty
+        self._previous = self._current if elapsed < 2 * self.window else {}
+        self._current = {}
+        self._window_start = now - (elapsed % self.window)
+
+    def rate(self, item_id: str) -> float:
+        """Increments per second over the last window"""
+        now = time.monotonic()
+        self._roll(now)
+        overlap = 1.0 - (now - self._window_start) / self.window
+        count = self._previous.get(item_id, 0) * overlap + self._current.get(item_id, 0)
+        return count / self.window
+
+    def record(self, item_id: str, count: int = 1) -> bool:
+        """Count increments; True when the item is at or above the threshold"""
+        self._roll(time.monotonic())
+        self._current[item_id] = self._current.get(item_id, 0) + count
+        hot = self.rate(item_id) >= self.threshold
+        if hot:
+            self.hot_increments += 1
+        return hot
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "threshold_per_second": self.threshold,
+            "window_seconds": self.window,
+            "tracked_items": len(self._current) + len(self._previous),
+            "hot_increments": self.hot_increments
+        }
+
+class ShardedCounterReader:
+    """
+    Folds counter shards back into feed items so callers only ever see totals.
+
+    Shard sums are cached per item for a few seconds: a hot item is read far
+    more often than its count visibly changes.
+    """
+
+    def __init__(self, fetch_shards: Callable[[List[str]], Awaitable[Dict[str, Dict[str, Any]]]],
+                 cache_size: int = 10000, ttl: float = 5.0):
+        self.fetch_shards = fetch_shards
+        self.cache = TTLCache(max_size=cache_size, ttl=ttl, negative_ttl=0)
+
+    async def shard_totals(self, shard_counts: Dict[str, int]) -> Dict[str, Dict[str, int]]:
+        """Summed shard counters per item, for items mapped to their shard count"""
+        totals = {}
+        missing = {}
+        for item_id, shard_count in shard_counts.items():
+            cached = self.cache.get(f"{item_id}:{shard_count}")
+            if cached is MISSING:
+                missing[item_id] = shard_count
+            else:
+                totals[item_id] = cached
+
+        if missing:
+            generation = self.cache.generation
+            keys = [counter_shard_key(item_id, shard) for item_id, count in missing.items() for shard in range(count)]
+            shards = await self.fetch_shards(keys)
+            for item_id, shard_count in missing.items():
+                summed = {counter: 0 for counter in ENGAGEMENT_COUNTERS}
+                for shard in range(shard_count):
+                    row = shards.get(counter_shard_key(item_id, shard)) or {}
+                    for counter in ENGAGEMENT_COUNTERS:
+                        summed[counter] += int(row.get(counter, 0))
+                totals[item_id] = summed
+                self.cache.set(f"{item_id}:{shard_count}", summed, generation)
+        return totals
+
+    async def apply(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Add shard sums to the counters of sharded items, in place, and drop counter_shards"""
+        shard_counts = {item["item_id"]: int(item["counter_shards"]) for item in items if item.get("counter_shards")}
+        totals = await self.shard_totals(shard_counts) if shard_counts else {}
+
+        for item in items:
+            if item.pop("counter_shards", None) is None:
+                continue
+            for counter, value in totals.get(item["item_id"], {}).items():
+                item[counter] = item.get(counter, 0) + value
+        return items
+
+    def invalidate(self, item_id: str, shard_count: int):
+        self.cache.invalidate(f"{item_id}:{shard_count}")
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
@@ -0,0 +1,81 @@
+"""
+Tests for the in-process TTL/LRU cache
+"""
+
+import pytest
+
+import cache
+from cache import MISSING, TTLCache
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the cache module"""
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+def test_hit_and_miss():
+    users = TTLCache(max_size=10)
+    assert users.get("u1") is MISSING
+    users.set("u1", {"name": "Ada"})
+    assert users.get("u1") == {"name": "Ada"}
+    assert users.stats()["hits"] == 1 and users.stats()["misses"] == 1
+
+def test_entries_expire(clock):
+    users = TTLCache(max_size=10, ttl=60, negative_ttl=5)
+    users.set("u1", {"name": "Ada"})
+    users.set("ghost", None)
+    clock[0] += 6
+    assert users.get("ghost") is MISSING
+    assert users.get("u1") == {"name": "Ada"}
+    clock[0] += 60
+    assert users.get("u1") is MISSING
+    assert users.stats()["expirations"] == 2
+
+def test_none_is_a_negative_entry():
+    users = TTLCache(max_size=10)
+    users.set("ghost", None)
+    assert users.get("ghost") is None
+    assert users.stats()["negative_hits"] == 1
+
+def test_negative_entries_can_be_disabled():
+    users = TTLCache(max_size=10, negative_ttl=0)
+    users.set("ghost", None)
+    assert users.get("ghost") is MISSING
+
+def test_least_recently_used_is_evicted():
+    users = TTLCache(max_size=2)
+    users.set("a", 1)
+    users.set("b", 2)
+    users.get("a")
+    users.set("c", 3)
+    assert users.get("b") is MISSING
+    assert users.get("a") == 1 and users.get("c") == 3
+    assert users.stats()["evictions"] == 1
+
+def test_stale_loads_are_not_cached():
+    users = TTLCache(max_size=10)
+    generation = users.generation
+    # A write lands while the value is being loaded
+    users.invalidate("u1")
+    users.set("u1", {"name": "old"}, generation)
+    assert users.get("u1") is MISSING
+
+    users.set("u1", {"name": "new"}, users.generation)
+    assert users.get("u1") == {"name": "new"}
+
+def test_invalidate_and_clear():
+    users = TTLCache(max_size=10)
+    users.set("a", 1)
+    users.set("b", 2)
+    users.invalidate("a")
+    assert users.get("a") is MISSING and users.get("b") == 2
+    before = users.generation
+    users.clear()
+    assert users.get("b") is MISSING
+    assert users.generation == before + 1
+
+def test_disabled_cache_stores_nothing():
+    for disabled in (TTLCache(max_size=0), TTLCache(ttl=0)):
+        disabled.set("a", 1)
+        assert disabled.get("a") is MISSING
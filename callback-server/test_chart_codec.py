@@ -0,0 +1,85 @@
+"""
+Tests for packed chart_data storage
+"""
+
+import json
+import math
+import random
+
+import pytest
+
+from chart_codec import (
+    decode_chart_blob, encode_chart_blob, pack_chart, unpack_chart, with_chart_data
+)
+
+def make_chart(points=500, labels=None):
+    random.seed(7)
+    price = 10000.0
+    series = []
+    for _ in range(points):
+        price = round(price * (1 + random.uniform(-0.02, 0.02)), 2)
+        series.append(price)
+    return {
+        "labels": labels if labels is not None else [f"2024-01-{1 + h // 24:02d}T{h % 24:02d}:00:00" for h in range(points)],
+        "datasets": [
+            {"label": "Portfolio Value", "data": series,
+             "borderColor": "rgba(75, 192, 192, 1)", "fill": True, "tension": 0.4},
+            {"label": "Drawdown", "data": [-abs(value - 10000.0) / 100 for value in series]}
+        ]
+    }
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_exact_round_trip(compress):
+    chart = make_chart()
+    packed = pack_chart(chart, compress=compress)
+    assert packed[:2] == b"CD"
+    assert unpack_chart(packed) == chart
+
+def test_daily_labels_round_trip():
+    chart = make_chart(points=28, labels=[f"2024-02-{day:02d}" for day in range(1, 29)])
+    assert unpack_chart(pack_chart(chart)) == chart
+
+def test_packed_is_smaller_than_json():
+    chart = make_chart()
+    assert len(pack_chart(chart)) < len(json.dumps(chart)) / 2
+
+def test_irregular_labels_and_awkward_floats():
+    values = [0.1, 1e-300, -0.0, 123456789.123456789, math.pi, 5e-7, 3.0]
+    chart = {"labels": ["a", "b", "c", "d", "e", "f", "g"], "datasets": [{"label": "x", "data": values}]}
+    unpacked = unpack_chart(pack_chart(chart))
+    assert unpacked["labels"] == chart["labels"]
+    assert [math.copysign(1, v) for v in unpacked["datasets"][0]["data"]] == [math.copysign(1, v) for v in values]
+    assert unpacked["datasets"][0]["data"] == values
+
+def test_float32_is_close():
+    chart = make_chart()
+    unpacked = unpack_chart(pack_chart(chart, precision="float32"))
+    for original, restored in zip(chart["datasets"][0]["data"], unpacked["datasets"][0]["data"]):
+        assert restored == pytest.approx(original, rel=1e-6)
+
+def test_unpackable_charts_stay_inline():
+    assert pack_chart({"labels": ["a"], "datasets": [{"label": "x", "data": ["n/a"]}]}) is None
+    assert pack_chart({"labels": ["a"]}) is None
+
+def test_empty_dataset():
+    chart = {"labels": [], "datasets": [{"label": "x", "data": []}]}
+    assert unpack_chart(pack_chart(chart)) == chart
+
+def test_blob_round_trip_falls_back_to_json():
+    chart = make_chart(points=50)
+    assert decode_chart_blob(encode_chart_blob(chart)) == chart
+    odd = {"labels": ["a"], "datasets": [{"label": "x", "data": [None]}]}
+    assert decode_chart_blob(encode_chart_blob(odd)) == odd
+
+def test_with_chart_data_expands_packed_items():
+    chart = make_chart(points=20)
+    item = {"item_id": "bt_1", "chart_packed": pack_chart(chart)}
+    expanded = with_chart_data(item)
+    assert "chart_packed" not in expanded
+    assert expanded["chart_data"] == chart
+    inline = {"item_id": "bt_2", "chart_data": chart}
+    assert with_chart_data(inline) is inline
+
+def test_rejects_foreign_bytes():
+    with pytest.raises(ValueError):
+        unpack_chart(b"XX\x01\x00payload")
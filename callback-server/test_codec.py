@@ -0,0 +1,69 @@
+"""
+Tests for the DynamoDB wire-format codec
+"""
+
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from codec import deserialize_item, from_wire, serialize_item, to_wire
+
+class Timeframe(str, Enum):
+    ONE_HOUR = "1h"
+
+ITEM = {
+    "item_id": "signal_1",
+    "confidence": 70,
+    "win_rate": 0.615,
+    "tiny": 1e-07,
+    "verified": True,
+    "picture": None,
+    "assets": ["BTC/USD", "ETH/USD"],
+    "performance": {"total_trades": 12, "max_drawdown": -5.25, "notes": ["a", 1]},
+    "chart_packed": b"CD\x01\x00",
+    "tags": {"fast", "crypto"}
+}
+
+def test_round_trip():
+    assert deserialize_item(serialize_item(ITEM)) == ITEM
+
+def as_decimals(value):
+    """What boto3 expects: floats as Decimal(str(value))"""
+    if isinstance(value, float):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {key: as_decimals(element) for key, element in value.items()}
+    if isinstance(value, list):
+        return [as_decimals(element) for element in value]
+    return value
+
+def test_matches_boto3():
+    # Sets are left out: their element order on the wire is arbitrary
+    item = {key: value for key, value in ITEM.items() if key != "tags"}
+    serializer = TypeSerializer()
+    expected = {key: serializer.serialize(as_decimals(value)) for key, value in item.items()}
+    assert serialize_item(item) == expected
+
+    deserializer = TypeDeserializer()
+    assert deserialize_item(expected, number=Decimal) == {key: deserializer.deserialize(value) for key, value in expected.items()}
+
+def test_numbers():
+    assert to_wire(0.1) == {"N": "0.1"}
+    assert to_wire(1e-07) == {"N": "1E-7"}
+    assert to_wire(Decimal("14.50")) == {"N": "14.50"}
+    assert from_wire({"N": "14.50"}) == 14.5
+    assert from_wire({"N": "14.50"}, number=Decimal) == Decimal("14.50")
+
+def test_str_enums():
+    assert to_wire(Timeframe.ONE_HOUR) == {"S": "1h"}
+    assert to_wire({"timeframe": Timeframe.ONE_HOUR}) == {"M": {"timeframe": {"S": "1h"}}}
+
+def test_rejects_non_finite_and_unknown_types():
+    with pytest.raises(TypeError):
+        to_wire(float("nan"))
+    with pytest.raises(TypeError):
+        to_wire(object())
+    with pytest.raises(TypeError):
+        from_wire({"X": "?"})
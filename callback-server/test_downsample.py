@@ -0,0 +1,80 @@
+"""
+Tests for LTTB chart downsampling
+"""
+
+import numpy as np
+import pytest
+
+from chart_codec import pack_chart
+from downsample import ChartDownsampler, downsample_chart, lttb_indices
+
+def make_chart(points):
+    values = [float(np.sin(i / 20) * 100 + i) for i in range(points)]
+    values[points // 3] = 1000.0  # A spike LTTB must keep
+    return {
+        "labels": [f"t{i}" for i in range(points)],
+        "datasets": [
+            {"label": "Portfolio Value", "data": values, "fill": True},
+            {"label": "Benchmark", "data": [float(i) for i in range(points)]}
+        ]
+    }
+
+def test_indices_keep_ends_and_are_increasing():
+    indices = lttb_indices(np.random.default_rng(1).normal(size=1000), 50)
+    assert len(indices) == 50
+    assert indices[0] == 0 and indices[-1] == 999
+    assert np.all(np.diff(indices) > 0)
+
+@pytest.mark.parametrize("threshold", [2, 1000, 5000])
+def test_indices_without_reduction(threshold):
+    assert lttb_indices(np.arange(1000, dtype=float), threshold).tolist() == list(range(1000))
+
+def test_downsample_keeps_peaks_and_aligns_series():
+    chart = make_chart(2000)
+    small = downsample_chart(chart, 100)
+    assert len(small["labels"]) == 100
+    assert all(len(dataset["data"]) == 100 for dataset in small["datasets"])
+    assert 1000.0 in small["datasets"][0]["data"]
+    # Every kept point is the same index in the labels and in each series
+    for label, value, benchmark in zip(small["labels"], *(dataset["data"] for dataset in small["datasets"])):
+        index = int(label[1:])
+        assert value == chart["datasets"][0]["data"][index]
+        assert benchmark == float(index)
+    assert small["datasets"][0]["fill"] is True
+
+def test_short_charts_are_returned_as_is():
+    chart = make_chart(40)
+    assert downsample_chart(chart, 100) is chart
+
+def test_downsampler_caches_per_version_and_resolution():
+    downsampler = ChartDownsampler()
+    item = {"item_id": "bt_1", "updated_at": "2024-01-01T00:00:00", "chart_packed": pack_chart(make_chart(500))}
+    first = downsampler.chart_for(item, 60)
+    assert len(first["labels"]) == 60
+    assert downsampler.chart_for(item, 60) is first
+    assert len(downsampler.chart_for(item, 30)["labels"]) == 30
+
+    updated = dict(item, updated_at="2024-01-02T00:00:00")
+    assert downsampler.chart_for(updated, 60) is not first
+    assert downsampler.chart_for(item, None) == make_chart(500)
+
+@pytest.mark.asyncio
+async def test_full_chart_is_loaded_for_offloaded_items():
+    full = make_chart(500)
+    preview = downsample_chart(full, 50)
+    item = {"item_id": "bt_1", "updated_at": "2024-01-01", "chart_ref": "sha256:abc", "chart_data": preview}
+    loads = []
+
+    async def load_chart(loaded_item):
+        loads.append(loaded_item["item_id"])
+        return full
+
+    downsampler = ChartDownsampler()
+    assert await downsampler.full_chart_for(item, None, load_chart) == full
+    assert len((await downsampler.full_chart_for(item, 80, load_chart))["labels"]) == 80
+    await downsampler.full_chart_for(item, 80, load_chart)
+    assert loads == ["bt_1", "bt_1"]
+
+    inline = {"item_id": "bt_2", "chart_data": full}
+    assert await downsampler.full_chart_for(inline, None, load_chart) is full
+    assert loads == ["bt_1", "bt_1"]
@@ -0,0 +1,77 @@
+"""
+Tests for feed continuation cursors
+"""
+
+import pytest
+from moto import mock_dynamodb
+
+from database import DatabaseManager, decode_feed_cursor, encode_feed_cursor
+
+POSITIONS = {
+    "feed#0": {"item_id": "signal_9", "feed_shard": "feed#0", "created_at": "2024-01-01T00:00:09"},
+    "feed#1": 0,
+    "feed#2": None
+}
+
+def test_round_trip():
+    cursor = encode_feed_cursor(POSITIONS)
+    assert "=" not in cursor
+    assert decode_feed_cursor(cursor) == POSITIONS
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    encode_feed_cursor({"feed#0": {"item_id": "x"}}),
+    encode_feed_cursor({"feed#0": "signal_9"}),
+    encode_feed_cursor(POSITIONS).replace("eyJ", "eyK", 1)
+])
+def test_rejects_bad_cursors(cursor):
+    with pytest.raises(ValueError):
+        decode_feed_cursor(cursor)
+
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("FEED_CACHE_BACKEND", "none")
+    with mock_dynamodb():
+        manager = DatabaseManager("test_users", "test_feed", "test_jobs", region="us-east-1",
+                                  use_localstack=False, executor_workers=0)
+        manager._ensure_tables_exist()
+        yield manager
+        manager.close()
+
+def signal(i):
+    return {
+        "id": f"signal_{i:02d}", "user_id": "u1", "name": f"Signal {i}", "description": "test",
+        "timeframe": "1h", "assets": ["BTC/USD"], "entry": "100", "target": "110", "stop_loss": "95",
+        "confidence": 70,
+        "performance": {"win_rate": 0.6, "profit_factor": 1.5, "total_trades": 10, "avg_return": 1.0,
+                        "max_drawdown": -5.0, "sharpe_ratio": 1.1},
+        "chart_data": {"labels": ["a", "b"], "datasets": [{"label": "P", "data": [1.0, 2.0]}]}
+    }
+
+@pytest.mark.asyncio
+async def test_cursor_walks_the_whole_feed_newest_first(db):
+    for i in range(23):
+        assert await db.create_signal(signal(i))
+
+    seen = []
+    cursor = None
+    while True:
+        page = await db.get_feed_items(limit=5, cursor=cursor)
+        assert len(page["items"]) <= 5
+        seen.extend(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    ids = [item["item_id"] for item in seen]
+    assert sorted(ids) == sorted(signal(i)["id"] for i in range(23))
+    created = [item["created_at"] for item in seen]
+    assert created == sorted(created, reverse=True)
+
+@pytest.mark.asyncio
+async def test_get_feed_items_rejects_bad_cursor(db):
+    with pytest.raises(ValueError):
+        await db.get_feed_items(cursor="garbage")
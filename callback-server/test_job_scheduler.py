@@ -0,0 +1,82 @@
+"""
+Tests for backtest job dispatch order
+"""
+
+from datetime import datetime, timedelta
+
+from job_scheduler import JobScheduler, parse_user_weights
+
+NOW = datetime.utcnow()
+
+def job(job_id, user_id="u1", priority="normal", age_seconds=0):
+    return {
+        "job_id": job_id,
+        "user_id": user_id,
+        "priority": priority,
+        "created_at": (NOW - timedelta(seconds=age_seconds)).isoformat()
+    }
+
+def order(scheduler, slots=100):
+    return [selected["job_id"] for selected in scheduler.select(slots)]
+
+def test_priority_then_age():
+    scheduler = JobScheduler(aging_seconds=0)
+    scheduler.replace([
+        job("low", priority="low", age_seconds=50),
+        job("normal_new", age_seconds=10),
+        job("normal_old", age_seconds=40),
+        job("urgent", priority="urgent", age_seconds=1)
+    ])
+    assert order(scheduler) == ["urgent", "normal_old", "normal_new", "low"]
+    assert scheduler.pending == {}
+
+def test_users_take_turns():
+    scheduler = JobScheduler(aging_seconds=0)
+    scheduler.replace(
+        [job(f"a{i}", user_id="a", age_seconds=100 - i) for i in range(5)]
+        + [job("b0", user_id="b", age_seconds=1), job("c0", user_id="c", age_seconds=2)]
+    )
+    # a queued first, but b and c get a slot before a's second job
+    assert order(scheduler, slots=3) == ["a0", "c0", "b0"]
+
+def test_weights_scale_the_share():
+    scheduler = JobScheduler(aging_seconds=0, user_weights={"heavy": 2})
+    scheduler.replace(
+        [job(f"h{i}", user_id="heavy", age_seconds=100 - i) for i in range(6)]
+        + [job(f"l{i}", user_id="light", age_seconds=50 - i) for i in range(6)]
+    )
+    selected = order(scheduler, slots=6)
+    assert sum(job_id.startswith("h") for job_id in selected) == 4
+
+def test_waiting_jobs_are_promoted():
+    scheduler = JobScheduler(aging_seconds=60)
+    low = job("low", priority="low", age_seconds=130)
+    assert scheduler.effective_rank(low, datetime.utcnow()) == 1
+    scheduler.replace([low, job("normal", age_seconds=5)])
+    assert order(scheduler) == ["low", "normal"]
+
+def test_select_respects_slots_and_exclude():
+    scheduler = JobScheduler(aging_seconds=0)
+    scheduler.replace([job(f"j{i}", age_seconds=10 - i) for i in range(4)])
+    assert scheduler.select(0) == []
+    selected = scheduler.select(2, exclude={"j0"})
+    assert [selected_job["job_id"] for selected_job in selected] == ["j1", "j2"]
+    assert set(scheduler.pending) == {"j0", "j3"}
+
+def test_add_skips_dispatched_jobs_and_tracks_newest():
+    scheduler = JobScheduler()
+    scheduler.add([job("running", age_seconds=5), job("queued", age_seconds=1)], exclude={"running"})
+    assert set(scheduler.pending) == {"queued"}
+    assert scheduler.newest == scheduler.pending["queued"]["created_at"]
+
+def test_record_dispatch_wait():
+    scheduler = JobScheduler(aging_seconds=60)
+    dispatched = job("j1", priority="low", age_seconds=90)
+    dispatched["started_at"] = NOW.isoformat()
+    scheduler.record_dispatch(dispatched)
+    stats = scheduler.stats()["priorities"]["low"]
+    assert stats["dispatched"] == 1 and stats["promoted"] == 1
+    assert stats["wait_p50_seconds"] == 90.0
+
+def test_parse_user_weights():
+    assert parse_user_weights("a=2, b=0.5,,bad=x") == {"a": 2.0, "b": 0.5}
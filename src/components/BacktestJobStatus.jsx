@@ -187,47 +187,105 @@ export const BacktestJobStatus = ({ jobData, onComplete, onCancel }) => {
   );
 };
 
-// Component that fetches job data by ID and polls for updates (used in SignalCreation)
+const isFinished = (status) =>
+  status === "completed" || status === "failed" || status === "cancelled";
+
+// Component that fetches job data by ID and follows its updates (used in SignalCreation).
+// Updates are pushed over Server-Sent Events; polling is only the fallback
+// for browsers without EventSource or when the stream can't be opened.
 export const BacktestJobStatusById = ({ jobId, onComplete, onCancel }) => {
   const [jobData, setJobData] = useState(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const pollIntervalRef = useRef(null);
+  const eventSourceRef = useRef(null);
+  const completedRef = useRef(false);
+  // Latest job state, to merge partial updates into
+  const jobRef = useRef(null);
 
   useEffect(() => {
     if (jobId) {
-      fetchJobData();
-      setupPolling();
+      completedRef.current = false;
+      jobRef.current = null;
+      if (typeof window !== "undefined" && window.EventSource) {
+        openStream();
+      } else {
+        fetchJobData();
+        setupPolling();
+      }
     }
 
     return () => {
-      if (pollIntervalRef.current) {
-        clearInterval(pollIntervalRef.current);
-      }
+      closeStream();
+      stopPolling();
     };
   }, [jobId]);
 
-  const fetchJobData = async () => {
-    try {
-      const data = await apiService.getBacktestJob(jobId);
-      setJobData(data);
-      setError(null);
+  const handleJobUpdate = (data) => {
+    jobRef.current = data;
+    setJobData(data);
+    setError(null);
+    setLoading(false);
+
+    if (isFinished(data.status) && !completedRef.current) {
+      completedRef.current = true;
+      closeStream();
+      stopPolling();
+
+      if (onComplete) {
+        onComplete(data);
+      }
+    }
+  };
+
+  const openStream = () => {
+    closeStream();
+    const source = new EventSource(apiService.backtestJobEventsUrl(jobId));
+    eventSourceRef.current = source;
+
+    source.addEventListener("snapshot", (event) => {
+      // Stream is (re)connected: the snapshot supersedes polling
+      stopPolling();
+      handleJobUpdate(JSON.parse(event.data));
+    });
 
-      // Check if job is complete
-      if (
-        data.status === "completed" ||
-        data.status === "failed" ||
-        data.status === "cancelled"
-      ) {
-        if (pollIntervalRef.current) {
-          clearInterval(pollIntervalRef.current);
-          pollIntervalRef.current = null;
-        }
+    source.addEventListener("update", (event) => {
+      // Updates carry only the fields that changed
+      handleJobUpdate({ ...(jobRef.current || {}), ...JSON.parse(event.data) });
+    });
 
-        if (onComplete) {
-          onComplete(data);
-        }
+    source.addEventListener("done", () => closeStream());
+
+    source.onerror = () => {
+      if (source.readyState === EventSource.CLOSED) {
+        // The stream could not be opened at all: fall back to polling
+        console.warn("[JobStatus] Job event stream unavailable, polling instead");
+        eventSourceRef.current = null;
+        fetchJobData();
+        setupPolling();
       }
+      // Otherwise EventSource reconnects by itself and gets a fresh snapshot
+    };
+  };
+
+  const closeStream = () => {
+    if (eventSourceRef.current) {
+      eventSourceRef.current.close();
+      eventSourceRef.current = null;
+    }
+  };
+
+  const stopPolling = () => {
+    if (pollIntervalRef.current) {
+      clearInterval(pollIntervalRef.current);
+      pollIntervalRef.current = null;
+    }
+  };
+
+  const fetchJobData = async () => {
+    try {
+      const data = await apiService.getBacktestJob(jobId);
+      handleJobUpdate(data);
     } catch (err) {
       console.error("Error fetching job data:", err);
       setError(err.message || "Failed to fetch job data");
@@ -237,6 +295,7 @@ export const BacktestJobStatusById = ({ jobId, onComplete, onCancel }) => {
   };
 
   const setupPolling = () => {
+    stopPolling();
     // Poll every 3 seconds for job updates
     pollIntervalRef.current = setInterval(() => {
       fetchJobData();
@@ -250,8 +309,10 @@ export const BacktestJobStatusById = ({ jobId, onComplete, onCancel }) => {
       } else {
         await apiService.cancelBacktestJob(jobId);
       }
-      // Refresh job data after cancellation
-      fetchJobData();
+      // Refresh job data after cancellation (the stream also reports it)
+      if (!eventSourceRef.current) {
+        fetchJobData();
+      }
     } catch (err) {
       console.error("Error cancelling job:", err);
       setError(err.message || "Failed to cancel job");
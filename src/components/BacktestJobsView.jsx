@@ -14,17 +14,70 @@ export const BacktestJobsView = ({ userId }) => {
   const pollIntervalRef = useRef(null);
   const lastPollTime = useRef(0);
   const requestInProgress = useRef(false);
+  const eventSourceRef = useRef(null);
+  const [streamConnected, setStreamConnected] = useState(false);
 
   useEffect(() => {
-    fetchBacktestJobs();
+    // Job changes are pushed over Server-Sent Events; polling is the fallback
+    if (typeof window !== "undefined" && window.EventSource) {
+      openJobStream();
+    } else {
+      fetchBacktestJobs();
+    }
     return () => {
-      // Cleanup polling on unmount
+      // Cleanup stream and polling on unmount
+      if (eventSourceRef.current) {
+        eventSourceRef.current.close();
+        eventSourceRef.current = null;
+      }
       if (pollIntervalRef.current) {
         clearInterval(pollIntervalRef.current);
       }
     };
   }, [userId]);
 
+  const openJobStream = () => {
+    if (eventSourceRef.current) {
+      eventSourceRef.current.close();
+    }
+    const source = new EventSource(apiService.userBacktestJobEventsUrl(userId));
+    eventSourceRef.current = source;
+
+    source.addEventListener("snapshot", (event) => {
+      // Sent on every (re)connect, so nothing missed while disconnected is lost
+      const data = JSON.parse(event.data);
+      setJobs(data.jobs || []);
+      setHasInitiallyLoaded(true);
+      setError(null);
+      setLoading(false);
+      setStreamConnected(true);
+    });
+
+    source.addEventListener("update", (event) => {
+      const update = JSON.parse(event.data);
+      setJobs((prevJobs) => {
+        if (prevJobs.some((job) => job.job_id === update.job_id)) {
+          return prevJobs.map((job) =>
+            job.job_id === update.job_id ? { ...job, ...update } : job
+          );
+        }
+        // A job created elsewhere: creation events carry the whole job
+        return update.strategy_name ? [update, ...prevJobs] : prevJobs;
+      });
+    });
+
+    source.onerror = () => {
+      setStreamConnected(false);
+      if (source.readyState === EventSource.CLOSED) {
+        // The stream could not be opened at all: fall back to polling
+        console.warn("[JobsView] Job event stream unavailable, polling instead");
+        eventSourceRef.current = null;
+        fetchBacktestJobs();
+      }
+      // Otherwise EventSource reconnects by itself; poll until it does
+    };
+  };
+
   // Auto-dismiss toast after 5 seconds
   useEffect(() => {
     if (toastError) {
@@ -43,7 +96,7 @@ export const BacktestJobsView = ({ userId }) => {
         clearInterval(pollIntervalRef.current);
       }
     };
-  }, [jobs]);
+  }, [jobs, streamConnected]);
 
   const setupSmartPolling = () => {
     // Clear existing interval
@@ -52,6 +105,11 @@ export const BacktestJobsView = ({ userId }) => {
       pollIntervalRef.current = null;
     }
 
+    // The job event stream keeps the list current; no polling needed
+    if (streamConnected) {
+      return;
+    }
+
     // Check if any jobs are still in progress (exclude cancelled jobs from active polling)
     const activeJobs = jobs.filter(
       (job) => job.status === "pending" || job.status === "running"
@@ -164,8 +222,10 @@ export const BacktestJobsView = ({ userId }) => {
       // Cancel the job on the backend
       await apiService.cancelBacktestJob(jobId);
 
-      // Refresh the jobs list to get the latest status
-      fetchBacktestJobs(false);
+      // Refresh the jobs list to get the latest status (the stream also reports it)
+      if (!streamConnected) {
+        fetchBacktestJobs(false);
+      }
 
       // Trigger re-setup of polling since job states changed
       setTimeout(setupSmartPolling, 100);
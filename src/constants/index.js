@@ -15,6 +15,8 @@ export const API_ENDPOINTS = {
     GET: (id) => `/api/backtest-jobs/${id}`,
     GET_USER: (userId) => `/api/backtest-jobs/user/${userId}`,
     CANCEL: (id) => `/api/backtest-jobs/${id}`,
+    EVENTS: (id) => `/api/backtest-jobs/${id}/events`,
+    USER_EVENTS: (userId) => `/api/backtest-jobs/user/${userId}/events`,
   },
 };
 
@@ -234,7 +234,7 @@ export const backtestJobsApi = {
 
   async getUserBacktestJobs(userId, limit = 50) {
     return api.get(API_ENDPOINTS.BACKTEST_JOBS.GET_USER(userId), {
-      params: { limit },
+      params: { limit, projection: "summary" },
     });
   },
 
@@ -397,6 +397,19 @@ class ApiService {
     return this.request(`/api/feed/${itemId}`);
   }
 
+  // Full chart data (feed items only carry a preview)
+  async getItemChart(itemId) {
+    return this.request(`/api/items/${itemId}/chart`);
+  }
+
+  async getItemTrades(itemId, offset = 0, limit = 50) {
+    const params = new URLSearchParams({
+      offset: offset.toString(),
+      limit: limit.toString(),
+    });
+    return this.request(`/api/items/${itemId}/trades?${params.toString()}`);
+  }
+
   // Signal API
   async createSignal(signalData) {
     return this.request("/api/signals", {
@@ -543,7 +556,8 @@ class ApiService {
   }
 
   async getUserBacktestJobs(userId, limit = 50) {
-    return this.request(`/api/backtest-jobs/user/${userId}?limit=${limit}`, {
+    // The job list doesn't render strategy definitions; read the smaller summary
+    return this.request(`/api/backtest-jobs/user/${userId}?limit=${limit}&projection=summary`, {
       method: "GET",
     });
   }
@@ -553,6 +567,15 @@ class ApiService {
       method: "DELETE",
     });
   }
+
+  // Server-Sent Events streams of job status (open with EventSource)
+  backtestJobEventsUrl(jobId) {
+    return `${this.baseURL}${API_ENDPOINTS.BACKTEST_JOBS.EVENTS(jobId)}`;
+  }
+
+  userBacktestJobEventsUrl(userId) {
+    return `${this.baseURL}${API_ENDPOINTS.BACKTEST_JOBS.USER_EVENTS(userId)}`;
+  }
 }
 
 // Create and export singleton instance